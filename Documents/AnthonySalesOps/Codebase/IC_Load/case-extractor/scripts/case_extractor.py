@@ -6,8 +6,10 @@ Extracts Case/Support Ticket data from SQL Server with denormalized Company/Pers
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
+from pathlib import Path
+import os
 import pandas as pd
 import sys
 sys.path.append('../sql-connection-manager/scripts')
@@ -67,9 +69,38 @@ class CaseExtractor:
         ON c.[Case_PrimaryPersonId] = v.[Pers_PersonId]
     """
 
-    def __init__(self, connection_string: str):
-        from connection_manager import ConnectionManager
-        self.conn_manager = ConnectionManager.from_connection_string(connection_string)
+    # Case dataclass field -> query column
+    COLUMN_MAP = {
+        'case_id': 'Case_CaseId',
+        'primary_company_id': 'Case_PrimaryCompanyId',
+        'primary_person_id': 'Case_PrimaryPersonId',
+        'assigned_user_id': 'Case_AssignedUserId',
+        'status': 'Case_Status',
+        'stage': 'Case_Stage',
+        'priority': 'Case_Priority',
+        'description': 'Case_Description',
+        'opened': 'Case_Opened',
+        'closed': 'Case_Closed',
+        'company_name': 'Company_Name',
+        'company_website': 'Company_WebSite',
+        'person_first_name': 'Person_FirstName',
+        'person_last_name': 'Person_LastName',
+        'person_email': 'Person_EmailAddress',
+    }
+
+    ID_COLUMNS = ['Case_CaseId', 'Case_PrimaryCompanyId', 'Case_PrimaryPersonId', 'Case_AssignedUserId']
+    DATE_COLUMNS = ['Case_Opened', 'Case_Closed']
+
+    def __init__(self, connection_string: Optional[str] = None, conn_manager=None):
+        """
+        Args:
+            connection_string: ODBC connection string for SQL Server
+            conn_manager: Existing ConnectionManager (e.g. one pooling a local test database)
+        """
+        if conn_manager is None:
+            from connection_manager import ConnectionManager
+            conn_manager = ConnectionManager.from_connection_string(connection_string)
+        self.conn_manager = conn_manager
 
     def extract(self, filter_clause: str = "") -> List[Case]:
         """Extract cases from database"""
@@ -87,6 +118,107 @@ class CaseExtractor:
 
         return cases
 
+    def iter_chunks(self, filter_clause: str = "", chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Stream the case query as DataFrames of at most chunk_size rows.
+
+        Rows are pulled with cursor.fetchmany, so only one chunk is held in
+        memory regardless of how many cases the query returns. IDs come back
+        as nullable integers and Opened/Closed as datetimes in every chunk.
+        A query without rows yields one empty chunk, so the columns are still known.
+        """
+        query = self.QUERY
+        if filter_clause:
+            query += f" {filter_clause}"
+
+        with self.conn_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                columns = [column[0] for column in cursor.description]
+                # The first chunk is yielded even when empty, so callers still see the columns
+                rows = cursor.fetchmany(chunk_size)
+                while True:
+                    yield self._normalize_chunk(pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns))
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+            finally:
+                cursor.close()
+
+    def _normalize_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Give every chunk the same column types, whatever the driver returned"""
+        for column in self.ID_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+        for column in self.DATE_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_datetime(df[column], errors='coerce')
+        return df
+
+    def iter_cases(self, filter_clause: str = "", chunk_size: int = 10000) -> Iterator[Case]:
+        """Stream Case dataclasses chunk by chunk instead of building the full list"""
+        from dataframe_converter import DataFrameConverter
+        converter = DataFrameConverter()
+        rename = {column: field for field, column in self.COLUMN_MAP.items()}
+
+        for chunk in self.iter_chunks(filter_clause, chunk_size):
+            yield from converter.dataframe_to_dataclasses(chunk.rename(columns=rename), Case)
+
+    def extract_to_bronze(self, output_path: str = "Bronze_Cases.parquet", filter_clause: str = "",
+                          chunk_size: int = 10000) -> int:
+        """
+        Stream cases straight into a Bronze Parquet or CSV file (by extension).
+
+        Each chunk is appended as it arrives (one Parquet row group per chunk),
+        so memory use does not grow with the number of cases. Columns keep the
+        query's SQL names. The file is written next to the target and renamed
+        when complete, so a failed run never leaves a partial file; with no
+        cases it still holds the columns.
+
+        Returns:
+            Number of cases written
+        """
+        output_path = Path(output_path)
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        parquet = output_path.suffix.lower() == '.parquet'
+        writer = None
+        header = True
+        total = 0
+
+        try:
+            for chunk in self.iter_chunks(filter_clause, chunk_size):
+                if parquet:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    if writer is None:
+                        schema = self._arrow_schema(chunk)
+                        writer = pq.ParquetWriter(temp_path, schema)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False, safe=False))
+                else:
+                    chunk.to_csv(temp_path, mode='w' if header else 'a', header=header, index=False)
+                    header = False
+                total += len(chunk)
+            if writer is not None:
+                writer.close()
+                writer = None
+            os.replace(temp_path, output_path)
+        finally:
+            if writer is not None:
+                writer.close()
+            if temp_path.exists():
+                temp_path.unlink()
+
+        print(f"Saved {total} cases to {output_path}")
+        return total
+
+    def _arrow_schema(self, chunk: pd.DataFrame):
+        """Fixed Parquet schema, so all-null columns in the first chunk don't pin a null type"""
+        import pyarrow as pa
+        types = {column: pa.int64() for column in self.ID_COLUMNS}
+        types.update({column: pa.timestamp('us') for column in self.DATE_COLUMNS})
+        return pa.schema([(column, types.get(column, pa.string())) for column in chunk.columns])
+
     def save_to_bronze(self, cases: List[Case], output_path: str = "Bronze_Cases.csv"):
         """Save cases to Bronze layer CSV"""
         from dataframe_converter import DataFrameConverter
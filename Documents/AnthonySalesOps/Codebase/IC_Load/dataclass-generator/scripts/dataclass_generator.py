@@ -35,6 +35,20 @@ class DataclassGenerator:
         Decimal: "from decimal import Decimal",
     }
 
+    # Record representations generate_from_columns can emit
+    REPRESENTATIONS = ('dataclass', 'slots', 'namedtuple', 'batch')
+
+    # Python to Arrow type names for columnar batches (unknown types are stored as strings;
+    # Decimal columns use their numeric precision and scale, see _arrow_type)
+    ARROW_TYPES = {
+        int: "pa.int64()",
+        float: "pa.float64()",
+        str: "pa.string()",
+        bool: "pa.bool_()",
+        datetime: "pa.timestamp('us')",
+        bytes: "pa.binary()",
+    }
+
     def __init__(self):
         self.generated_classes = {}
 
@@ -44,7 +58,8 @@ class DataclassGenerator:
         class_name: str,
         schema_discovery: Any,
         include_docstring: bool = True,
-        include_validation: bool = False
+        include_validation: bool = False,
+        representation: str = "dataclass"
     ) -> str:
         """
         Generate dataclass from SQL query string.
@@ -55,6 +70,7 @@ class DataclassGenerator:
             schema_discovery: SchemaDiscovery instance for type inference
             include_docstring: Add docstring with relationships
             include_validation: Add __post_init__ validation
+            representation: Record type to emit (see generate_from_columns)
 
         Returns:
             Python code as string
@@ -94,7 +110,8 @@ class DataclassGenerator:
             class_name=class_name,
             columns=columns_metadata,
             include_docstring=include_docstring,
-            include_validation=include_validation
+            include_validation=include_validation,
+            representation=representation
         )
 
     def generate_from_columns(
@@ -104,7 +121,8 @@ class DataclassGenerator:
         relationships: Optional[List[Any]] = None,
         include_docstring: bool = True,
         include_validation: bool = False,
-        custom_type_mappings: Optional[Dict[str, str]] = None
+        custom_type_mappings: Optional[Dict[str, str]] = None,
+        representation: str = "dataclass"
     ) -> str:
         """
         Generate dataclass from ColumnMetadata list.
@@ -116,15 +134,33 @@ class DataclassGenerator:
             include_docstring: Add docstring
             include_validation: Add __post_init__ validation
             custom_type_mappings: Override default type mappings
+            representation: Record type to emit:
+                - "dataclass": plain @dataclass (one __dict__ per record)
+                - "slots": @dataclass(slots=True), no per-record __dict__
+                - "namedtuple": typing.NamedTuple (immutable tuple records)
+                - "batch": slotted row dataclass plus a columnar <class_name>Batch
+                  backed by Arrow arrays, with <class_name>Row views
 
         Returns:
             Python code as string
         """
+        if representation not in self.REPRESENTATIONS:
+            raise DataclassGeneratorError(
+                f"Unknown representation '{representation}', expected one of {self.REPRESENTATIONS}"
+            )
+        if include_validation and representation == 'namedtuple':
+            raise DataclassGeneratorError("NamedTuple records do not support __post_init__ validation")
+
         # Build imports
-        imports = self._build_imports(columns)
+        imports = self._build_imports(columns, representation)
 
         # Build class definition
-        class_def = f"@dataclass\nclass {class_name}:\n"
+        if representation == 'namedtuple':
+            class_def = f"class {class_name}(NamedTuple):\n"
+        elif representation == 'dataclass':
+            class_def = f"@dataclass\nclass {class_name}:\n"
+        else:
+            class_def = f"@dataclass(slots=True)\nclass {class_name}:\n"
 
         # Add docstring
         if include_docstring:
@@ -140,6 +176,10 @@ class DataclassGenerator:
             validation = self._build_validation(columns)
             class_def += f"\n{validation}"
 
+        # Columnar batch and row view over the record class
+        if representation == 'batch':
+            class_def += "\n\n" + self._build_record_batch(class_name, columns)
+
         # Combine imports and class
         code = imports + "\n\n" + class_def
 
@@ -265,14 +305,22 @@ class DataclassGenerator:
         with open(file_path, 'w') as f:
             f.write(code)
 
-    def _build_imports(self, columns: List[Any]) -> str:
+    def _build_imports(self, columns: List[Any], representation: str = "dataclass") -> str:
         """Build import statements based on column types"""
-        imports = ["from dataclasses import dataclass"]
-
-        # Check if Optional is needed
-        has_nullable = any(col.is_nullable for col in columns)
-        if has_nullable:
-            imports.append("from typing import Optional")
+        imports = []
+        if representation != 'namedtuple':
+            imports.append("from dataclasses import dataclass")
+
+        # Check which typing names are needed
+        typing_names = []
+        if representation == 'batch':
+            typing_names.append("List")
+        if representation == 'namedtuple':
+            typing_names.append("NamedTuple")
+        if any(col.is_nullable for col in columns):
+            typing_names.append("Optional")
+        if typing_names:
+            imports.append(f"from typing import {', '.join(typing_names)}")
 
         # Check for special types
         types_needed = set()
@@ -284,6 +332,9 @@ class DataclassGenerator:
         for type_class in types_needed:
             imports.append(self.TYPE_IMPORTS[type_class])
 
+        if representation == 'batch':
+            imports.append("import pyarrow as pa")
+
         return '\n'.join(imports)
 
     def _build_docstring(self, class_name: str, relationships: Optional[List[Any]]) -> str:
@@ -326,6 +377,118 @@ class DataclassGenerator:
 
         return '\n'.join(fields) + '\n'
 
+    def _arrow_type(self, col: Any) -> str:
+        """
+        Arrow type expression for a column. Decimals take the column's numeric
+        precision and scale; without them the type is "None", i.e. inferred
+        from the data (a fixed scale would reject or pad the values).
+        """
+        if col.python_type is Decimal:
+            precision = getattr(col, 'numeric_precision', None)
+            scale = getattr(col, 'numeric_scale', None)
+            if precision is None or scale is None:
+                return "None"
+            return f"pa.decimal{128 if precision <= 38 else 256}({precision}, {scale})"
+        return self.ARROW_TYPES.get(col.python_type, 'pa.string()')
+
+    def _build_record_batch(self, class_name: str, columns: List[Any]) -> str:
+        """Build <class_name>Row view and <class_name>Batch columnar container"""
+        field_names = [self.sql_to_python_field_name(col.name) for col in columns]
+        field_tuple = ", ".join(f"'{name}'" for name in field_names) + ("," if len(field_names) == 1 else "")
+        types = ",\n".join(
+            f"        '{name}': {self._arrow_type(col)}"
+            for name, col in zip(field_names, columns)
+        )
+        properties = "\n".join(
+            f"    {name} = property(lambda self: self._batch.value('{name}', self._index))"
+            for name in field_names
+        )
+        row = f"{class_name}Row"
+        batch = f"{class_name}Batch"
+
+        return f'''class {row}:
+    """Read-only view of one record in a {batch} (values are read on access)"""
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: "{batch}", index: int):
+        self._batch = batch
+        self._index = index
+
+{properties}
+
+    def to_record(self) -> {class_name}:
+        return {class_name}(*(self._batch.value(name, self._index) for name in {batch}.FIELDS))
+
+    def __repr__(self) -> str:
+        return f"{row}({{self.to_record()!r}})"
+
+
+class {batch}:
+    """
+    Columnar batch of {class_name} records backed by Arrow arrays.
+
+    Stores one typed array per field instead of one object per record;
+    batch[i] returns a {row} view and column(name) a NumPy array.
+    """
+    FIELDS = ({field_tuple})
+    # Arrow type per field; None is inferred from the data (decimals of unknown precision)
+    TYPES = {{
+{types}
+    }}
+
+    def __init__(self, table: pa.Table):
+        table = table.select(list(self.FIELDS))
+        schema = pa.schema([(name, self.TYPES[name] or table.schema.field(name).type) for name in self.FIELDS])
+        self.table = table.cast(schema).combine_chunks()
+        self._columns = {{name: self.table.column(name) for name in self.FIELDS}}
+
+    @classmethod
+    def _table(cls, columns, from_pandas: bool = False) -> pa.Table:
+        return pa.table({{
+            name: pa.array(columns[name], type=cls.TYPES[name], from_pandas=from_pandas) for name in cls.FIELDS
+        }})
+
+    @classmethod
+    def from_records(cls, records: List[{class_name}]) -> "{batch}":
+        return cls(cls._table({{name: [getattr(record, name) for record in records] for name in cls.FIELDS}}))
+
+    @classmethod
+    def from_columns(cls, **columns) -> "{batch}":
+        """Build from one sequence (list, NumPy or Arrow array) per field"""
+        return cls(cls._table(columns))
+
+    @classmethod
+    def from_dataframe(cls, df) -> "{batch}":
+        """Build from a DataFrame whose columns are named like the fields"""
+        return cls(cls._table(df, from_pandas=True))
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __getitem__(self, index: int) -> {row}:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return {row}(self, index)
+
+    def __iter__(self):
+        return ({row}(self, index) for index in range(len(self)))
+
+    def value(self, name: str, index: int):
+        return self._columns[name][index].as_py()
+
+    def column(self, name: str):
+        """Field values as a NumPy array (zero-copy for numeric columns without nulls)"""
+        return self._columns[name].to_numpy(zero_copy_only=False)
+
+    def to_records(self) -> List[{class_name}]:
+        return list(map({class_name}, *(self._columns[name].to_pylist() for name in self.FIELDS)))
+
+    def to_pandas(self):
+        return self.table.to_pandas()
+'''
+
     def _build_validation(self, columns: List[Any]) -> str:
         """Build __post_init__ validation method"""
         validation = "    def __post_init__(self):\n"
@@ -356,8 +519,86 @@ class DataclassGenerator:
             return default_type
 
 
+def benchmark_representations(num_records: int = 1_000_000) -> Dict[str, Dict[str, float]]:
+    """
+    Measure memory and build time of num_records Case-like records per representation.
+
+    Python objects are measured with tracemalloc, Arrow buffers with
+    pyarrow.total_allocated_bytes(); string values are distinct per record.
+    Build times include tracemalloc overhead, so compare them only relatively.
+
+    Returns:
+        {representation: {'bytes_per_record', 'mb_per_million', 'build_seconds'}}
+    """
+    import gc
+    import time
+    import tracemalloc
+    from types import SimpleNamespace
+
+    columns = [
+        SimpleNamespace(name="Case_CaseId", python_type=int, is_nullable=False),
+        SimpleNamespace(name="Case_PrimaryCompanyId", python_type=int, is_nullable=True),
+        SimpleNamespace(name="Company_Name", python_type=str, is_nullable=True),
+        SimpleNamespace(name="Case_Status", python_type=str, is_nullable=True),
+        SimpleNamespace(name="Case_Opened", python_type=datetime, is_nullable=True),
+        SimpleNamespace(name="Case_Amount", python_type=float, is_nullable=True),
+    ]
+    opened = datetime(2024, 1, 1)
+
+    def values():
+        for i in range(num_records):
+            yield i, i % 1000, f"Company {i}", "Open" if i % 2 else "Closed", opened, i * 1.5
+
+    generator = DataclassGenerator()
+    results = {}
+    for representation in DataclassGenerator.REPRESENTATIONS:
+        namespace: Dict[str, Any] = {}
+        exec(generator.generate_from_columns("Case", columns, include_docstring=False,
+                                             representation=representation), namespace)
+        record_type = namespace["Case"]
+
+        gc.collect()
+        tracemalloc.start()
+        if representation == 'batch':
+            import pyarrow as pa
+            arrow_before = pa.total_allocated_bytes()
+            start = time.perf_counter()
+            field_values = list(zip(*values()))
+            batch = namespace["CaseBatch"].from_columns(
+                **dict(zip(namespace["CaseBatch"].FIELDS, field_values))
+            )
+            del field_values
+            build_seconds = time.perf_counter() - start
+            gc.collect()
+            used = tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes() - arrow_before
+            records = batch
+        else:
+            start = time.perf_counter()
+            records = [record_type(*row) for row in values()]
+            build_seconds = time.perf_counter() - start
+            used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        results[representation] = {
+            'bytes_per_record': used / num_records,
+            'mb_per_million': used / num_records * 1_000_000 / (1 << 20),
+            'build_seconds': build_seconds
+        }
+        del records
+    return results
+
+
 # Example usage
 if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        print(f"{'representation':<15}{'MB / 1M records':>18}{'bytes / record':>16}{'build (s)':>12}")
+        for name, result in benchmark_representations().items():
+            print(f"{name:<15}{result['mb_per_million']:>18.1f}{result['bytes_per_record']:>16.1f}"
+                  f"{result['build_seconds']:>12.2f}")
+        sys.exit(0)
+
     from scripts.schema_discovery import SchemaDiscovery
 
     # Example: Generate Case dataclass
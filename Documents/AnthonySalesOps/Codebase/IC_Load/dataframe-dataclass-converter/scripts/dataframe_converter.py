@@ -5,10 +5,13 @@ DataFrame Dataclass Converter
 Bidirectional conversion between pandas DataFrames and Python dataclasses.
 """
 
-from dataclasses import fields, is_dataclass
-from typing import List, Type, TypeVar, Any
+from dataclasses import MISSING, fields, is_dataclass
+from operator import attrgetter
+from typing import (Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union,
+                    get_args, get_origin, get_type_hints)
 import pandas as pd
 import re
+import types
 
 T = TypeVar('T')
 
@@ -25,6 +28,68 @@ class DataFrameConverter:
 
     def __init__(self, auto_map_names: bool = True):
         self.auto_map_names = auto_map_names
+        # (dataclass type, column names) -> [(field name, column or None)]
+        self._mapping_cache: Dict[Tuple[type, Tuple[str, ...]], List[Tuple[str, Optional[str]]]] = {}
+        # dataclass type -> [(field name, SQL-style column name)]
+        self._column_cache: Dict[type, List[Tuple[str, str]]] = {}
+
+    def field_mapping(self, dataclass_type: Type[T], columns) -> List[Tuple[str, Optional[str]]]:
+        """
+        Resolve which column feeds each init field, once per (dataclass, columns) pair.
+
+        Returns:
+            (field name, column name or None) for every field set by __init__
+        """
+        key = (dataclass_type, tuple(columns))
+        mapping = self._mapping_cache.get(key)
+        if mapping is None:
+            index = pd.Index(key[1])
+            mapping = [
+                (field.name, self._find_matching_column(field.name, index))
+                for field in fields(dataclass_type) if field.init
+            ]
+            self._mapping_cache[key] = mapping
+        return mapping
+
+    def iter_dataclasses(self, df: pd.DataFrame, dataclass_type: Type[T]) -> Iterator[T]:
+        """
+        Lazily convert DataFrame rows to dataclass instances.
+
+        Each mapped column is converted once to a Python-object array with
+        NaN/NaT/NA replaced by None; rows are then built by zipping the arrays.
+        Fields without a matching column keep their dataclass default (or None).
+        """
+        if not is_dataclass(dataclass_type):
+            raise ValueError(f"{dataclass_type} is not a dataclass")
+
+        mapping = self.field_mapping(dataclass_type, df.columns)
+        field_defs = {field.name: field for field in fields(dataclass_type)}
+
+        names = []
+        arrays = []
+        missing = {}
+        for field_name, col_name in mapping:
+            if col_name is not None:
+                column = df[col_name]
+                values = column.to_numpy(dtype=object, copy=True)
+                values[column.isna().to_numpy()] = None
+                names.append(field_name)
+                arrays.append(values)
+            elif field_defs[field_name].default is MISSING and field_defs[field_name].default_factory is MISSING:
+                # Required field not in DataFrame
+                missing[field_name] = None
+
+        if arrays and len(names) == len(mapping) and not any(field_defs[name].kw_only for name in names):
+            # Every init field has a column, in field order, and all are positional
+            # (no kw_only=True / KW_ONLY fields): positional calls are ~2x faster
+            yield from map(dataclass_type, *arrays)
+            return
+
+        for row in zip(*arrays) if arrays else ((),) * len(df):
+            kwargs = dict(zip(names, row))
+            if missing:
+                kwargs.update(missing)
+            yield dataclass_type(**kwargs)
 
     def dataframe_to_dataclasses(self, df: pd.DataFrame, dataclass_type: Type[T]) -> List[T]:
         """
@@ -37,35 +102,33 @@ class DataFrameConverter:
         Returns:
             List of dataclass instances
         """
-        if not is_dataclass(dataclass_type):
-            raise ValueError(f"{dataclass_type} is not a dataclass")
+        return list(self.iter_dataclasses(df, dataclass_type))
+
+    def _output_columns(self, dataclass_type: type) -> List[Tuple[str, str]]:
+        """(field name, SQL-style column name) pairs, computed once per dataclass"""
+        columns = self._column_cache.get(dataclass_type)
+        if columns is None:
+            columns = [(field.name, self._python_to_sql_name(field.name)) for field in fields(dataclass_type)]
+            self._column_cache[dataclass_type] = columns
+        return columns
+
+    def _gather_columns(self, instances: List[Any]) -> Dict[str, List[Any]]:
+        """One list per field, gathered with attrgetter across all instances"""
+        if not is_dataclass(instances[0]):
+            raise ValueError("Input must be a list of dataclass instances")
 
-        instances = []
-        for _, row in df.iterrows():
-            # Build kwargs for dataclass constructor
-            kwargs = {}
-            for field in fields(dataclass_type):
-                # Try to find matching column
-                col_name = self._find_matching_column(field.name, df.columns)
-                if col_name is not None:
-                    value = row[col_name]
-                    # Handle NaN/None
-                    if pd.isna(value):
-                        value = None
-                    kwargs[field.name] = value
-                else:
-                    # Field not in DataFrame, use default if available
-                    kwargs[field.name] = field.default if field.default is not None else None
-
-            instance = dataclass_type(**kwargs)
-            instances.append(instance)
-
-        return instances
+        return {
+            col_name: list(map(attrgetter(field_name), instances))
+            for field_name, col_name in self._output_columns(type(instances[0]))
+        }
 
     def dataclasses_to_dataframe(self, instances: List[Any]) -> pd.DataFrame:
         """
         Convert list of dataclass instances to DataFrame.
 
+        Builds the frame column by column (no per-row dicts); all instances
+        must be of the same dataclass type.
+
         Args:
             instances: List of dataclass instances
 
@@ -75,21 +138,56 @@ class DataFrameConverter:
         if not instances:
             return pd.DataFrame()
 
-        if not is_dataclass(instances[0]):
-            raise ValueError("Input must be a list of dataclass instances")
+        return pd.DataFrame(self._gather_columns(instances))
 
-        # Convert to list of dicts
-        data = []
-        for instance in instances:
-            row_dict = {}
-            for field in fields(instance):
-                value = getattr(instance, field.name)
-                # Convert field name back to SQL-style if needed
-                col_name = self._python_to_sql_name(field.name)
-                row_dict[col_name] = value
-            data.append(row_dict)
-
-        return pd.DataFrame(data)
+    def dataclasses_to_arrow(self, instances: List[Any]):
+        """
+        Convert list of dataclass instances to a pyarrow Table.
+
+        Column types come from the field annotations (Optional[int] -> int64,
+        datetime -> timestamp, ...) rather than being inferred from values, so
+        all-None columns keep their type. Other types (Decimal, lists, ...) are inferred.
+        """
+        import pyarrow as pa
+
+        if not instances:
+            return pa.table({})
+
+        dataclass_type = type(instances[0])
+        arrow_types = self._arrow_types(dataclass_type)
+        columns = self._gather_columns(instances)
+        return pa.table({
+            col_name: pa.array(values, type=arrow_types.get(field_name))
+            for (field_name, col_name), values in zip(self._output_columns(dataclass_type), columns.values())
+        })
+
+    def _arrow_types(self, dataclass_type: type) -> Dict[str, Any]:
+        """Arrow type per annotated field (Optional[...] unwrapped)"""
+        import pyarrow as pa
+        from datetime import date, datetime
+
+        type_map = {
+            int: pa.int64(),
+            float: pa.float64(),
+            str: pa.string(),
+            bool: pa.bool_(),
+            datetime: pa.timestamp('us'),
+            date: pa.date32(),
+            bytes: pa.binary(),
+        }
+        try:
+            hints = get_type_hints(dataclass_type)
+        except Exception:
+            return {}
+
+        arrow_types = {}
+        for name, hint in hints.items():
+            args = [arg for arg in get_args(hint) if arg is not type(None)]
+            if get_origin(hint) in (Union, getattr(types, 'UnionType', Union)) and len(args) == 1:
+                hint = args[0]
+            if hint in type_map:
+                arrow_types[name] = type_map[hint]
+        return arrow_types
 
     def _find_matching_column(self, field_name: str, columns: pd.Index) -> str:
         """Find matching DataFrame column for dataclass field"""
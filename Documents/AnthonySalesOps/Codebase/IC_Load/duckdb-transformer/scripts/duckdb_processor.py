@@ -7,7 +7,24 @@ High-performance data transformation using DuckDB.
 
 import duckdb
 import pandas as pd
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+# Table function per source format
+READERS = {'csv': 'read_csv', 'parquet': 'read_parquet', 'json': 'read_json'}
+EXTENSION_FORMATS = {
+    '.csv': 'csv', '.txt': 'csv', '.tsv': 'csv',
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.json': 'json', '.jsonl': 'json', '.ndjson': 'json'
+}
+LOAD_MODES = ('create', 'replace', 'append')
+
+FileSource = Union[str, Path, Sequence[Union[str, Path]]]
+
+
+def _quote(identifier: str) -> str:
+    """Quote a table or column name for DuckDB SQL"""
+    return '"' + identifier.replace('"', '""') + '"'
 
 
 class DuckDBProcessor:
@@ -17,19 +34,127 @@ class DuckDBProcessor:
     Usage:
         processor = DuckDBProcessor()
         processor.load_csv("Bronze_Cases.csv", "cases")
+        processor.load_files("Bronze/Bronze_Company/*.parquet", "companies", mode="replace")
         result = processor.execute("SELECT * FROM cases WHERE status = 'Open'")
         df = result.df()
     """
 
-    def __init__(self, database: str = ":memory:"):
+    def __init__(self, database: str = ":memory:", threads: Optional[int] = None):
+        """
+        Args:
+            database: DuckDB database file, or ":memory:"
+            threads: Worker threads for scans (DuckDB default: one per core)
+        """
         self.conn = duckdb.connect(database)
-
-    def load_csv(self, file_path: str, table_name: str):
-        """Load CSV file into DuckDB table"""
-        self.conn.execute(f"""
-            CREATE TABLE {table_name} AS
-            SELECT * FROM read_csv_auto('{file_path}')
-        """)
+        if threads:
+            self.conn.execute(f"SET threads = {int(threads)}")
+
+    def _source(self, paths: FileSource, file_format: Optional[str], columns: Optional[Dict[str, str]],
+                union_by_name: bool, filename: bool):
+        """SELECT over the files and its parameters"""
+        files = [str(paths)] if isinstance(paths, (str, Path)) else [str(path) for path in paths]
+        if not files:
+            raise ValueError("No files to load")
+
+        file_format = file_format or EXTENSION_FORMATS.get(Path(files[0]).suffix.lower())
+        if file_format not in READERS:
+            raise ValueError(f"Unsupported file format for {files[0]}: {file_format}; pass file_format")
+
+        options = [f"union_by_name = {str(union_by_name).lower()}", f"filename = {str(filename).lower()}"]
+        params: List = [files]
+        select = "*"
+        if columns and file_format == 'parquet':
+            # Parquet carries its own types: cast the listed columns
+            select = "* REPLACE (" + ", ".join(
+                f"CAST({_quote(name)} AS {sql_type}) AS {_quote(name)}" for name, sql_type in columns.items()
+            ) + ")"
+        elif columns and file_format == 'csv':
+            # Declared types are applied per file by name, so batches may still differ in columns
+            options += ["types = ?", "header = true"]
+            params.append(columns)
+        elif columns:
+            # JSON: declared schema instead of sampling the records
+            options.append("columns = ?")
+            params.append(columns)
+
+        return f"SELECT {select} FROM {READERS[file_format]}(?, {', '.join(options)})", params
+
+    def load_files(
+        self,
+        paths: FileSource,
+        table_name: str,
+        file_format: Optional[str] = None,
+        columns: Optional[Dict[str, str]] = None,
+        mode: str = "create",
+        union_by_name: bool = True,
+        filename: bool = False
+    ) -> int:
+        """
+        Load one or many CSV/Parquet/JSON files into a table in a single scan.
+
+        DuckDB reads the files in parallel; with union_by_name, files whose
+        columns differ (e.g. later Bronze batches with new columns) are aligned
+        by column name and missing columns are NULL.
+
+        Args:
+            paths: File path, glob pattern ("Bronze/*.parquet") or list of either
+            table_name: Target table
+            file_format: 'csv', 'parquet' or 'json' (default: from the first file's extension)
+            columns: Column name -> SQL type, used instead of type sniffing (e.g. the
+                     saved result of sniff_columns). CSV: types of the listed
+                     columns; JSON: the full record schema; Parquet: casts.
+            mode: 'create' (fail if the table exists), 'replace' (CREATE OR REPLACE),
+                  or 'append' (insert by column name, creating the table and adding
+                  new columns as needed)
+            union_by_name: Align columns across files by name
+            filename: Add a `filename` column with each row's source file
+
+        Returns:
+            Number of rows loaded
+        """
+        if mode not in LOAD_MODES:
+            raise ValueError(f"Unsupported load mode: {mode}")
+
+        source, params = self._source(paths, file_format, columns, union_by_name, filename)
+        table = _quote(table_name)
+
+        if mode == "append" and self._table_exists(table_name):
+            existing = {row[0] for row in self.conn.execute(f"DESCRIBE {table}").fetchall()}
+            for name, sql_type, *_ in self.conn.execute(f"DESCRIBE {source}", params).fetchall():
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(name)} {sql_type}")
+            return self.conn.execute(f"INSERT INTO {table} BY NAME {source}", params).fetchone()[0]
+
+        create = "CREATE OR REPLACE TABLE" if mode == "replace" else "CREATE TABLE"
+        self.conn.execute(f"{create} {table} AS {source}", params)
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def _table_exists(self, table_name: str) -> bool:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?", [table_name]
+        ).fetchone()[0] > 0
+
+    def sniff_columns(self, paths: FileSource, file_format: Optional[str] = None) -> Dict[str, str]:
+        """
+        Column types DuckDB detects for the files, to save once and pass as
+        `columns` on later loads instead of sniffing every run.
+        """
+        source, params = self._source(paths, file_format, None, True, False)
+        return {row[0]: row[1] for row in self.conn.execute(f"DESCRIBE {source}", params).fetchall()}
+
+    def load_csv(self, file_path: FileSource, table_name: str, columns: Optional[Dict[str, str]] = None,
+                 mode: str = "create") -> int:
+        """Load CSV file(s) into DuckDB table (see load_files)"""
+        return self.load_files(file_path, table_name, file_format="csv", columns=columns, mode=mode)
+
+    def load_parquet(self, file_path: FileSource, table_name: str, mode: str = "create") -> int:
+        """Load Parquet file(s) into DuckDB table (see load_files)"""
+        return self.load_files(file_path, table_name, file_format="parquet", mode=mode)
+
+    def load_json(self, file_path: FileSource, table_name: str, columns: Optional[Dict[str, str]] = None,
+                  mode: str = "create") -> int:
+        """Load JSON / newline-delimited JSON file(s) into DuckDB table (see load_files)"""
+        return self.load_files(file_path, table_name, file_format="json", columns=columns, mode=mode)
 
     def load_dataframe(self, df: pd.DataFrame, table_name: str):
         """Load pandas DataFrame into DuckDB table"""
@@ -48,7 +173,58 @@ class DuckDBProcessor:
         self.conn.close()
 
 
+def benchmark(files: int = 40, rows_per_file: int = 50000) -> Dict[str, float]:
+    """
+    Seconds to load a batch of Bronze CSV files one by one (read_csv_auto per
+    file) versus one parallel load_files scan, sniffed and with declared types.
+    """
+    import tempfile
+    import time
+    import numpy as np
+
+    work_dir = Path(tempfile.mkdtemp())
+    rng = np.random.default_rng(0)
+    for index in range(files):
+        pd.DataFrame({
+            'Case_CaseId': np.arange(index * rows_per_file, (index + 1) * rows_per_file),
+            'Case_Status': rng.choice(['Open', 'Closed', 'Pending'], rows_per_file),
+            'Case_Opened': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, rows_per_file), 'D'),
+            'Case_Amount': rng.random(rows_per_file).round(2) * 1000
+        }).to_csv(work_dir / f"Bronze_Cases_{index:03d}.csv", index=False)
+    pattern = str(work_dir / "Bronze_Cases_*.csv")
+
+    def per_file():
+        processor = DuckDBProcessor()
+        for index, path in enumerate(sorted(work_dir.glob("*.csv"))):
+            if index == 0:
+                processor.execute(f"CREATE TABLE cases AS SELECT * FROM read_csv_auto('{path}')")
+            else:
+                processor.execute(f"INSERT INTO cases SELECT * FROM read_csv_auto('{path}')")
+        processor.close()
+
+    columns = DuckDBProcessor().sniff_columns(pattern)
+    cases = {
+        'per_file': per_file,
+        'load_files': lambda: DuckDBProcessor().load_csv(pattern, "cases"),
+        'load_files_typed': lambda: DuckDBProcessor().load_csv(pattern, "cases", columns=columns)
+    }
+
+    results = {}
+    for name, run in cases.items():
+        start = time.perf_counter()
+        run()
+        results[name] = time.perf_counter() - start
+    return results
+
+
 if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        for name, seconds in benchmark().items():
+            print(f"{name:18} {seconds:.3f}s")
+        sys.exit(0)
+
     processor = DuckDBProcessor()
 
     # Example: Load and transform
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Partitioned Extractor
+
+Extracts large tables in parallel by splitting them into primary-key ranges (keyset pagination).
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import pandas as pd
+import sys
+sys.path.append('../sql-connection-manager/scripts')
+
+
+class PartitionedExtractor:
+    """
+    Extract one table as partitioned Bronze files, fetching key ranges concurrently.
+
+    The key column is read once in key order to place a boundary every
+    `partition_size` rows, so ranges hold equal row counts even when IDs are
+    sparse. Each range is then fetched with `key > ? AND key <= ?` on its own
+    pooled connection and written to `part-NNNNN.<format>`. A manifest in the
+    output directory records the ranges and the ones already written, so an
+    interrupted extraction resumes where it stopped.
+
+    Rows with a NULL key are not extracted.
+
+    Usage:
+        manager = ConnectionManager.from_connection_string(connection_string, pool_size=4)
+        extractor = PartitionedExtractor(manager, "Company", "Comp_CompanyId")
+        summary = extractor.extract("Bronze/Bronze_Company")
+    """
+
+    MANIFEST_NAME = "_manifest.json"
+    FORMATS = {'parquet': '.parquet', 'csv': '.csv'}
+
+    def __init__(
+        self,
+        conn_manager,
+        table: str,
+        key_column: str,
+        columns: str = "*",
+        where: Optional[str] = None,
+        partition_size: int = 50000,
+        max_workers: int = 4,
+        output_format: str = "parquet"
+    ):
+        """
+        Args:
+            conn_manager: ConnectionManager (or anything with a get_connection() context manager)
+            table: Source table or view, e.g. "[CRMICALPS].[dbo].[Company]"
+            key_column: Unique, orderable key, e.g. "Comp_CompanyId"
+            columns: Select list for the extracted rows
+            where: Optional extra condition (without WHERE), applied to planning and fetching
+            partition_size: Rows per range/output file
+            max_workers: Ranges fetched concurrently (keep at or below the pool size)
+            output_format: 'parquet' or 'csv'
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.conn_manager = conn_manager
+        self.table = table
+        self.key_column = key_column
+        self.columns = columns
+        self.where = where
+        self.partition_size = partition_size
+        self.max_workers = max_workers
+        self.output_format = output_format
+        self._manifest_lock = threading.Lock()
+
+    def _condition(self) -> str:
+        condition = f"{self.key_column} IS NOT NULL"
+        if self.where:
+            condition += f" AND ({self.where})"
+        return condition
+
+    def plan_ranges(self) -> List[Tuple[Optional[Any], Any]]:
+        """
+        Key ranges of at most partition_size rows, as (lower exclusive, upper inclusive).
+        The first range has no lower bound.
+        """
+        query = f"SELECT {self.key_column} FROM {self.table} WHERE {self._condition()} ORDER BY {self.key_column}"
+
+        ranges = []
+        lower = None
+        with self.conn_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(self.partition_size)
+                    if not rows:
+                        break
+                    upper = rows[-1][0]
+                    ranges.append((lower, upper))
+                    lower = upper
+            finally:
+                cursor.close()
+        return ranges
+
+    def _range_query(self, lower: Optional[Any]) -> str:
+        condition = f"{self._condition()} AND {self.key_column} <= ?"
+        if lower is not None:
+            condition = f"{self.key_column} > ? AND {condition}"
+        return f"SELECT {self.columns} FROM {self.table} WHERE {condition} ORDER BY {self.key_column}"
+
+    def fetch_range(self, lower: Optional[Any], upper: Any) -> pd.DataFrame:
+        """Rows with lower < key <= upper, read on a pooled connection"""
+        params = [upper] if lower is None else [lower, upper]
+        with self.conn_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self._range_query(lower), params)
+                columns = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        return pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns)
+
+    def _load_manifest(self, output_dir: Path) -> Optional[Dict[str, Any]]:
+        manifest_path = output_dir / self.MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        manifest = json.loads(manifest_path.read_text())
+        source = {'table': self.table, 'key_column': self.key_column, 'columns': self.columns,
+                  'where': self.where, 'output_format': self.output_format}
+        if manifest.get('source') != source:
+            raise ValueError(f"{manifest_path} belongs to a different extraction; use a new output directory")
+        return manifest
+
+    def _save_manifest(self, output_dir: Path, manifest: Dict[str, Any]):
+        """Write the manifest atomically (call with the manifest lock held)"""
+        manifest_path = output_dir / self.MANIFEST_NAME
+        temp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2, default=str))
+        os.replace(temp_path, manifest_path)
+
+    def _write_partition(self, df: pd.DataFrame, file_path: Path):
+        # Write next to the target and rename, so a crash never leaves a partial part file
+        temp_path = file_path.with_name(f".{file_path.name}.tmp")
+        if self.output_format == 'parquet':
+            df.to_parquet(temp_path, index=False)
+        else:
+            df.to_csv(temp_path, index=False)
+        os.replace(temp_path, file_path)
+
+    def _clear_partitions(self, output_dir: Path):
+        """Remove part files (any format) and leftover temp files from an earlier extraction"""
+        for pattern in [f"part-*{extension}" for extension in self.FORMATS.values()] + [".*.tmp"]:
+            for path in output_dir.glob(pattern):
+                path.unlink()
+
+    def extract(self, output_dir: str, resume: bool = True) -> Dict[str, Any]:
+        """
+        Extract every key range into output_dir.
+
+        Args:
+            output_dir: Directory for part files and the manifest
+            resume: Reuse the ranges of an existing manifest and skip finished ones;
+                    with False the table is re-planned and all ranges are fetched
+                    (a fresh plan first removes the part files already in output_dir)
+
+        Returns:
+            Summary with partition, row and timing counts
+        """
+        start = time.perf_counter()
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = self._load_manifest(output_dir) if resume else None
+        if manifest is None:
+            manifest = {
+                'source': {'table': self.table, 'key_column': self.key_column, 'columns': self.columns,
+                           'where': self.where, 'output_format': self.output_format},
+                'ranges': [list(bounds) for bounds in self.plan_ranges()],
+                'completed': {}
+            }
+            # Parts of an earlier plan would otherwise sit beside the new ones (e.g. when it had more ranges)
+            self._clear_partitions(output_dir)
+            with self._manifest_lock:
+                self._save_manifest(output_dir, manifest)
+
+        extension = self.FORMATS[self.output_format]
+        pending = [
+            (index, lower, upper) for index, (lower, upper) in enumerate(manifest['ranges'])
+            if str(index) not in manifest['completed']
+            or not (output_dir / f"part-{index:05d}{extension}").exists()
+        ]
+        skipped = len(manifest['ranges']) - len(pending)
+        if skipped:
+            print(f"Resuming {self.table}: {skipped} of {len(manifest['ranges'])} ranges already extracted")
+
+        def run(task):
+            index, lower, upper = task
+            df = self.fetch_range(lower, upper)
+            self._write_partition(df, output_dir / f"part-{index:05d}{extension}")
+            with self._manifest_lock:
+                manifest['completed'][str(index)] = len(df)
+                self._save_manifest(output_dir, manifest)
+            return len(df)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(run, task): task for task in pending}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    index, lower, upper = futures[future]
+                    errors.append(f"range {index} ({lower}, {upper}]: {e}")
+
+        summary = {
+            'table': self.table,
+            'partitions': len(manifest['ranges']),
+            'extracted': len(pending) - len(errors),
+            'skipped': skipped,
+            'failed': len(errors),
+            'rows': sum(manifest['completed'].values()),
+            'seconds': time.perf_counter() - start
+        }
+        print(f"Extracted {summary['rows']} {self.table} rows into {summary['partitions']} partitions "
+              f"in {summary['seconds']:.2f}s")
+        if errors:
+            raise RuntimeError(f"{len(errors)} ranges failed (rerun to resume): " + "; ".join(errors))
+        return summary
+
+
+if __name__ == "__main__":
+    # Local stand-in: a SQLite Company table extracted in parallel ranges
+    import sqlite3
+    import tempfile
+    from connection_manager import ConnectionManager
+
+    work_dir = Path(tempfile.mkdtemp())
+    db_path = work_dir / "crm.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE Company (Comp_CompanyId INTEGER PRIMARY KEY, Comp_Name TEXT)")
+        conn.executemany("INSERT INTO Company VALUES (?, ?)", [(i * 3, f"Company {i}") for i in range(100000)])
+
+    manager = ConnectionManager(
+        connection_factory=lambda: sqlite3.connect(db_path, check_same_thread=False),
+        pool_size=4
+    )
+    extractor = PartitionedExtractor(manager, "Company", "Comp_CompanyId", partition_size=20000)
+    print(extractor.extract(work_dir / "Bronze_Company"))
+    print(extractor.extract(work_dir / "Bronze_Company"))  # Everything already extracted
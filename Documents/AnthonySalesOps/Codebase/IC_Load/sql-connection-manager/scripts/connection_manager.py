@@ -5,17 +5,238 @@ SQL Server Connection Manager
 Provides robust database connection management with pooling and retry logic.
 """
 
-import pyodbc
+import threading
 import time
-from typing import Optional, Dict
+from collections import deque
+from typing import Any, Callable, Dict, Optional
 from contextlib import contextmanager
 
+try:
+    import pyodbc
+except ImportError:  # Pools over other DB-API drivers (e.g. sqlite3) work without it
+    pyodbc = None
+
 
 class ConnectionError(Exception):
     """Connection-related errors"""
     pass
 
 
+class PoolTimeoutError(ConnectionError):
+    """No connection became available within the pool timeout"""
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool over any DB-API connection factory.
+
+    Keeps up to `pool_size` idle connections and opens at most `max_overflow`
+    extra ones under load; overflow connections are closed when returned.
+    Borrowed connections are health-checked (`SELECT 1` by default), idle ones
+    are evicted after `idle_timeout` seconds, and callers wait up to `timeout`
+    seconds when every connection is checked out.
+
+    Usage:
+        pool = ConnectionPool(lambda: sqlite3.connect("db.sqlite", check_same_thread=False))
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+        print(pool.metrics())
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        idle_timeout: Optional[float] = 300.0,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        ping_query: str = "SELECT 1"
+    ):
+        self.factory = factory
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.ping_query = ping_query
+        self.health_check = health_check or self._ping
+
+        self._idle = deque()  # (connection, returned_at); most recently returned on the right
+        self._open = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'created': 0,
+            'closed': 0,
+            'evicted_idle': 0,
+            'failed_health_checks': 0,
+            'overflow_closed': 0,
+            'timeouts': 0,
+            'waits': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0
+        }
+
+    @property
+    def max_size(self) -> int:
+        return self.pool_size + self.max_overflow
+
+    def _ping(self, conn) -> bool:
+        """Default health check: run ping_query on a fresh cursor"""
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.ping_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _close(self, conn, reason: Optional[str] = None):
+        """Close a connection and give its slot back (call with the lock held)"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._open -= 1
+        self._stats['closed'] += 1
+        if reason:
+            self._stats[reason] += 1
+        self._condition.notify()
+
+    def _evict_idle(self):
+        """Close connections idle for longer than idle_timeout (call with the lock held)"""
+        if self.idle_timeout is None:
+            return
+        cutoff = time.monotonic() - self.idle_timeout
+        # Oldest returns sit on the left
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._close(conn, 'evicted_idle')
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Check out a connection: a healthy idle one if available, otherwise a new
+        one while the pool is below pool_size + max_overflow, otherwise wait.
+
+        Raises:
+            PoolTimeoutError: No connection became available within timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise ConnectionError("Connection pool is closed")
+                self._evict_idle()
+
+                if self._idle:
+                    conn, _ = self._idle.pop()
+                    create = False
+                elif self._open < self.max_size:
+                    self._open += 1
+                    conn, create = None, True
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"No connection available within {timeout}s "
+                            f"({self._open} open, max {self.max_size})"
+                        )
+                    waited = True
+                    self._condition.wait(remaining)
+                    continue
+
+            # Connecting and pinging happen outside the lock so other threads are not blocked
+            if create:
+                try:
+                    conn = self.factory()
+                except Exception:
+                    with self._condition:
+                        self._open -= 1
+                        self._condition.notify()
+                    raise
+                outcome = 'misses'
+            elif self.health_check(conn):
+                outcome = 'hits'
+            else:
+                with self._condition:
+                    self._close(conn, 'failed_health_checks')
+                continue
+
+            with self._condition:
+                self._stats[outcome] += 1
+                if create:
+                    self._stats['created'] += 1
+                if waited:
+                    wait = time.monotonic() - started
+                    self._stats['waits'] += 1
+                    self._stats['wait_seconds_total'] += wait
+                    self._stats['wait_seconds_max'] = max(self._stats['wait_seconds_max'], wait)
+            return conn
+
+    def release(self, conn, discard: bool = False):
+        """
+        Return a checked-out connection. Open transactions are rolled back;
+        overflow connections, broken ones and discarded ones are closed.
+        """
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                # Some drivers (e.g. DuckDB) refuse to roll back when no transaction is open
+                discard = not self.health_check(conn)
+
+        with self._condition:
+            if discard or self._closed:
+                self._close(conn)
+            elif len(self._idle) >= self.pool_size:
+                self._close(conn, 'overflow_closed')
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Borrow a connection for the duration of the block"""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Hit/miss counters, wait times and current pool occupancy"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+            stats['checked_out'] = self._open - len(self._idle)
+
+        borrows = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / borrows if borrows else 0.0
+        stats['wait_seconds_avg'] = stats['wait_seconds_total'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
+
+    def close(self):
+        """Close idle connections; connections still checked out are closed on return"""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._close(conn)
+            self._condition.notify_all()
+
+
 class ConnectionManager:
     """
     Manage SQL Server connections with pooling and retry logic.
@@ -25,19 +246,26 @@ class ConnectionManager:
         with manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM Table")
+
+    Any DB-API driver can be pooled by passing `connection_factory`, e.g.
+    `ConnectionManager(connection_factory=lambda: sqlite3.connect(path, check_same_thread=False))`.
     """
 
     def __init__(
         self,
-        server: str,
-        database: str,
+        server: Optional[str] = None,
+        database: Optional[str] = None,
         trusted_connection: bool = True,
         username: Optional[str] = None,
         password: Optional[str] = None,
         pool_size: int = 5,
         max_overflow: int = 10,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        pool_timeout: float = 30.0,
+        idle_timeout: Optional[float] = 300.0,
+        connection_factory: Optional[Callable[[], Any]] = None,
+        connection_string: Optional[str] = None
     ):
         self.server = server
         self.database = database
@@ -49,8 +277,20 @@ class ConnectionManager:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-        self._connection_string = self._build_connection_string()
-        self._pool = []
+        self._connection_string = connection_string or self._build_connection_string()
+        self._connection_factory = connection_factory or self._odbc_connect
+        self._pool = ConnectionPool(
+            self._connect,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            timeout=pool_timeout,
+            idle_timeout=idle_timeout
+        )
+
+    @classmethod
+    def from_connection_string(cls, connection_string: str, **kwargs) -> "ConnectionManager":
+        """Create a manager from a complete ODBC connection string"""
+        return cls(connection_string=connection_string, **kwargs)
 
     def _build_connection_string(self) -> str:
         """Build ODBC connection string"""
@@ -68,26 +308,92 @@ class ConnectionManager:
 
         return ";".join(parts)
 
-    @contextmanager
-    def get_connection(self):
-        """Get database connection with retry logic"""
-        conn = None
+    def _odbc_connect(self):
+        if pyodbc is None:
+            raise ConnectionError("pyodbc is not installed; pass connection_factory to use another driver")
+        return pyodbc.connect(self._connection_string)
+
+    def _connect(self):
+        """Open a new connection with retry logic (exponential backoff)"""
         for attempt in range(self.max_retries):
             try:
-                conn = pyodbc.connect(self._connection_string)
-                yield conn
-                break
-            except pyodbc.Error as e:
+                return self._connection_factory()
+            except Exception as e:
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay * (2 ** attempt))
                 else:
                     raise ConnectionError(f"Failed to connect after {self.max_retries} attempts: {e}")
-            finally:
-                if conn:
-                    conn.close()
+
+    @contextmanager
+    def get_connection(self, timeout: Optional[float] = None):
+        """Borrow a pooled connection; it goes back to the pool when the block exits"""
+        with self._pool.connection(timeout) as conn:
+            yield conn
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        """Pool hit/miss counters, wait times and occupancy"""
+        return self._pool.metrics()
+
+    def close(self):
+        """Close all pooled connections"""
+        self._pool.close()
+
+
+def benchmark(factory: Callable[[], Any], query: str = "SELECT 1", threads: int = 8,
+              iterations: int = 200, pool_size: int = 5, max_overflow: int = 0) -> Dict[str, Any]:
+    """
+    Compare connect-per-query with a pool over the same factory.
+
+    Returns:
+        Seconds for each mode and the pool metrics
+    """
+    def run(work):
+        workers = [threading.Thread(target=lambda: [work() for _ in range(iterations)]) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return time.perf_counter() - start
+
+    def unpooled():
+        conn = factory()
+        try:
+            conn.cursor().execute(query).fetchall()
+        finally:
+            conn.close()
+
+    manager = ConnectionManager(connection_factory=factory, pool_size=pool_size, max_overflow=max_overflow)
+
+    def pooled():
+        with manager.get_connection() as conn:
+            conn.cursor().execute(query).fetchall()
+
+    try:
+        return {
+            'unpooled_seconds': run(unpooled),
+            'pooled_seconds': run(pooled),
+            'pool': manager.pool_metrics()
+        }
+    finally:
+        manager.close()
 
 
 if __name__ == "__main__":
+    import sqlite3
+    import sys
+    import tempfile
+    from pathlib import Path
+
+    if "--benchmark" in sys.argv:
+        # Local benchmark against a SQLite file, no SQL Server needed
+        db_path = Path(tempfile.mkdtemp()) / "pool_benchmark.sqlite"
+        result = benchmark(lambda: sqlite3.connect(db_path, check_same_thread=False))
+        print(f"Unpooled: {result['unpooled_seconds']:.3f}s")
+        print(f"Pooled:   {result['pooled_seconds']:.3f}s")
+        print(f"Pool:     {result['pool']}")
+        sys.exit(0)
+
     # Example usage
     manager = ConnectionManager(
         server="your_server",
@@ -7,11 +7,19 @@ Queries information_schema system views to discover tables, columns, data types,
 constraints, and relationships.
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from decimal import Decimal
-import pyodbc
+from pathlib import Path
+import json
+import os
+import time
+
+try:
+    import pyodbc
+except ImportError:  # Only needed when connecting by connection string
+    pyodbc = None
 
 
 @dataclass
@@ -33,6 +41,8 @@ class ColumnMetadata:
     max_length: Optional[int] = None
     ordinal_position: int = 0
     default_value: Optional[str] = None
+    numeric_precision: Optional[int] = None
+    numeric_scale: Optional[int] = None
 
 
 @dataclass
@@ -108,28 +118,128 @@ class SchemaDiscovery:
         'image': bytes,
     }
 
+    # Set-based queries used by bulk inspection (one round trip each for the whole schema)
+    BULK_COLUMNS_QUERY = """
+    SELECT
+        table_name,
+        column_name,
+        data_type,
+        is_nullable,
+        character_maximum_length,
+        numeric_precision,
+        numeric_scale,
+        ordinal_position,
+        column_default
+    FROM information_schema.columns
+    WHERE table_catalog = ?
+        AND table_schema = ?
+    ORDER BY table_name, ordinal_position
+    """
+
+    BULK_RELATIONSHIPS_QUERY = """
+    SELECT
+        kcu.table_name,
+        kcu.column_name,
+        ccu.table_name AS referenced_table,
+        ccu.column_name AS referenced_column,
+        rc.constraint_name
+    FROM information_schema.referential_constraints rc
+    INNER JOIN information_schema.key_column_usage kcu
+        ON rc.constraint_name = kcu.constraint_name
+        AND rc.constraint_schema = kcu.constraint_schema
+    INNER JOIN information_schema.constraint_column_usage ccu
+        ON rc.unique_constraint_name = ccu.constraint_name
+        AND rc.unique_constraint_schema = ccu.constraint_schema
+    WHERE kcu.table_catalog = ?
+        AND kcu.table_schema = ?
+    """
+
+    BULK_PRIMARY_KEYS_QUERY = """
+    SELECT
+        kcu.table_name,
+        kcu.column_name
+    FROM information_schema.table_constraints tc
+    INNER JOIN information_schema.key_column_usage kcu
+        ON tc.constraint_name = kcu.constraint_name
+        AND tc.table_schema = kcu.table_schema
+        AND tc.table_name = kcu.table_name
+    WHERE tc.constraint_type = 'PRIMARY KEY'
+        AND tc.table_catalog = ?
+        AND tc.table_schema = ?
+    ORDER BY kcu.table_name, kcu.ordinal_position
+    """
+
+    # Checksum over every column's name, position, type, nullability, length,
+    # precision, scale and default plus every constraint, so any schema change
+    # (not only added or dropped objects) invalidates an expired disk cache
+    FINGERPRINT_QUERY = """
+    SELECT
+        COUNT(*),
+        COUNT(DISTINCT table_name),
+        CHECKSUM_AGG(CHECKSUM(table_name, column_name, ordinal_position, data_type, is_nullable,
+                              character_maximum_length, numeric_precision, numeric_scale, column_default)),
+        (SELECT CHECKSUM_AGG(CHECKSUM(table_name, constraint_name, constraint_type))
+         FROM information_schema.table_constraints
+         WHERE table_catalog = ? AND table_schema = ?)
+    FROM information_schema.columns
+    WHERE table_catalog = ?
+        AND table_schema = ?
+    """
+
+    # Fallback for stand-in databases without CHECKSUM_AGG (e.g. DuckDB); only
+    # notices tables, columns or constraints being added or dropped
+    FINGERPRINT_COUNTS_QUERY = """
+    SELECT
+        COUNT(*),
+        COUNT(DISTINCT table_name),
+        MAX(ordinal_position),
+        (SELECT COUNT(*) FROM information_schema.table_constraints
+         WHERE table_catalog = ? AND table_schema = ?)
+    FROM information_schema.columns
+    WHERE table_catalog = ?
+        AND table_schema = ?
+    """
+
     def __init__(self, connection_string: Optional[str] = None,
-                 connection_manager: Optional[Any] = None):
+                 connection_manager: Optional[Any] = None,
+                 cache_dir: Optional[str] = None,
+                 cache_ttl: float = 24 * 3600):
         """
         Initialize SchemaDiscovery.
 
         Args:
             connection_string: ODBC connection string for SQL Server
             connection_manager: Optional ConnectionManager instance (for connection pooling)
+            cache_dir: Directory for the on-disk schema cache (disabled when None)
+            cache_ttl: Seconds a cached schema is trusted without touching the database;
+                       after that it is reused only if the schema fingerprint is unchanged
         """
         self.connection_string = connection_string
         self.connection_manager = connection_manager
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
         self._schema_cache = {}
+        self._fingerprint_query = self.FINGERPRINT_QUERY
 
     def _get_connection(self):
         """Get database connection (from manager or create new)"""
         if self.connection_manager:
             return self.connection_manager.get_connection()
         elif self.connection_string:
+            if pyodbc is None:
+                raise SchemaDiscoveryError("pyodbc is not installed; pass a connection_manager instead")
             return pyodbc.connect(self.connection_string)
         else:
             raise SchemaDiscoveryError("No connection string or connection manager provided")
 
+    def _fetch_dicts(self, query: str, params: List[Any]) -> List[Dict[str, Any]]:
+        """Run a query and return rows as dicts keyed by lower-case column name"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            names = [column[0].lower() for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
     def discover_tables(self, database_name: str) -> List[TableMetadata]:
         """
         Discover all tables in the specified database.
@@ -200,6 +310,8 @@ class SchemaDiscovery:
             data_type,
             is_nullable,
             character_maximum_length,
+            numeric_precision,
+            numeric_scale,
             ordinal_position,
             column_default
         FROM information_schema.columns
@@ -221,7 +333,9 @@ class SchemaDiscovery:
                         is_nullable=(row.is_nullable == 'YES'),
                         max_length=row.character_maximum_length,
                         ordinal_position=row.ordinal_position,
-                        default_value=row.column_default
+                        default_value=row.column_default,
+                        numeric_precision=row.numeric_precision,
+                        numeric_scale=row.numeric_scale
                     )
                     for row in results
                 ]
@@ -309,12 +423,17 @@ class SchemaDiscovery:
         except Exception as e:
             raise SchemaDiscoveryError(f"Failed to discover primary keys for {table_name}: {str(e)}")
 
-    def inspect_database(self, db_name: str) -> DatabaseSchema:
+    def inspect_database(self, db_name: str, bulk: bool = True, schema: str = 'dbo',
+                         refresh: bool = False) -> DatabaseSchema:
         """
         Perform complete database inspection.
 
         Args:
             db_name: Name of the database to inspect
+            bulk: Fetch all columns, foreign keys and primary keys in three
+                  set-based queries instead of three queries per table
+            schema: Schema to inspect
+            refresh: Ignore in-process and on-disk caches
 
         Returns:
             DatabaseSchema object with complete schema information
@@ -326,52 +445,188 @@ class SchemaDiscovery:
             >>> for table_name, table_info in schema.tables.items():
             ...     print(f"  {table_name}: {len(table_info.columns)} columns")
         """
+        cache_key = f"{db_name}.{schema}"
+
         # Check cache first
-        if db_name in self._schema_cache:
-            return self._schema_cache[db_name]
+        if not refresh:
+            if cache_key in self._schema_cache:
+                return self._schema_cache[cache_key]
+            cached = self._load_cached_schema(db_name, schema)
+            if cached is not None:
+                self._schema_cache[cache_key] = cached
+                return cached
 
         try:
-            # Discover all tables
-            tables = self.discover_tables(db_name)
-
-            # Build complete schema
-            table_info_dict = {}
-
-            for table in tables:
-                table_name = table.name
-
-                # Discover columns
-                columns = self.discover_columns(table_name)
-
-                # Discover relationships
-                foreign_keys = self.discover_relationships(table_name)
-
-                # Discover primary keys
-                primary_keys = self.discover_primary_keys(table_name)
-
-                # Store table info
-                table_info_dict[table_name] = TableInfo(
-                    name=table_name,
-                    columns=columns,
-                    foreign_keys=foreign_keys,
-                    primary_keys=primary_keys
-                )
+            if bulk:
+                table_info_dict = self._inspect_tables_bulk(db_name, schema)
+            else:
+                table_info_dict = self._inspect_tables_per_table(db_name)
 
             # Create DatabaseSchema object
-            schema = DatabaseSchema(
+            database_schema = DatabaseSchema(
                 name=db_name,
                 tables=table_info_dict,
                 type_mappings=self.TYPE_MAPPINGS
             )
 
             # Cache the schema
-            self._schema_cache[db_name] = schema
+            self._schema_cache[cache_key] = database_schema
+            self._save_cached_schema(database_schema, schema)
 
-            return schema
+            return database_schema
 
         except Exception as e:
             raise SchemaDiscoveryError(f"Failed to inspect database {db_name}: {str(e)}")
 
+    def _inspect_tables_per_table(self, db_name: str) -> Dict[str, TableInfo]:
+        """Three queries per table (original inspection path)"""
+        # Discover all tables
+        tables = self.discover_tables(db_name)
+
+        # Build complete schema
+        table_info_dict = {}
+
+        for table in tables:
+            table_name = table.name
+
+            # Discover columns
+            columns = self.discover_columns(table_name)
+
+            # Discover relationships
+            foreign_keys = self.discover_relationships(table_name)
+
+            # Discover primary keys
+            primary_keys = self.discover_primary_keys(table_name)
+
+            # Store table info
+            table_info_dict[table_name] = TableInfo(
+                name=table_name,
+                columns=columns,
+                foreign_keys=foreign_keys,
+                primary_keys=primary_keys
+            )
+
+        return table_info_dict
+
+    def _inspect_tables_bulk(self, db_name: str, schema: str) -> Dict[str, TableInfo]:
+        """All tables' columns, foreign keys and primary keys in three queries"""
+        params = [db_name, schema]
+        table_info_dict = {}
+
+        for row in self._fetch_dicts(self.BULK_COLUMNS_QUERY, params):
+            table = table_info_dict.setdefault(
+                row['table_name'], TableInfo(name=row['table_name'], columns=[], foreign_keys=[], primary_keys=[])
+            )
+            table.columns.append(ColumnMetadata(
+                name=row['column_name'],
+                data_type=row['data_type'],
+                python_type=self.sql_type_to_python_type(row['data_type']),
+                is_nullable=(row['is_nullable'] == 'YES'),
+                max_length=row['character_maximum_length'],
+                ordinal_position=row['ordinal_position'],
+                default_value=row['column_default'],
+                numeric_precision=row['numeric_precision'],
+                numeric_scale=row['numeric_scale']
+            ))
+
+        for row in self._fetch_dicts(self.BULK_RELATIONSHIPS_QUERY, params):
+            if row['table_name'] in table_info_dict:
+                table_info_dict[row['table_name']].foreign_keys.append(ForeignKeyRelationship(
+                    column_name=row['column_name'],
+                    referenced_table=row['referenced_table'],
+                    referenced_column=row['referenced_column'],
+                    constraint_name=row['constraint_name'],
+                    cardinality="many:1"  # Standard FK assumption
+                ))
+
+        for row in self._fetch_dicts(self.BULK_PRIMARY_KEYS_QUERY, params):
+            if row['table_name'] in table_info_dict:
+                table_info_dict[row['table_name']].primary_keys.append(row['column_name'])
+
+        return table_info_dict
+
+    def schema_fingerprint(self, db_name: str, schema: str = 'dbo') -> str:
+        """Checksum of the schema's columns and constraints used to validate an expired disk cache"""
+        params = [db_name, schema, db_name, schema]
+        try:
+            row = self._fetch_dicts(self._fingerprint_query, params)[0]
+        except Exception:
+            if self._fingerprint_query == self.FINGERPRINT_COUNTS_QUERY:
+                raise
+            # No CHECKSUM_AGG on this server: fall back to the counts for the rest of the run
+            self._fingerprint_query = self.FINGERPRINT_COUNTS_QUERY
+            row = self._fetch_dicts(self._fingerprint_query, params)[0]
+        kind = 'checksum' if self._fingerprint_query == self.FINGERPRINT_QUERY else 'counts'
+        return "|".join([kind] + [str(value) for value in row.values()])
+
+    def _cache_path(self, db_name: str, schema: str) -> Path:
+        return self.cache_dir / f"{db_name}.{schema}.schema.json"
+
+    def _load_cached_schema(self, db_name: str, schema: str) -> Optional[DatabaseSchema]:
+        """
+        Schema from the disk cache: used as-is within cache_ttl, revalidated with
+        one fingerprint query after that
+        """
+        if self.cache_dir is None or not self._cache_path(db_name, schema).exists():
+            return None
+
+        cache_path = self._cache_path(db_name, schema)
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - cached['cached_at'] > self.cache_ttl:
+            if self.schema_fingerprint(db_name, schema) != cached['fingerprint']:
+                return None
+            # Unchanged: trust it for another TTL
+            cached['cached_at'] = time.time()
+            self._write_cache_file(cache_path, cached)
+
+        tables = {}
+        for table_name, table in cached['tables'].items():
+            tables[table_name] = TableInfo(
+                name=table_name,
+                columns=[
+                    ColumnMetadata(python_type=self.sql_type_to_python_type(column['data_type']), **column)
+                    for column in table['columns']
+                ],
+                foreign_keys=[ForeignKeyRelationship(**fk) for fk in table['foreign_keys']],
+                primary_keys=table['primary_keys']
+            )
+        return DatabaseSchema(name=cached['name'], tables=tables, type_mappings=self.TYPE_MAPPINGS)
+
+    def _save_cached_schema(self, database_schema: DatabaseSchema, schema: str):
+        """Write the schema and its fingerprint to the disk cache"""
+        if self.cache_dir is None:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cached = {
+            'name': database_schema.name,
+            'schema': schema,
+            'fingerprint': self.schema_fingerprint(database_schema.name, schema),
+            'cached_at': time.time(),
+            'tables': {
+                table_name: {
+                    'columns': [
+                        {key: value for key, value in asdict(column).items() if key != 'python_type'}
+                        for column in table.columns
+                    ],
+                    'foreign_keys': [asdict(fk) for fk in table.foreign_keys],
+                    'primary_keys': table.primary_keys
+                }
+                for table_name, table in database_schema.tables.items()
+            }
+        }
+        self._write_cache_file(self._cache_path(database_schema.name, schema), cached)
+
+    def _write_cache_file(self, cache_path: Path, cached: Dict[str, Any]):
+        # Write next to the target and rename, so a concurrent run never reads a partial file
+        temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(cached, indent=2, default=str))
+        os.replace(temp_path, cache_path)
+
     def sql_type_to_python_type(self, sql_type: str) -> type:
         """
         Map SQL Server data type to Python type.
@@ -415,13 +670,47 @@ class SchemaDiscovery:
         from .query_builder import QueryBuilder
         return QueryBuilder(self, base_table, columns, include_joins)
 
-    def clear_cache(self):
-        """Clear the schema cache"""
+    def clear_cache(self, disk: bool = False):
+        """Clear the schema cache (and the on-disk cache files when disk=True)"""
         self._schema_cache.clear()
+        if disk and self.cache_dir is not None and self.cache_dir.exists():
+            for cache_file in self.cache_dir.glob("*.schema.json"):
+                cache_file.unlink()
 
 
 # Example usage
 if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        # Local stand-in: a DuckDB file named like the CRM database, no SQL Server needed
+        import duckdb
+        import tempfile
+        sys.path.append('../sql-connection-manager/scripts')
+        from connection_manager import ConnectionManager
+
+        work_dir = Path(tempfile.mkdtemp())
+        db_path = work_dir / "CRMICALPS.duckdb"
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("CREATE SCHEMA dbo")
+            conn.execute("CREATE TABLE dbo.Company (Comp_CompanyId INTEGER PRIMARY KEY, Comp_Name VARCHAR(255))")
+            for i in range(300):
+                conn.execute(
+                    f"CREATE TABLE dbo.Table{i} (Id INTEGER PRIMARY KEY, "
+                    f"CompanyId INTEGER REFERENCES dbo.Company (Comp_CompanyId), "
+                    f"Name VARCHAR(100), Amount DECIMAL(18, 2), Created TIMESTAMP)"
+                )
+
+        manager = ConnectionManager(connection_factory=lambda: duckdb.connect(str(db_path), read_only=True))
+        cache_dir = work_dir / "schema_cache"
+        for label, ttl in [("Bulk (cold)", 3600), ("Disk cache", 3600), ("Fingerprint", 0)]:
+            discovery = SchemaDiscovery(connection_manager=manager, cache_dir=cache_dir, cache_ttl=ttl)
+            start = time.perf_counter()
+            schema = discovery.inspect_database("CRMICALPS")
+            print(f"{label:12} {time.perf_counter() - start:.3f}s ({len(schema.tables)} tables)")
+        manager.close()
+        sys.exit(0)
+
     # Example connection string
     connection_string = (
         "DRIVER={SQL Server};"
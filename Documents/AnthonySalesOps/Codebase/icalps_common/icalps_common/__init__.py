@@ -0,0 +1,5 @@
+"""
+IC'ALPS Common
+
+Business formulas shared by icalps_pipeline and the IC_Load skills.
+"""
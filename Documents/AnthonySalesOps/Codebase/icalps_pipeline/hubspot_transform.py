@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from processors.hubspot_transformation_processor import hubspot_transformation_processor
 from config.database_config import config
+from database.output_store import output_store
 
 # Setup logging
 logging.basicConfig(
@@ -41,17 +42,17 @@ def main():
     try:
         output_path = config.output_path
         
-        # Check if success files exist
+        # Check if success files exist (Parquet/Arrow preferred over CSV)
         required_files = {
-            'deals': output_path / "deals_transformed_tohubspot_success.csv",
-            'companies': output_path / "companies_enhanced_success.csv",
-            'contacts': output_path / "contacts_enhanced_success.csv"
+            'deals': "deals_transformed_tohubspot_success",
+            'companies': "companies_enhanced_success",
+            'contacts': "contacts_enhanced_success"
         }
         
         missing_files = []
-        for key, file_path in required_files.items():
-            if not file_path.exists():
-                missing_files.append(str(file_path))
+        for key, base_name in required_files.items():
+            if not output_store.exists(base_name):
+                missing_files.append(f"{output_path / base_name}.*")
         
         if missing_files:
             print(f"\n[ERROR] Missing required success files:")
@@ -67,20 +68,20 @@ def main():
         logger.info("Loading success files...")
         loaded_data = {}
         
-        for key, file_path in required_files.items():
-            df = pd.read_csv(file_path)
+        for key, base_name in required_files.items():
+            df = output_store.read(base_name)
             loaded_data[key] = df
             print(f"[LOADED] {key:10} -> {len(df):8} records")
         
         # Load optional files
         optional_files = {
-            'communications': output_path / "communications_associations_success.csv",
-            'site_aggregation': output_path / "companies_site_aggregation_success.csv"
+            'communications': "communications_associations_success",
+            'site_aggregation': "companies_site_aggregation_success"
         }
         
-        for key, file_path in optional_files.items():
-            if file_path.exists():
-                df = pd.read_csv(file_path)
+        for key, base_name in optional_files.items():
+            if output_store.exists(base_name):
+                df = output_store.read(base_name)
                 loaded_data[key] = df
                 print(f"[LOADED] {key:10} -> {len(df):8} records")
             else:
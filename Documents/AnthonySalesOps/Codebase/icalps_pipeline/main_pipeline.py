@@ -18,8 +18,14 @@ from processors.business_transformation_processor import business_transformation
 from processors.associations_processor import associations_processor
 from processors.site_aggregation_processor import site_aggregation_processor
 from processors.hubspot_transformation_processor import hubspot_transformation_processor
+from processors.output_schemas import (
+    schema_memory_benchmark, deals_schema, communications_schema,
+    social_networks_schema, site_aggregation_schema
+)
+from database.output_store import output_store
 from business_logic.business_rules import business_rules_engine
 from config.database_config import config
+from config.resource_config import resource_detector
 
 # Setup logging
 logging.basicConfig(
@@ -104,6 +110,9 @@ def test_duckdb_processing(bronze_data):
             else:
                 print("[OK] All processed views created")
 
+            if config.persist_tables and processor.catalog_processed_views():
+                print(f"[OK] Table catalog updated ({len(processor.get_catalog())} entries)")
+
             # Export processed data
             processed_data = {}
             view_names = [
@@ -113,16 +122,18 @@ def test_duckdb_processing(bronze_data):
                 ('Processed_Communications', 'communications')
             ]
 
+            # Views are independent reads, so they are materialized concurrently
+            results = processor.read_queries({
+                entity_type: f"SELECT * FROM {view_name}" for view_name, entity_type in view_names
+            })
+
             for view_name, entity_type in view_names:
-                try:
-                    df = processor.execute_query(f"SELECT * FROM {view_name}")
-                    if df is not None:
-                        processed_data[entity_type] = df
-                        print(f"[OK] {entity_type:20} {len(df):8} processed records")
-                    else:
-                        print(f"[ERROR] {entity_type:20} Failed to process")
-                except Exception as e:
-                    print(f"[ERROR] {entity_type:20} Error: {str(e)}")
+                df = results.get(entity_type)
+                if df is not None:
+                    processed_data[entity_type] = df
+                    print(f"[OK] {entity_type:20} {len(df):8} processed records")
+                else:
+                    print(f"[ERROR] {entity_type:20} Failed to process")
 
             return processed_data
 
@@ -251,10 +262,16 @@ def apply_business_transformation(processed_data):
         return None
     
     try:
-        # Apply business transformation to deals
-        transformed_deals_df = business_transformation_processor.transform_deals_to_hubspot_format(
-            opportunities_df, companies_df, contacts_df
-        )
+        # Apply business transformation to deals inside DuckDB (pandas path as fallback)
+        transformed_deals_df = pd.DataFrame()
+        if duckdb_processor.register_dataframe('Transform_Opportunities', opportunities_df):
+            transformed_deals_df = business_transformation_processor.transform_deals_sql(
+                duckdb_processor.connection, 'Transform_Opportunities'
+            )
+        if len(transformed_deals_df) == 0:
+            transformed_deals_df = business_transformation_processor.transform_deals_to_hubspot_format(
+                opportunities_df, companies_df, contacts_df
+            )
         
         if len(transformed_deals_df) == 0:
             print("[ERROR] Business transformation produced no results")
@@ -292,10 +309,24 @@ def create_communication_associations(processed_data, transformed_deals_df):
         return None
     
     try:
-        # Create communication associations using the transformed deals
-        comm_associations_df = business_transformation_processor.create_communication_associations(
-            communications_df, transformed_deals_df, companies_df, contacts_df
-        )
+        # Create communication associations using the transformed deals, joined in DuckDB
+        # (own names, so the persisted Processed_* catalog views are not shadowed)
+        comm_associations_df = pd.DataFrame()
+        sources = {
+            'Assoc_Communications': communications_df,
+            'Assoc_Deals': transformed_deals_df,
+            'Assoc_Companies': companies_df,
+            'Assoc_Persons': contacts_df
+        }
+        if all(duckdb_processor.register_dataframe(name, business_transformation_processor.with_source_order(df))
+               for name, df in sources.items()):
+            comm_associations_df = business_transformation_processor.create_communication_associations_sql(
+                duckdb_processor.connection
+            )
+        if len(comm_associations_df) == 0:
+            comm_associations_df = business_transformation_processor.create_communication_associations(
+                communications_df, transformed_deals_df, companies_df, contacts_df
+            )
         
         if len(comm_associations_df) == 0:
             print("[ERROR] Communication associations produced no results")
@@ -375,11 +406,19 @@ def apply_site_aggregation(processed_data):
         return None
     
     try:
-        # Apply site aggregation logic
-        site_aggregation_df = site_aggregation_processor.process_site_aggregation(
-            companies_df, contacts_df
-        )
-        
+        # Apply site aggregation logic in DuckDB (pandas path as fallback)
+        site_aggregation_df = pd.DataFrame()
+        # Own names, so the persisted Processed_* catalog views are not shadowed
+        if (duckdb_processor.register_dataframe('Site_Companies', companies_df)
+                and duckdb_processor.register_dataframe('Site_Persons', contacts_df)):
+            site_aggregation_df = site_aggregation_processor.process_site_aggregation_sql(
+                duckdb_processor.connection, companies_source='Site_Companies', contacts_source='Site_Persons'
+            )
+        if len(site_aggregation_df) == 0:
+            site_aggregation_df = site_aggregation_processor.process_site_aggregation(
+                companies_df, contacts_df
+            )
+
         if len(site_aggregation_df) == 0:
             print("[WARNING] Site aggregation produced no multi-site groups")
             return pd.DataFrame()
@@ -399,6 +438,34 @@ def apply_site_aggregation(processed_data):
         print(f"[ERROR] Site aggregation failed: {str(e)}")
         return None
 
+def build_enhanced_companies(processed_data, site_aggregation_df):
+    """Companies with site grouping columns from the site aggregation (if available)"""
+    companies_enhanced = processed_data['companies']
+    if site_aggregation_df is not None and len(site_aggregation_df) > 0:
+        companies_enhanced = companies_enhanced.merge(
+            site_aggregation_df[['company_id', 'parent_company_id', 'has_multiple_sites', 'site_order']],
+            left_on='Comp_CompanyId', right_on='company_id', how='left'
+        )
+    return companies_enhanced
+
+def write_exports(exports):
+    """Write independent export jobs concurrently and print per-file throughput"""
+    results = output_store.write_many(exports)
+    exports_completed = 0
+
+    for export, result in zip(exports, results):
+        if 'error' in result:
+            print(f"[ERROR] {export['label']} -> {export['base_name']} failed: {result['error']}")
+            continue
+
+        print(f"[SUCCESS] {export['label']} -> {result['path'].name}")
+        print(f"          {result['rows']:8} {export['detail']}")
+        print(f"          {result['bytes'] / 1e6:8.2f} MB in {result['seconds']:.2f}s "
+              f"({result['rows_per_sec']:,.0f} rows/s, {result['bytes_per_sec'] / 1e6:.1f} MB/s)")
+        exports_completed += 1
+
+    return exports_completed
+
 def export_enhanced_pipeline_results(processed_data, transformed_deals_df, comm_associations_df, social_associations_df, site_aggregation_df):
     """Export all enhanced pipeline results with success suffix"""
     logger.info("Exporting enhanced pipeline results...")
@@ -407,67 +474,45 @@ def export_enhanced_pipeline_results(processed_data, transformed_deals_df, comm_
     print("ENHANCED PIPELINE EXPORT (success suffix)")
     print("="*50)
     
-    output_path = config.output_path
-    output_path.mkdir(exist_ok=True)
-    
-    exports_completed = 0
-    
     try:
+        exports = []
+        
         # Export 1: Transformed deals (core business transformation)
         if transformed_deals_df is not None and len(transformed_deals_df) > 0:
-            deals_file = output_path / "deals_transformed_tohubspot_success.csv"
-            transformed_deals_df.to_csv(deals_file, index=False)
-            print(f"[SUCCESS] Transformed Deals -> deals_transformed_tohubspot_success.csv")
-            print(f"          {len(transformed_deals_df):8} deals with business rules applied")
-            exports_completed += 1
+            exports.append({'label': 'Transformed Deals ', 'base_name': "deals_transformed_tohubspot_success",
+                            'df': transformed_deals_df, 'schema': deals_schema,
+                            'detail': 'deals with business rules applied'})
         
         # Export 2: Communication associations
         if comm_associations_df is not None and len(comm_associations_df) > 0:
-            comm_file = output_path / "communications_associations_success.csv"
-            comm_associations_df.to_csv(comm_file, index=False)
-            print(f"[SUCCESS] Communication Assoc -> communications_associations_success.csv")
-            print(f"          {len(comm_associations_df):8} communications with associations")
-            exports_completed += 1
+            exports.append({'label': 'Communication Assoc', 'base_name': "communications_associations_success",
+                            'df': comm_associations_df, 'schema': communications_schema,
+                            'detail': 'communications with associations'})
         
         # Export 3: Social networks associations
         if social_associations_df is not None and len(social_associations_df) > 0:
-            social_file = output_path / "social_networks_associations_success.csv"
-            social_associations_df.to_csv(social_file, index=False)
-            print(f"[SUCCESS] Social Networks    -> social_networks_associations_success.csv")
-            print(f"          {len(social_associations_df):8} social links with associations")
-            exports_completed += 1
+            exports.append({'label': 'Social Networks   ', 'base_name': "social_networks_associations_success",
+                            'df': social_associations_df, 'schema': social_networks_schema,
+                            'detail': 'social links with associations'})
         
         # Export 4: Site aggregation
         if site_aggregation_df is not None and len(site_aggregation_df) > 0:
-            site_file = output_path / "companies_site_aggregation_success.csv"
-            site_aggregation_df.to_csv(site_file, index=False)
-            print(f"[SUCCESS] Site Aggregation   -> companies_site_aggregation_success.csv")
-            print(f"          {len(site_aggregation_df):8} aggregation records")
-            exports_completed += 1
+            exports.append({'label': 'Site Aggregation  ', 'base_name': "companies_site_aggregation_success",
+                            'df': site_aggregation_df, 'schema': site_aggregation_schema,
+                            'detail': 'aggregation records'})
         
         # Export 5: Enhanced companies (with site grouping logic applied)
         if processed_data.get('companies') is not None:
-            companies_enhanced = processed_data['companies'].copy()
-            # Add site grouping information if available
-            if site_aggregation_df is not None and len(site_aggregation_df) > 0:
-                companies_enhanced = companies_enhanced.merge(
-                    site_aggregation_df[['company_id', 'parent_company_id', 'has_multiple_sites', 'site_order']],
-                    left_on='Comp_CompanyId', right_on='company_id', how='left'
-                )
-            
-            companies_file = output_path / "companies_enhanced_success.csv"
-            companies_enhanced.to_csv(companies_file, index=False)
-            print(f"[SUCCESS] Enhanced Companies -> companies_enhanced_success.csv")
-            print(f"          {len(companies_enhanced):8} companies with site logic")
-            exports_completed += 1
+            exports.append({'label': 'Enhanced Companies', 'base_name': "companies_enhanced_success",
+                            'df': build_enhanced_companies(processed_data, site_aggregation_df),
+                            'detail': 'companies with site logic'})
         
         # Export 6: Enhanced contacts
         if processed_data.get('persons') is not None:
-            contacts_file = output_path / "contacts_enhanced_success.csv"
-            processed_data['persons'].to_csv(contacts_file, index=False)
-            print(f"[SUCCESS] Enhanced Contacts  -> contacts_enhanced_success.csv")
-            print(f"          {len(processed_data['persons']):8} contacts")
-            exports_completed += 1
+            exports.append({'label': 'Enhanced Contacts ', 'base_name': "contacts_enhanced_success",
+                            'df': processed_data['persons'], 'detail': 'contacts'})
+        
+        exports_completed = write_exports(exports)
         
         print(f"\n[SUCCESS] {exports_completed} enhanced pipeline files exported")
         return exports_completed > 0
@@ -558,6 +603,7 @@ def run_enhanced_pipeline():
         print("ENHANCED PIPELINE COMPLETED SUCCESSFULLY")
         print("="*70)
         print(f"Duration: {duration}")
+        print_resource_report()
         
         # Show results summary
         total_transformed_deals = len(transformed_deals_df)
@@ -570,14 +616,23 @@ def run_enhanced_pipeline():
         print(f"Social Network Associations: {total_social_associations:,}")
         print(f"Site Aggregation Records: {total_site_records:,}")
         
+        # Memory saved by the categorical output schemas
+        memory_report = schema_memory_benchmark({
+            'deals_transformed': transformed_deals_df,
+            'communications_associations': comm_associations_df,
+            'social_networks_associations': social_associations_df,
+            'companies_site_aggregation': site_aggregation_df
+        })
+        for name, stats in memory_report.items():
+            print(f"Memory {name}: {stats['object_bytes'] / 1e6:.2f} MB -> "
+                  f"{stats['typed_bytes'] / 1e6:.2f} MB ({stats['reduction_pct']:.0f}% less)")
+        
         print("\n[SUCCESS] Enhanced pipeline ready for HubSpot!")
         print("\nGenerated files with business rules applied:")
-        print("  -> deals_transformed_tohubspot_success.csv")
-        print("  -> communications_associations_success.csv")
-        print("  -> social_networks_associations_success.csv")
-        print("  -> companies_site_aggregation_success.csv")
-        print("  -> companies_enhanced_success.csv")
-        print("  -> contacts_enhanced_success.csv")
+        for base_name in ["deals_transformed_tohubspot_success", "communications_associations_success",
+                          "social_networks_associations_success", "companies_site_aggregation_success",
+                          "companies_enhanced_success", "contacts_enhanced_success"]:
+            print(f"  -> {output_store.path_for(base_name).name}")
         
         return True
         
@@ -598,17 +653,27 @@ def export_results_to_csv(enhanced_data):
         print("✗ No enhanced data to export")
         return
 
-    output_path = config.output_path
-    output_path.mkdir(exist_ok=True)
-
     for entity_type, df in enhanced_data.items():
         try:
-            csv_file = output_path / f"enhanced_{entity_type}.csv"
-            df.to_csv(csv_file, index=False)
-            print(f"✓ {entity_type:20} exported to {csv_file}")
+            output_file = output_store.write(df, f"enhanced_{entity_type}")
+            print(f"✓ {entity_type:20} exported to {output_file}")
         except Exception as e:
             print(f"✗ {entity_type:20} export failed: {str(e)}")
 
+    # Partitioned Parquet dataset of opportunities for partition-pruned analytics
+    opportunities_df = enhanced_data.get('opportunities')
+    if opportunities_df is not None and 'hubspot_pipeline' in opportunities_df.columns:
+        dataset_dir = config.output_path / "enhanced_opportunities_partitioned"
+        duckdb_processor.register_dataframe('Enhanced_Opportunities', opportunities_df)
+        if duckdb_processor.export_partitioned_parquet(
+            'Enhanced_Opportunities', str(dataset_dir),
+            partition_by=['hubspot_pipeline', 'close_year'],
+            derived_columns={'close_year': 'year(Oppo_TargetClose)'}
+        ):
+            print(f"✓ {'opportunities':20} partitioned dataset exported to {dataset_dir}")
+        else:
+            print(f"✗ {'opportunities':20} partitioned export failed")
+
 def run_full_pipeline_test():
     """Run complete pipeline test"""
     print("="*70)
@@ -654,6 +719,7 @@ def run_full_pipeline_test():
     print("PIPELINE TEST COMPLETED SUCCESSFULLY")
     print("="*70)
     print(f"Duration: {duration}")
+    print_resource_report()
     print(f"Enhanced datasets: {len(enhanced_data)}")
 
     total_enhanced_records = sum(len(df) for df in enhanced_data.values())
@@ -687,22 +753,24 @@ def run_hubspot_transformation_pipeline():
         print("LOADING SUCCESS FILES")
         print("="*50)
         
+        # Parquet/Arrow success files are read with their stored types; CSV is the fallback
         success_files = {
-            'deals': output_path / "deals_transformed_tohubspot_success.csv",
-            'companies': output_path / "companies_enhanced_success.csv", 
-            'contacts': output_path / "contacts_enhanced_success.csv",
-            'communications': output_path / "communications_associations_success.csv",
-            'site_aggregation': output_path / "companies_site_aggregation_success.csv"
+            'deals': "deals_transformed_tohubspot_success",
+            'companies': "companies_enhanced_success", 
+            'contacts': "contacts_enhanced_success",
+            'communications': "communications_associations_success",
+            'site_aggregation': "companies_site_aggregation_success"
         }
         
         loaded_data = {}
-        for key, file_path in success_files.items():
-            if file_path.exists():
-                df = pd.read_csv(file_path)
+        for key, base_name in success_files.items():
+            file_path = output_store.find(base_name)
+            if file_path is not None:
+                df = output_store.read(base_name)
                 loaded_data[key] = df
-                print(f"[SUCCESS] {key:15} -> {len(df):8} records loaded")
+                print(f"[SUCCESS] {key:15} -> {len(df):8} records loaded from {file_path.name}")
             else:
-                print(f"[WARNING] {key:15} -> File not found: {file_path}")
+                print(f"[WARNING] {key:15} -> File not found: {output_path / base_name}.*")
         
         if len(loaded_data) == 0:
             print("[ERROR] No success files found - run enhanced pipeline first")
@@ -801,6 +869,7 @@ def run_hubspot_transformation_pipeline():
         print("HUBSPOT TRANSFORMATION COMPLETED SUCCESSFULLY")
         print("="*70)
         print(f"Duration: {duration}")
+        print_resource_report()
         
         total_records = sum(len(df) for df in hubspot_data.values())
         print(f"Total HubSpot-ready records: {total_records:,}")
@@ -981,67 +1050,46 @@ def apply_site_aggregation_amended(processed_data):
         return None
 
 def export_amended_results_with_success_suffix(processed_data, transformed_deals_df, comm_associations_df, site_aggregation_df):
-    """Export all amended results to CSV files with 'success_amended' suffix"""
+    """Export all amended results with 'success_amended' suffix"""
     logger.info("Exporting amended results with success_amended suffix...")
 
     print("\n" + "="*50)
     print("AMENDED EXPORT RESULTS (success_amended suffix)")
     print("="*50)
 
-    output_path = config.output_path
-    output_path.mkdir(exist_ok=True)
-
-    exports_completed = 0
-
     try:
+        exports = []
+
         # Export 1: Transformed deals (amended)
         if transformed_deals_df is not None and len(transformed_deals_df) > 0:
-            deals_file = output_path / "deals_transformed_tohubspot_success_amended.csv"
-            transformed_deals_df.to_csv(deals_file, index=False)
-            print(f"[SUCCESS] Amended Transformed Deals -> deals_transformed_tohubspot_success_amended.csv")
-            print(f"          {len(transformed_deals_df):8} deals with business rules applied")
-            exports_completed += 1
+            exports.append({'label': 'Amended Transformed Deals', 'base_name': "deals_transformed_tohubspot_success_amended",
+                            'df': transformed_deals_df, 'schema': deals_schema,
+                            'detail': 'deals with business rules applied'})
         
         # Export 2: Communication associations (amended)
         if comm_associations_df is not None and len(comm_associations_df) > 0:
-            comm_file = output_path / "communications_associations_success_amended.csv"
-            comm_associations_df.to_csv(comm_file, index=False)
-            print(f"[SUCCESS] Amended Communication Assoc -> communications_associations_success_amended.csv")
-            print(f"          {len(comm_associations_df):8} communications with associations")
-            exports_completed += 1
+            exports.append({'label': 'Amended Communication Assoc', 'base_name': "communications_associations_success_amended",
+                            'df': comm_associations_df, 'schema': communications_schema,
+                            'detail': 'communications with associations'})
         
         # Export 3: Site aggregation (amended)
         if site_aggregation_df is not None and len(site_aggregation_df) > 0:
-            site_file = output_path / "companies_site_aggregation_success_amended.csv"
-            site_aggregation_df.to_csv(site_file, index=False)
-            print(f"[SUCCESS] Amended Site Aggregation   -> companies_site_aggregation_success_amended.csv")
-            print(f"          {len(site_aggregation_df):8} aggregation records")
-            exports_completed += 1
+            exports.append({'label': 'Amended Site Aggregation  ', 'base_name': "companies_site_aggregation_success_amended",
+                            'df': site_aggregation_df, 'schema': site_aggregation_schema,
+                            'detail': 'aggregation records'})
         
         # Export 4: Enhanced companies (amended with richer data)
         if processed_data.get('companies') is not None:
-            companies_enhanced = processed_data['companies'].copy()
-            
-            # Add site grouping information if available
-            if site_aggregation_df is not None and len(site_aggregation_df) > 0:
-                companies_enhanced = companies_enhanced.merge(
-                    site_aggregation_df[['company_id', 'parent_company_id', 'has_multiple_sites', 'site_order']],
-                    left_on='Comp_CompanyId', right_on='company_id', how='left'
-                )
-            
-            companies_file = output_path / "companies_enhanced_success_amended.csv"
-            companies_enhanced.to_csv(companies_file, index=False)
-            print(f"[SUCCESS] Amended Enhanced Companies -> companies_enhanced_success_amended.csv")
-            print(f"          {len(companies_enhanced):8} companies with enhanced data")
-            exports_completed += 1
+            exports.append({'label': 'Amended Enhanced Companies', 'base_name': "companies_enhanced_success_amended",
+                            'df': build_enhanced_companies(processed_data, site_aggregation_df),
+                            'detail': 'companies with enhanced data'})
         
         # Export 5: Enhanced contacts (amended with richer data)
         if processed_data.get('persons') is not None:
-            contacts_file = output_path / "contacts_enhanced_success_amended.csv"
-            processed_data['persons'].to_csv(contacts_file, index=False)
-            print(f"[SUCCESS] Amended Enhanced Contacts  -> contacts_enhanced_success_amended.csv")
-            print(f"          {len(processed_data['persons']):8} contacts with enhanced data")
-            exports_completed += 1
+            exports.append({'label': 'Amended Enhanced Contacts ', 'base_name': "contacts_enhanced_success_amended",
+                            'df': processed_data['persons'], 'detail': 'contacts with enhanced data'})
+        
+        exports_completed = write_exports(exports)
         
         print(f"\n[SUCCESS] {exports_completed} amended pipeline files exported")
         return exports_completed > 0
@@ -1133,6 +1181,7 @@ def run_enhanced_pipeline_amended():
         print("AMENDED PIPELINE COMPLETED SUCCESSFULLY")
         print("="*70)
         print(f"Duration: {duration}")
+        print_resource_report()
         
         # Show results summary
         total_transformed_deals = len(transformed_deals_df)
@@ -1145,11 +1194,10 @@ def run_enhanced_pipeline_amended():
         
         print("\n[SUCCESS] Amended pipeline ready for HubSpot!")
         print("\nGenerated files with enhanced data structures:")
-        print("  -> deals_transformed_tohubspot_success_amended.csv")
-        print("  -> communications_associations_success_amended.csv")
-        print("  -> companies_site_aggregation_success_amended.csv")
-        print("  -> companies_enhanced_success_amended.csv")
-        print("  -> contacts_enhanced_success_amended.csv")
+        for base_name in ["deals_transformed_tohubspot_success_amended", "communications_associations_success_amended",
+                          "companies_site_aggregation_success_amended", "companies_enhanced_success_amended",
+                          "contacts_enhanced_success_amended"]:
+            print(f"  -> {output_store.path_for(base_name).name}")
         
         return True
         
@@ -1158,14 +1206,62 @@ def run_enhanced_pipeline_amended():
         print(f"\n[ERROR] Amended pipeline crashed: {str(e)}")
         return False
 
+def print_resource_report():
+    """Print (and log) the DuckDB resource settings chosen for this host"""
+    report = resource_detector.report(config.temp_path, config.duckdb_overrides)
+    detected = report['detected']
+    memory_gb = (detected['usable_memory_bytes'] or 0) / 2**30
+    print(f"Host resources: {detected['usable_cores']} cores, {memory_gb:.1f} GB memory"
+          f"{' (cgroup limited)' if detected['cgroup_memory_bytes'] or detected['cgroup_cpu_limit'] else ''}")
+    for name, setting in report['duckdb'].items():
+        print(f"  DuckDB {name:24} {setting['value']} ({setting['source']})")
+    logger.info(f"DuckDB resources: {report}")
+
+def print_query_profile_summary(top_n=10):
+    """Print the slowest DuckDB queries and operators profiled during this run"""
+    summary = duckdb_processor.profile_summary(top_n)
+    if summary['queries_profiled'] == 0:
+        return
+    
+    print("\n" + "="*50)
+    print("DUCKDB QUERY PROFILE")
+    print("="*50)
+    print(f"Profiled queries: {summary['queries_profiled']} "
+          f"({summary['total_query_seconds']:.2f}s) -> {summary['profile_dir']}")
+    print("Slowest queries:")
+    for query in summary['slowest_queries']:
+        print(f"  {query['elapsed_seconds']:8.3f}s  {query['query']}")
+    print("Slowest operators:")
+    for operator in summary['slowest_operators']:
+        print(f"  {operator['operator_timing']:8.3f}s  {operator['operator_type']:20} "
+              f"{operator['operator_cardinality']:>10,} rows  {operator['query']}")
+
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description='IC\'ALPS Pipeline Runner')
     parser.add_argument('--mode', choices=['test', 'enhanced', 'legacy', 'hubspot', 'amended'], default='enhanced',
                         help='Pipeline mode: test (validation only), enhanced (business transformation), legacy (original), hubspot (final transformation), amended (enhanced pipeline for legacy_amended files)')
+    parser.add_argument('--output-format', choices=['csv', 'parquet', 'arrow'], default=None,
+                        help='Format of success/enhanced output files (default: ICALPS_OUTPUT_FORMAT or csv)')
+    parser.add_argument('--profile-queries', action='store_true',
+                        help='Save DuckDB JSON profiles of each query under temp/profiles (or set ICALPS_PROFILE_QUERIES=1)')
+    parser.add_argument('--duckdb-threads', type=int, default=None,
+                        help='DuckDB worker threads (default: ICALPS_DUCKDB_THREADS or usable cores)')
+    parser.add_argument('--duckdb-memory-limit', default=None,
+                        help='DuckDB memory limit, e.g. 8GB (default: ICALPS_DUCKDB_MEMORY_LIMIT or 60%% of usable memory)')
+    parser.add_argument('--duckdb-temp-dir', default=None,
+                        help='DuckDB spill directory (default: ICALPS_DUCKDB_TEMP_DIR or temp/)')
     
     args = parser.parse_args()
+    if args.output_format:
+        config.output_format = args.output_format
+    if args.profile_queries:
+        config.profile_queries = True
+    for key, value in [('threads', args.duckdb_threads), ('memory_limit', args.duckdb_memory_limit),
+                       ('temp_directory', args.duckdb_temp_dir)]:
+        if value is not None:
+            config.duckdb_overrides[key] = value
     
     try:
         if args.mode == 'test':
@@ -1184,6 +1280,9 @@ if __name__ == "__main__":
             print("Running in LEGACY mode (original pipeline)...")
             success = run_full_pipeline_test()
             
+        if config.profile_queries:
+            print_query_profile_summary()
+            
         if success:
             logger.info(f"Pipeline {args.mode} completed successfully")
             sys.exit(0)
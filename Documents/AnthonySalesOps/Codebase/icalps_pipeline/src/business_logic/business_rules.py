@@ -5,9 +5,11 @@ Orchestrates all business logic, validation, and transformation rules
 
 import pandas as pd
 import logging
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Iterable
 from business_logic.pipeline_mapper import pipeline_mapper
 from business_logic.computed_columns import computed_columns_processor
+from business_logic.data_quality import DataQualityValidator
+from business_logic.profiling_sketches import DataProfiler
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,6 +22,7 @@ class BusinessRulesEngine:
         self.computed_processor = computed_columns_processor
         self.validation_rules = {}
         self.setup_validation_rules()
+        self.quality_validator = DataQualityValidator(self.validation_rules)
 
     def setup_validation_rules(self):
         """Setup data validation rules"""
@@ -58,65 +61,12 @@ class BusinessRulesEngine:
         }
 
     def validate_data_quality(self, df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
-        """Validate data quality based on business rules"""
-        validation_results = {
-            'entity_type': entity_type,
-            'total_records': len(df),
-            'errors': [],
-            'warnings': [],
-            'quality_score': 1.0
-        }
+        """Validate data quality based on business rules (single column-wise scan)"""
+        return self.quality_validator.validate(df, entity_type)
 
-        if entity_type not in self.validation_rules:
-            validation_results['warnings'].append(f"No validation rules defined for {entity_type}")
-            return validation_results
-
-        rules = self.validation_rules[entity_type]
-
-        # Check required fields
-        for field in rules.get('required_fields', []):
-            if field not in df.columns:
-                validation_results['errors'].append(f"Missing required field: {field}")
-                validation_results['quality_score'] -= 0.2
-            else:
-                null_count = df[field].isnull().sum()
-                if null_count > 0:
-                    validation_results['warnings'].append(f"Field {field} has {null_count} null values")
-                    validation_results['quality_score'] -= 0.1
-
-        # Check unique fields
-        for field in rules.get('unique_fields', []):
-            if field in df.columns:
-                duplicate_count = df[field].duplicated().sum()
-                if duplicate_count > 0:
-                    validation_results['errors'].append(f"Field {field} has {duplicate_count} duplicates")
-                    validation_results['quality_score'] -= 0.3
-
-        # Check data types
-        for field, expected_type in rules.get('data_types', {}).items():
-            if field in df.columns:
-                try:
-                    if expected_type == 'int':
-                        pd.to_numeric(df[field], errors='raise')
-                    elif expected_type == 'float':
-                        pd.to_numeric(df[field], errors='raise')
-                except:
-                    validation_results['warnings'].append(f"Field {field} has invalid {expected_type} values")
-                    validation_results['quality_score'] -= 0.05
-
-        # Check range constraints
-        for field, (min_val, max_val) in rules.get('range_checks', {}).items():
-            if field in df.columns:
-                numeric_series = pd.to_numeric(df[field], errors='coerce')
-                out_of_range = ((numeric_series < min_val) | (numeric_series > max_val)).sum()
-                if out_of_range > 0:
-                    validation_results['warnings'].append(f"Field {field} has {out_of_range} values out of range [{min_val}, {max_val}]")
-                    validation_results['quality_score'] -= 0.05
-
-        # Ensure quality score doesn't go below 0
-        validation_results['quality_score'] = max(0, validation_results['quality_score'])
-
-        return validation_results
+    def validate_data_quality_chunked(self, chunks: Iterable[pd.DataFrame], entity_type: str) -> Dict[str, Any]:
+        """Validate data quality over a stream of chunks without holding the full frame"""
+        return self.quality_validator.validate_chunks(chunks, entity_type)
 
     def apply_business_rules_to_opportunities(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply all business rules to opportunities data"""
@@ -349,8 +299,17 @@ class BusinessRulesEngine:
             logger.error(f"Error enhancing contact data: {str(e)}")
             return df
 
-    def generate_business_rules_report(self, processed_data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
-        """Generate comprehensive business rules application report"""
+    def generate_business_rules_report(self, processed_data: Dict[str, pd.DataFrame],
+                                       approximate: bool = False) -> Dict[str, Any]:
+        """
+        Generate comprehensive business rules application report
+
+        Args:
+            processed_data: Processed DataFrames by entity type
+            approximate: Replace the exact pipeline statistics and computed-column
+                         metrics with per-column sketch profiles (distinct counts,
+                         quantiles, top values) under 'column_profiles'
+        """
         report = {
             'summary': {},
             'validation_results': {},
@@ -358,6 +317,8 @@ class BusinessRulesEngine:
             'computed_metrics': {},
             'recommendations': []
         }
+        if approximate:
+            report['column_profiles'] = {}
 
         for entity_type, df in processed_data.items():
             if len(df) > 0:
@@ -365,7 +326,10 @@ class BusinessRulesEngine:
                 report['validation_results'][entity_type] = self.validate_data_quality(df, entity_type)
 
                 # Entity-specific statistics
-                if entity_type == 'opportunities':
+                if approximate:
+                    profiler = DataProfiler.for_columns(df.columns)
+                    report['column_profiles'][entity_type] = profiler.update_from_frame(df).summary()['columns']
+                elif entity_type == 'opportunities':
                     report['pipeline_stats'] = self.pipeline_mapper.get_pipeline_statistics(df)
                     report['computed_metrics'] = self.computed_processor.get_computation_summary(df)
 
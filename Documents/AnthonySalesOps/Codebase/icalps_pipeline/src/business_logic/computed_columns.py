@@ -8,6 +8,7 @@ import numpy as np
 import logging
 from typing import Dict, Optional
 from datetime import datetime, timedelta
+from icalps_common.financials import cents_to_float, compute_financials
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,23 +16,59 @@ logger = logging.getLogger(__name__)
 class ComputedColumnsProcessor:
     """Handles computed column calculations and business rule implementations"""
 
-    def __init__(self):
+    def __init__(self, exact_money: bool = False):
+        """
+        Args:
+            exact_money: Compute financial columns in integer cents (rounded half
+                         away from zero) instead of binary floating point
+        """
         self.risk_thresholds = {
             'high_risk': 30,
             'medium_risk': 70
         }
+        self.exact_money = exact_money
+
+    def _financials(self, df: pd.DataFrame, amount: str = 'Oppo_Forecast', certainty: bool = True,
+                    cost: bool = True) -> Dict[str, np.ndarray]:
+        """Coerce the inputs in place and evaluate the shared formulas (Certainty is 0-100)"""
+        inputs = [amount] + (['Oppo_Certainty'] if certainty else []) + (['oppo_cout'] if cost else [])
+        for col in inputs:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+
+        results = compute_financials(
+            df[amount],
+            df['Oppo_Certainty'] if certainty else 0.0,
+            df['oppo_cout'] if cost else 0.0,
+            certainty_scale=100,
+            exact=self.exact_money
+        )
+        if self.exact_money:
+            valid = results.pop('valid')
+            results = {col: cents_to_float(values, valid) for col, values in results.items()}
+        return results
+
+    def calculate_financials(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Weighted forecast, net amount and net weighted amount in one vectorized pass"""
+        try:
+            df = df.copy()
+
+            for col, values in self._financials(df).items():
+                df[col] = values
+
+            logger.info("Calculated financial columns for all opportunities")
+            return df
+
+        except Exception as e:
+            logger.error(f"Error calculating financial columns: {str(e)}")
+            return df
 
     def calculate_weighted_forecast(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate Weighted Forecast = Amount × Certainty%"""
         try:
             df = df.copy()
 
-            # Ensure numeric types
-            df['Oppo_Forecast'] = pd.to_numeric(df['Oppo_Forecast'], errors='coerce').fillna(0)
-            df['Oppo_Certainty'] = pd.to_numeric(df['Oppo_Certainty'], errors='coerce').fillna(0)
-
             # Calculate weighted forecast
-            df['weighted_forecast'] = df['Oppo_Forecast'] * (df['Oppo_Certainty'] / 100)
+            df['weighted_forecast'] = self._financials(df, cost=False)['weighted_forecast']
 
             logger.info("Calculated weighted forecast for all opportunities")
             return df
@@ -45,12 +82,8 @@ class ComputedColumnsProcessor:
         try:
             df = df.copy()
 
-            # Ensure numeric types
-            df['Oppo_Forecast'] = pd.to_numeric(df['Oppo_Forecast'], errors='coerce').fillna(0)
-            df['oppo_cout'] = pd.to_numeric(df['oppo_cout'], errors='coerce').fillna(0)
-
             # Calculate net amount (profit)
-            df['net_amount'] = df['Oppo_Forecast'] - df['oppo_cout']
+            df['net_amount'] = self._financials(df, certainty=False)['net_amount']
 
             logger.info("Calculated net amount for all opportunities")
             return df
@@ -68,11 +101,8 @@ class ComputedColumnsProcessor:
             if 'net_amount' not in df.columns:
                 df = self.calculate_net_amount(df)
 
-            # Ensure numeric types
-            df['Oppo_Certainty'] = pd.to_numeric(df['Oppo_Certainty'], errors='coerce').fillna(0)
-
-            # Calculate net weighted amount
-            df['net_weighted_amount'] = df['net_amount'] * (df['Oppo_Certainty'] / 100)
+            # Calculate net weighted amount (net amount weighted like a forecast)
+            df['net_weighted_amount'] = self._financials(df, amount='net_amount', cost=False)['weighted_forecast']
 
             logger.info("Calculated net weighted amount for all opportunities")
             return df
@@ -218,9 +248,7 @@ class ComputedColumnsProcessor:
             logger.info("Starting comprehensive computed columns calculation")
 
             # Apply all calculations in sequence
-            df = self.calculate_weighted_forecast(df)
-            df = self.calculate_net_amount(df)
-            df = self.calculate_net_weighted_amount(df)
+            df = self.calculate_financials(df)
             df = self.calculate_deal_age(df)
             df = self.calculate_stage_duration(df)
             df = self.assess_risk_level(df)
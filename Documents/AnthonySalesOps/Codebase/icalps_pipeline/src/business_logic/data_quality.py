@@ -0,0 +1,221 @@
+"""
+Data Quality Validation Engine for IC'ALPS Pipeline
+Compiles validation rules once and evaluates them column-wise, in memory or over chunks
+"""
+
+import re
+import numpy as np
+import pandas as pd
+import logging
+from typing import Dict, List, Any, Iterable, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class CompiledRuleSet:
+    """Validation rules for one entity type, pre-processed for column-wise evaluation"""
+
+    def __init__(self, entity_type: str, rules: Dict[str, Any]):
+        self.entity_type = entity_type
+        self.required_fields: List[str] = list(rules.get('required_fields', []))
+        self.unique_fields: List[str] = list(rules.get('unique_fields', []))
+        self.data_types: Dict[str, str] = dict(rules.get('data_types', {}))
+        self.range_checks: Dict[str, tuple] = dict(rules.get('range_checks', {}))
+        self.format_checks = {
+            field: re.compile(pattern) for field, pattern in rules.get('format_checks', {}).items()
+        }
+
+        # Identifier used when reporting sample offending rows
+        self.id_field = rules.get('id_field') or (
+            self.unique_fields[0] if self.unique_fields else
+            (self.required_fields[0] if self.required_fields else None)
+        )
+
+        # Numeric parsing is shared by data type and range checks
+        self.numeric_fields = list(dict.fromkeys(
+            [f for f, t in self.data_types.items() if t in ('int', 'float')] + list(self.range_checks)
+        ))
+
+class ValidationAccumulator:
+    """Running failure counts and sample IDs for one validation run"""
+
+    def __init__(self, rule_set: CompiledRuleSet, sample_size: int):
+        self.rule_set = rule_set
+        self.sample_size = sample_size
+        self.total_records = 0
+        self.missing_fields: List[str] = []
+        self.counts: Dict[tuple, int] = {}
+        self.samples: Dict[tuple, list] = {}
+        self.seen_values: Dict[str, set] = {field: set() for field in rule_set.unique_fields}
+        self.null_values: Dict[str, int] = {field: 0 for field in rule_set.unique_fields}
+
+    def record(self, check: str, field: str, failed, ids: Optional[np.ndarray]):
+        """Add the failing rows of one check for the current chunk"""
+        key = (check, field)
+        failed = np.asarray(failed, dtype=bool)
+        failed_count = int(failed.sum())
+        self.counts[key] = self.counts.get(key, 0) + failed_count
+
+        samples = self.samples.setdefault(key, [])
+        if failed_count and ids is not None and len(samples) < self.sample_size:
+            needed = self.sample_size - len(samples)
+            samples.extend(ids[failed][:needed].tolist())
+
+class DataQualityValidator:
+    """Evaluates compiled validation rules over DataFrames or streams of chunks"""
+
+    def __init__(self, validation_rules: Dict[str, Dict[str, Any]], sample_size: int = 5):
+        self.sample_size = sample_size
+        self.compile(validation_rules)
+
+    def compile(self, validation_rules: Dict[str, Dict[str, Any]]):
+        """Compile the validation rule dict (regexes, ID fields, numeric field lists)"""
+        self.rule_sets = {
+            entity_type: CompiledRuleSet(entity_type, rules)
+            for entity_type, rules in validation_rules.items()
+        }
+
+    def validate(self, df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
+        """Validate a DataFrame held in memory"""
+        return self.validate_chunks([df], entity_type)
+
+    def validate_csv(self, file_path: str, entity_type: str, chunksize: int = 100000,
+                     **read_csv_kwargs) -> Dict[str, Any]:
+        """Validate a CSV file chunk by chunk without loading it whole"""
+        chunks = pd.read_csv(file_path, chunksize=chunksize, **read_csv_kwargs)
+        return self.validate_chunks(chunks, entity_type)
+
+    def validate_chunks(self, chunks: Iterable[pd.DataFrame], entity_type: str) -> Dict[str, Any]:
+        """
+        Validate a stream of DataFrame chunks
+
+        Only per-check counters, a bounded number of sample IDs and the set of
+        already-seen values of unique fields are kept between chunks.
+        """
+        results = {
+            'entity_type': entity_type,
+            'total_records': 0,
+            'errors': [],
+            'warnings': [],
+            'quality_score': 1.0
+        }
+
+        rule_set = self.rule_sets.get(entity_type)
+        if rule_set is None:
+            for chunk in chunks:
+                results['total_records'] += len(chunk)
+            results['warnings'].append(f"No validation rules defined for {entity_type}")
+            return results
+
+        acc = ValidationAccumulator(rule_set, self.sample_size)
+        for chunk in chunks:
+            self._scan_chunk(chunk, acc)
+
+        return self._build_results(results, acc)
+
+    def _scan_chunk(self, chunk: pd.DataFrame, acc: ValidationAccumulator):
+        """Evaluate every compiled check against one chunk"""
+        rule_set = acc.rule_set
+        acc.total_records += len(chunk)
+
+        ids = chunk[rule_set.id_field].to_numpy() if rule_set.id_field in chunk.columns else None
+
+        for field in rule_set.required_fields:
+            if field not in chunk.columns:
+                if field not in acc.missing_fields:
+                    acc.missing_fields.append(field)
+                continue
+            acc.record('null', field, chunk[field].isna(), ids)
+
+        for field in rule_set.unique_fields:
+            if field not in chunk.columns:
+                continue
+            acc.record('duplicate', field, self._duplicates(chunk[field], field, acc), ids)
+
+        numeric = {
+            field: pd.to_numeric(chunk[field], errors='coerce')
+            for field in rule_set.numeric_fields if field in chunk.columns
+        }
+
+        for field, expected_type in rule_set.data_types.items():
+            if field not in numeric or expected_type not in ('int', 'float'):
+                continue
+            invalid = numeric[field].isna().to_numpy() & chunk[field].notna().to_numpy()
+            acc.record(f'type_{expected_type}', field, invalid, ids)
+
+        for field, (min_val, max_val) in rule_set.range_checks.items():
+            if field not in numeric:
+                continue
+            out_of_range = ((numeric[field] < min_val) | (numeric[field] > max_val)).to_numpy()
+            acc.record('range', field, out_of_range, ids)
+
+        for field, pattern in rule_set.format_checks.items():
+            if field not in chunk.columns:
+                continue
+            values = chunk[field]
+            text = values.astype(str)
+            present = values.notna().to_numpy() & (text != '').to_numpy()
+            matches = text.str.match(pattern).fillna(False).to_numpy(dtype=bool)
+            acc.record('format', field, present & ~matches, ids)
+
+    def _duplicates(self, values: pd.Series, field: str, acc: ValidationAccumulator) -> np.ndarray:
+        """Flag repeated values within this chunk and against earlier chunks"""
+        nulls = values.isna().to_numpy()
+
+        # Nulls count as one value, matching pandas' duplicated()
+        null_dupes = nulls & (np.cumsum(nulls) + acc.null_values[field] > 1)
+        acc.null_values[field] += int(nulls.sum())
+
+        present = values[~nulls]
+        seen = acc.seen_values[field]
+        repeated = np.zeros(len(values), dtype=bool)
+        present_values = present.tolist()
+        already_seen = np.fromiter((value in seen for value in present_values), dtype=bool, count=len(present_values))
+        repeated[~nulls] = present.duplicated().to_numpy() | already_seen
+        seen.update(present_values)
+
+        return null_dupes | repeated
+
+    def _build_results(self, results: Dict[str, Any], acc: ValidationAccumulator) -> Dict[str, Any]:
+        """Turn accumulated counts into the errors/warnings/quality_score report"""
+        rule_set = acc.rule_set
+        results['total_records'] = acc.total_records
+        results['check_results'] = []
+
+        for field in acc.missing_fields:
+            results['errors'].append(f"Missing required field: {field}")
+            results['quality_score'] -= 0.2
+
+        for (check, field), failed_count in acc.counts.items():
+            results['check_results'].append({
+                'check': check,
+                'field': field,
+                'failed_count': failed_count,
+                'sample_ids': acc.samples.get((check, field), [])
+            })
+            if failed_count == 0:
+                continue
+
+            if check == 'null':
+                results['warnings'].append(f"Field {field} has {failed_count} null values")
+                results['quality_score'] -= 0.1
+            elif check == 'duplicate':
+                results['errors'].append(f"Field {field} has {failed_count} duplicates")
+                results['quality_score'] -= 0.3
+            elif check.startswith('type_'):
+                expected_type = check[len('type_'):]
+                results['warnings'].append(f"Field {field} has {failed_count} invalid {expected_type} values")
+                results['quality_score'] -= 0.05
+            elif check == 'range':
+                min_val, max_val = rule_set.range_checks[field]
+                results['warnings'].append(
+                    f"Field {field} has {failed_count} values out of range [{min_val}, {max_val}]"
+                )
+                results['quality_score'] -= 0.05
+            elif check == 'format':
+                results['warnings'].append(f"Field {field} has {failed_count} values with invalid format")
+                results['quality_score'] -= 0.05
+
+        # Ensure quality score doesn't go below 0
+        results['quality_score'] = max(0, results['quality_score'])
+        return results
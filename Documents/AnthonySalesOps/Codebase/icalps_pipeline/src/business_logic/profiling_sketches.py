@@ -0,0 +1,313 @@
+"""
+Approximate Profiling Sketches for IC'ALPS Pipeline
+Mergeable, constant-memory column statistics that can be updated batch by batch
+"""
+
+import copy
+import math
+import numpy as np
+import pandas as pd
+import logging
+from typing import Dict, Iterable, List, Optional, Any
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Column-name fragments that select the sketch in DataProfiler.for_columns
+QUANTILE_COLUMN_KEYWORDS = ('forecast', 'amount')
+HEAVY_HITTER_COLUMN_KEYWORDS = ('stage', 'status')
+
+def _hash_values(values: pd.Series) -> np.ndarray:
+    """Hash non-null values to uint64 so equal values hash equally across batches"""
+    if pd.api.types.is_numeric_dtype(values):
+        values = values.astype('float64')
+    else:
+        values = values.astype(str)
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch (2**precision one-byte registers)"""
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype=np.uint8)
+
+    def update(self, values: pd.Series):
+        """Add a batch of values"""
+        values = values.dropna()
+        if len(values) == 0:
+            return
+
+        hashes = _hash_values(values)
+        remaining_bits = 64 - self.precision
+        register_idx = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << remaining_bits) - 1)
+
+        # Rank = position of the leftmost 1-bit in the remainder (frexp is exact below 2**53)
+        bit_length = np.frexp(remainder.astype(np.float64))[1]
+        rank = (remaining_bits - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, register_idx, rank)
+
+    def merge(self, other: 'HyperLogLog'):
+        """Merge another sketch built with the same precision"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values"""
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+
+        # Small-range correction (linear counting)
+        zero_registers = int(np.count_nonzero(self.registers == 0))
+        if raw_estimate <= 2.5 * m and zero_registers > 0:
+            return int(round(m * math.log(m / zero_registers)))
+
+        return int(round(raw_estimate))
+
+class TDigest:
+    """Merging t-digest for approximate quantiles of numeric columns"""
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: pd.Series):
+        """Add a batch of values (non-numeric values are ignored)"""
+        x = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return
+
+        self.count += len(x)
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        self._compress(np.concatenate([self.means, x]),
+                       np.concatenate([self.weights, np.ones(len(x))]))
+
+    def merge(self, other: 'TDigest'):
+        """Merge another digest into this one"""
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        """Re-cluster centroids so each one spans at most one unit of the k1 scale"""
+        order = np.argsort(means, kind='mergesort')
+        means, weights = means[order], weights[order]
+
+        total = weights.sum()
+        q_mid = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_mid - 1)
+        buckets = np.floor(k - k[0]).astype(np.int64)
+
+        # Buckets are non-decreasing because means are sorted
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        bucket_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / bucket_weights
+        self.weights = bucket_weights
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at quantile q (0-1)"""
+        if self.count == 0:
+            return None
+        cumulative_mid = np.cumsum(self.weights) - self.weights / 2
+        xs = np.r_[0.0, cumulative_mid, self.weights.sum()]
+        ys = np.r_[self.min, self.means, self.max]
+        return float(np.interp(q * self.weights.sum(), xs, ys))
+
+class HeavyHitters:
+    """Misra-Gries frequent-items summary with a fixed number of counters"""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counters: Dict[Any, int] = {}
+        self.total = 0
+        self.max_error = 0
+
+    def update(self, values: pd.Series):
+        """Add a batch of values"""
+        counts = values.dropna().value_counts()
+        counts = counts[counts > 0]
+        if len(counts) == 0:
+            return
+        self.total += int(counts.sum())
+
+        # Summarize the batch first so only `capacity` counters are absorbed
+        if len(counts) > self.capacity:
+            threshold = int(counts.iloc[self.capacity])
+            counts = counts.iloc[:self.capacity] - threshold
+            counts = counts[counts > 0]
+            self.max_error += threshold
+
+        self._absorb(counts.to_dict())
+
+    def merge(self, other: 'HeavyHitters'):
+        """Merge another summary into this one"""
+        self.total += other.total
+        self.max_error += other.max_error
+        self._absorb(other.counters)
+
+    def _absorb(self, counts: Dict[Any, int]):
+        for value, count in counts.items():
+            self.counters[value] = self.counters.get(value, 0) + int(count)
+
+        if len(self.counters) > self.capacity:
+            threshold = sorted(self.counters.values(), reverse=True)[self.capacity]
+            self.counters = {v: c - threshold for v, c in self.counters.items() if c > threshold}
+            self.max_error += threshold
+
+    def count(self, value: Any) -> int:
+        """Counter for one value (lower bound, exact while max_error is 0)"""
+        return self.counters.get(value, 0)
+
+    def top(self, n: int = 10) -> List[tuple]:
+        """Most frequent values with their (lower-bound) counts"""
+        return sorted(self.counters.items(), key=lambda item: item[1], reverse=True)[:n]
+
+class ColumnProfile:
+    """Sketch bundle for one column: exact counts plus HLL and t-digest or heavy hitters"""
+
+    def __init__(self, kind: str, precision: int, compression: int, capacity: int):
+        self.kind = kind
+        self.count = 0
+        self.null_count = 0
+        self.sum = 0.0
+        self.distinct = HyperLogLog(precision)
+        self.digest = TDigest(compression) if kind == 'numeric' else None
+        self.heavy_hitters = HeavyHitters(capacity) if kind == 'categorical' else None
+
+    def update(self, values: pd.Series):
+        self.count += len(values)
+        self.null_count += int(values.isna().sum())
+        self.distinct.update(values)
+        if self.digest is not None:
+            self.sum += float(pd.to_numeric(values, errors='coerce').sum())
+            self.digest.update(values)
+        if self.heavy_hitters is not None:
+            self.heavy_hitters.update(values)
+
+    def merge(self, other: 'ColumnProfile'):
+        self.count += other.count
+        self.null_count += other.null_count
+        self.sum += other.sum
+        self.distinct.merge(other.distinct)
+        if self.digest is not None and other.digest is not None:
+            self.digest.merge(other.digest)
+        if self.heavy_hitters is not None and other.heavy_hitters is not None:
+            self.heavy_hitters.merge(other.heavy_hitters)
+
+    def summary(self, quantiles: Iterable[float], top_n: int) -> Dict[str, Any]:
+        result = {
+            'count': self.count,
+            'null_count': self.null_count,
+            'approx_distinct': self.distinct.estimate()
+        }
+        if self.digest is not None and self.digest.count > 0:
+            result.update({
+                'sum': self.sum,
+                'mean': self.sum / self.digest.count,
+                'min': self.digest.min,
+                'max': self.digest.max,
+                'quantiles': {q: self.digest.quantile(q) for q in quantiles}
+            })
+        if self.heavy_hitters is not None:
+            result['top_values'] = self.heavy_hitters.top(top_n)
+            result['top_values_max_error'] = self.heavy_hitters.max_error
+        return result
+
+class DataProfiler:
+    """
+    Incremental, mergeable profile of a table
+
+    Numeric columns get a t-digest, other columns heavy-hitter counts; every
+    column gets a HyperLogLog distinct count. Memory per column is constant,
+    so profiles over very large histories can be built one batch at a time.
+    """
+
+    def __init__(self, quantile_columns: Optional[List[str]] = None,
+                 heavy_hitter_columns: Optional[List[str]] = None,
+                 precision: int = 12, compression: int = 200, capacity: int = 64):
+        self.quantile_columns = set(quantile_columns or [])
+        self.heavy_hitter_columns = set(heavy_hitter_columns or [])
+        self.precision = precision
+        self.compression = compression
+        self.capacity = capacity
+        self.row_count = 0
+        self.columns: Dict[str, ColumnProfile] = {}
+
+    @classmethod
+    def for_columns(cls, columns: Iterable[str], **kwargs) -> 'DataProfiler':
+        """
+        Profiler for a pipeline table: t-digests on forecast/amount columns (coerced
+        to numbers even when read as text) and heavy hitters on stage/status columns
+        """
+        columns = [str(c) for c in columns]
+        return cls(
+            quantile_columns=[c for c in columns if any(k in c.lower() for k in QUANTILE_COLUMN_KEYWORDS)],
+            heavy_hitter_columns=[c for c in columns if any(k in c.lower() for k in HEAVY_HITTER_COLUMN_KEYWORDS)],
+            **kwargs
+        )
+
+    def _column_kind(self, name: str, values: pd.Series) -> str:
+        if name in self.quantile_columns:
+            return 'numeric'
+        if name in self.heavy_hitter_columns:
+            return 'categorical'
+        if pd.api.types.is_bool_dtype(values):
+            return 'categorical'
+        if pd.api.types.is_numeric_dtype(values):
+            return 'numeric'
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return 'datetime'
+        return 'categorical'
+
+    def update(self, df: pd.DataFrame) -> 'DataProfiler':
+        """Add one batch of rows"""
+        self.row_count += len(df)
+        for name in df.columns:
+            if name not in self.columns:
+                kind = self._column_kind(name, df[name])
+                self.columns[name] = ColumnProfile(kind, self.precision, self.compression, self.capacity)
+            self.columns[name].update(df[name])
+        return self
+
+    def update_from_frame(self, df: pd.DataFrame, batch_size: int = 100000) -> 'DataProfiler':
+        """Profile an in-memory frame in fixed-size batches"""
+        for start in range(0, len(df), batch_size):
+            self.update(df.iloc[start:start + batch_size])
+        return self
+
+    def merge(self, other: 'DataProfiler') -> 'DataProfiler':
+        """Merge a profile built over another set of batches"""
+        self.row_count += other.row_count
+        for name, profile in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(profile)
+            else:
+                # Own copy, so later updates to either profiler never leak into the other
+                self.columns[name] = copy.deepcopy(profile)
+        return self
+
+    def summary(self, quantiles: Iterable[float] = (0.25, 0.5, 0.75, 0.9, 0.99),
+                top_n: int = 10) -> Dict[str, Any]:
+        """Summary statistics for every profiled column"""
+        quantiles = list(quantiles)
+        return {
+            'row_count': self.row_count,
+            'columns': {
+                name: profile.summary(quantiles, top_n) for name, profile in self.columns.items()
+            }
+        }
@@ -0,0 +1,133 @@
+"""
+Keyword Text Classifiers for IC'ALPS Pipeline
+Column-wise keyword classification shared by the Bronze extractors and processors
+"""
+
+import re
+import numpy as np
+import pandas as pd
+import logging
+from typing import List, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class KeywordClassifier:
+    """
+    Ordered keyword rules evaluated over whole columns
+
+    Each rule's keyword list is compiled once into a single alternation regex.
+    Rules are checked in declaration order, so the first matching rule wins,
+    exactly like the if/elif chains this replaces.
+    """
+
+    def __init__(self, rules: List[Tuple[str, List[str]]], default: str, empty_label: str):
+        """
+        Args:
+            rules: Ordered (label, keywords) pairs; keywords are matched as lowercase substrings
+            default: Label for non-empty values that match no rule
+            empty_label: Label for missing or empty values
+        """
+        self.rules = rules
+        self.default = default
+        self.empty_label = empty_label
+        self.labels = [label for label, _ in rules]
+        self.patterns = [
+            re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+            for _, keywords in rules
+        ]
+
+    def classify_series(self, series: pd.Series) -> pd.Series:
+        """Classify every value of a column in one vectorized pass per rule"""
+        empty = series.isna() | (series.astype(str) == '')
+        text = series.fillna('').astype(str).str.lower()
+
+        conditions = [empty.to_numpy()]
+        conditions += [text.str.contains(pattern, regex=True).to_numpy() for pattern in self.patterns]
+        choices = [self.empty_label] + self.labels
+
+        return pd.Series(np.select(conditions, choices, default=self.default), index=series.index)
+
+def categorize_deal_values(forecast: pd.Series) -> pd.Series:
+    """Categorize deal values into value bands (vectorized)"""
+    values = pd.to_numeric(forecast, errors='coerce').to_numpy(dtype=float)
+
+    conditions = [
+        np.isnan(values),
+        values == 0,
+        values < 50000,
+        values < 200000,
+        values < 500000
+    ]
+    choices = ['Unknown', 'No Value', 'Small (<50K)', 'Medium (50K-200K)', 'Large (200K-500K)']
+
+    return pd.Series(np.select(conditions, choices, default='Enterprise (>500K)'), index=forecast.index)
+
+# Communication type from subject ('suivi' is checked first so follow-ups stay notes)
+comm_type_classifier = KeywordClassifier(
+    rules=[
+        ('NOTE', ['suivi']),
+        ('CALL', ['call', 'appel']),
+        ('EMAIL', ['email', 'mail']),
+        ('MEETING', ['meeting', 'réunion'])
+    ],
+    default='NOTE',
+    empty_label='UNKNOWN'
+)
+
+# Social network type from link
+network_type_classifier = KeywordClassifier(
+    rules=[
+        ('LINKEDIN', ['linkedin.com', 'in/']),
+        ('COMPANY_PAGE', ['company/']),
+        ('TWITTER', ['twitter.com']),
+        ('FACEBOOK', ['facebook.com'])
+    ],
+    default='WEBSITE',
+    empty_label='UNKNOWN'
+)
+
+# Contact seniority from job title
+seniority_classifier = KeywordClassifier(
+    rules=[
+        ('Executive', ['ceo', 'president', 'director', 'vp', 'vice president']),
+        ('Management', ['manager', 'lead', 'head', 'senior']),
+        ('Technical', ['engineer', 'developer', 'analyst', 'specialist'])
+    ],
+    default='Staff',
+    empty_label='Unknown'
+)
+
+# Deal complexity from description
+deal_complexity_classifier = KeywordClassifier(
+    rules=[
+        ('High', ['asic', 'development', 'design', 'custom', 'complex']),
+        ('Medium', ['evaluation', 'study', 'analysis', 'consulting']),
+        ('Low', ['support', 'maintenance', 'standard'])
+    ],
+    default='Medium',
+    empty_label='Unknown'
+)
+
+# Company size band from the legacy employee-count label
+company_size_classifier = KeywordClassifier(
+    rules=[
+        ('Small', ['upto20', '1-20']),
+        ('Medium', ['20-100', '21-100']),
+        ('Large', ['100+', '>100'])
+    ],
+    default='Unknown',
+    empty_label='Unknown'
+)
+
+# HubSpot property target families for social network links
+social_link_classifier = KeywordClassifier(
+    rules=[
+        ('linkedin', ['in/', 'linkedin.com']),
+        ('website', ['company/', '.com', '.org', '.net', '.fr']),
+        ('twitter', ['twitter.com', 'x.com']),
+        ('facebook', ['facebook.com'])
+    ],
+    default='other',
+    empty_label='other'
+)
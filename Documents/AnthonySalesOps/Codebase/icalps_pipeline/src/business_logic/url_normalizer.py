@@ -0,0 +1,107 @@
+"""
+URL Normalization for IC'ALPS Pipeline
+Vectorized website cleaning and domain extraction shared by extractors and site aggregation
+"""
+
+import numpy as np
+import pandas as pd
+import logging
+from typing import Dict, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Characters Python's str.strip()/str.split() treat as whitespace
+PY_WHITESPACE = ''.join(chr(code) for code in range(0x3001) if chr(code).isspace())
+
+class UrlNormalizer:
+    """
+    Normalizes website values into a cleaned URL and a grouping domain
+
+    Each distinct raw value is normalized once: columns are factorized, only
+    values not already in the memo cache go through the vectorized str
+    pipeline, and results are broadcast back to every row.
+    """
+
+    NULL_VALUES = ['', 'NULL', 'NaN']
+    NO_DOMAIN = 'no-domain'
+    DOMAIN_PATTERN = r'^(?:https?://)?(?:www\.)?([^/:]*)'
+
+    # PY_WHITESPACE as an RE2 character class
+    SQL_WHITESPACE = '[' + ''.join(f'\\x{{{ord(char):x}}}' for char in PY_WHITESPACE) + ']'
+
+    def __init__(self, max_cache_size: int = 500000):
+        self.max_cache_size = max_cache_size
+        self._cache: Dict[str, Tuple[str, str]] = {}
+
+    def normalize(self, websites: pd.Series) -> pd.DataFrame:
+        """
+        Normalize a website column
+
+        Returns:
+            DataFrame indexed like the input with 'website_clean' (https-prefixed URL,
+            '' when missing) and 'domain_clean' (lowercase host without www/port/path,
+            'no-domain' when missing)
+        """
+        codes, uniques = pd.factorize(websites, use_na_sentinel=True)
+        uniques = pd.Series(uniques, dtype=object)
+
+        missing = [value for value in uniques if value not in self._cache]
+        if missing:
+            if len(self._cache) + len(missing) > self.max_cache_size:
+                self._cache.clear()
+            self._cache.update(self._normalize_uniques(pd.Series(missing, dtype=object)))
+
+        # Code -1 marks NaN/None; it takes the extra trailing slot
+        urls = np.array([self._cache[value][0] for value in uniques] + [''], dtype=object)
+        domains = np.array([self._cache[value][1] for value in uniques] + [self.NO_DOMAIN], dtype=object)
+
+        return pd.DataFrame({
+            'website_clean': urls[codes],
+            'domain_clean': domains[codes]
+        }, index=websites.index)
+
+    def clean_urls(self, websites: pd.Series) -> pd.Series:
+        """Clean website URLs (strip and ensure an http/https scheme)"""
+        return self.normalize(websites)['website_clean']
+
+    def clean_domains(self, websites: pd.Series) -> pd.Series:
+        """Extract the grouping domain from website URLs"""
+        return self.normalize(websites)['domain_clean']
+
+    def _normalize_uniques(self, values: pd.Series) -> Dict[str, Tuple[str, str]]:
+        """Run the vectorized str pipeline over distinct raw values"""
+        text = values.astype(str)
+        is_null = text.isin(self.NULL_VALUES)
+        stripped = text.str.strip()
+
+        # Cleaned URL: add https:// when no scheme is present
+        has_scheme = stripped.str.startswith(('http://', 'https://'))
+        urls = stripped.where(has_scheme, 'https://' + stripped)
+        urls = urls.where(~is_null & (stripped != ''), '')
+
+        # Domain: drop scheme and www, keep the host up to the first '/' or ':'
+        domains = stripped.str.lower().str.extract(self.DOMAIN_PATTERN, expand=False)
+        domains = domains.fillna('')
+        domains = domains.where(~is_null & (domains != ''), self.NO_DOMAIN)
+
+        return dict(zip(values, zip(urls, domains)))
+
+    def strip_sql(self, expression: str) -> str:
+        """DuckDB expression equivalent to Python str.strip() on a VARCHAR expression"""
+        space = self.SQL_WHITESPACE
+        return f"regexp_replace({expression}, '^{space}+|{space}+$', '', 'g')"
+
+    def domain_sql(self, expression: str) -> str:
+        """DuckDB expression computing the same domain_clean as clean_domains"""
+        null_values = ', '.join(f"'{value}'" for value in self.NULL_VALUES)
+        domain = f"regexp_extract(lower({self.strip_sql(expression)}), '{self.DOMAIN_PATTERN}', 1)"
+        return (f"CASE WHEN {expression} IS NULL OR {expression} IN ({null_values}) "
+                f"THEN '{self.NO_DOMAIN}' ELSE COALESCE(NULLIF({domain}, ''), '{self.NO_DOMAIN}') END")
+
+    def clear_cache(self):
+        """Drop all memoized normalizations"""
+        self._cache = {}
+
+# Global normalizer instance
+url_normalizer = UrlNormalizer()
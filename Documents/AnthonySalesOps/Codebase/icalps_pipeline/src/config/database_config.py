@@ -6,6 +6,7 @@ Handles CSV input configuration and DuckDB setup
 import os
 from pathlib import Path
 from typing import Dict, Any
+from config.resource_config import resource_detector
 
 class DatabaseConfig:
     """Configuration for database connections and file paths"""
@@ -16,6 +17,19 @@ class DatabaseConfig:
         self.output_path = self.base_path / "output"
         self.temp_path = self.base_path / "temp"
 
+        # Output file format for success/enhanced files: csv, parquet or arrow
+        self.output_format = os.environ.get('ICALPS_OUTPUT_FORMAT', 'csv').lower()
+
+        # Save DuckDB JSON profiles of executed queries under temp/profiles
+        self.profile_queries = os.environ.get('ICALPS_PROFILE_QUERIES', '').lower() in ('1', 'true', 'yes')
+
+        # Opt-in: keep Bronze tables (with key indexes and catalog entries) in the DuckDB
+        # file instead of registering them as in-memory DataFrames
+        self.persist_tables = os.environ.get('ICALPS_PERSIST_TABLES', '').lower() in ('1', 'true', 'yes')
+
+        # DuckDB settings given on the command line (threads, memory_limit, temp_directory, ...)
+        self.duckdb_overrides: Dict[str, Any] = {}
+
         # Ensure directories exist
         self.input_path.mkdir(exist_ok=True)
         self.output_path.mkdir(exist_ok=True)
@@ -34,14 +48,23 @@ class DatabaseConfig:
             'pipeline_combinations': str(self.input_path / "combination_set._pipeline.csv")
         }
 
+    @property
+    def profiles_path(self) -> Path:
+        """Directory for DuckDB query profiles (one subdirectory per run)"""
+        return self.temp_path / "profiles"
+
+    @property
+    def duckdb_resources(self) -> Dict[str, Dict[str, Any]]:
+        """DuckDB resource settings sized for this host, each with its source"""
+        return resource_detector.duckdb_settings(self.temp_path, self.duckdb_overrides)
+
     @property
     def duckdb_config(self) -> Dict[str, Any]:
         """DuckDB configuration settings"""
+        settings = {key: setting['value'] for key, setting in self.duckdb_resources.items()}
         return {
             'database_path': str(self.temp_path / "icalps_pipeline.duckdb"),
-            'memory_limit': '1GB',
-            'threads': 4,
-            'temp_directory': str(self.temp_path)
+            **settings
         }
 
     def get_bronze_table_name(self, entity_type: str) -> str:
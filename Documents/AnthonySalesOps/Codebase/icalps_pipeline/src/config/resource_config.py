@@ -0,0 +1,213 @@
+"""
+Resource Configuration for IC'ALPS Pipeline
+Sizes DuckDB threads, memory limit and spill space from the host and its cgroup limits
+"""
+
+import math
+import os
+import shutil
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# cgroup v1 reports "no limit" as a huge page-aligned number
+_CGROUP_UNLIMITED = 1 << 60
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except (OSError, ValueError):
+        return None
+
+def _format_bytes(num_bytes: int) -> str:
+    """DuckDB size literal in MiB (e.g. '3072MiB')"""
+    return f"{max(int(num_bytes // (1 << 20)), 1)}MiB"
+
+class ResourceDetector:
+    """
+    Detects usable cores, memory and spill space and derives DuckDB settings
+
+    Memory and CPU limits of the process cgroup (v1 or v2) take precedence over
+    host totals, so containers and small VMs are not oversubscribed. Each
+    setting can be overridden through ICALPS_DUCKDB_* environment variables or
+    the pipeline CLI; the report records where each value came from.
+    """
+
+    CGROUP_ROOT = Path('/sys/fs/cgroup')
+
+    # Share of usable memory given to DuckDB; pandas frames live in the same process
+    MEMORY_FRACTION = 0.6
+    MIN_MEMORY_BYTES = 256 << 20
+    # Share of free disk DuckDB may fill with spill files
+    TEMP_DISK_FRACTION = 0.5
+
+    ENV_OVERRIDES = {
+        'threads': 'ICALPS_DUCKDB_THREADS',
+        'memory_limit': 'ICALPS_DUCKDB_MEMORY_LIMIT',
+        'temp_directory': 'ICALPS_DUCKDB_TEMP_DIR',
+        'max_temp_directory_size': 'ICALPS_DUCKDB_MAX_TEMP_SIZE'
+    }
+
+    # Used when the host cannot be inspected (previous hard-coded values)
+    FALLBACK = {'threads': 4, 'memory_limit': '1GB'}
+
+    def __init__(self):
+        self._detected: Optional[Dict[str, Any]] = None
+
+    def detect(self) -> Dict[str, Any]:
+        """Usable cores, memory and their sources (cached after the first call)"""
+        if self._detected is None:
+            host_cores = self._host_cores()
+            cgroup_cores = self._cgroup_cpu_limit()
+            host_memory = self._host_memory()
+            cgroup_memory = self._cgroup_memory_limit()
+
+            cores = min(c for c in (host_cores, cgroup_cores) if c) if (host_cores or cgroup_cores) else None
+            memory = min(m for m in (host_memory, cgroup_memory) if m) if (host_memory or cgroup_memory) else None
+
+            self._detected = {
+                'host_cores': host_cores,
+                'cgroup_cpu_limit': cgroup_cores,
+                'usable_cores': cores,
+                'host_memory_bytes': host_memory,
+                'cgroup_memory_bytes': cgroup_memory,
+                'usable_memory_bytes': memory
+            }
+        return self._detected
+
+    def duckdb_settings(self, temp_directory: Path, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        DuckDB settings with their source ('cli', 'env', 'detected' or 'fallback')
+
+        Args:
+            temp_directory: Default spill directory
+            overrides: Values given on the command line (take precedence over env)
+        """
+        detected = self.detect()
+        settings = {}
+
+        if detected['usable_cores']:
+            settings['threads'] = {'value': detected['usable_cores'], 'source': 'detected'}
+        else:
+            settings['threads'] = {'value': self.FALLBACK['threads'], 'source': 'fallback'}
+
+        if detected['usable_memory_bytes']:
+            memory = max(int(detected['usable_memory_bytes'] * self.MEMORY_FRACTION), self.MIN_MEMORY_BYTES)
+            settings['memory_limit'] = {'value': _format_bytes(memory), 'source': 'detected'}
+        else:
+            settings['memory_limit'] = {'value': self.FALLBACK['memory_limit'], 'source': 'fallback'}
+
+        settings['temp_directory'] = {'value': str(temp_directory), 'source': 'detected'}
+
+        for key, env_name in self.ENV_OVERRIDES.items():
+            value = (overrides or {}).get(key)
+            source = 'cli'
+            if value is None:
+                value, source = os.environ.get(env_name), 'env'
+            if value in (None, ''):
+                continue
+            if key == 'threads':
+                if not str(value).isdigit() or int(value) < 1:
+                    logger.warning(f"Ignoring invalid DuckDB threads override: {value}")
+                    continue
+                value = int(value)
+            else:
+                value = str(value)
+            settings[key] = {'value': value, 'source': source}
+
+        if 'max_temp_directory_size' not in settings:
+            free_disk = self._free_disk(Path(settings['temp_directory']['value']))
+            if free_disk:
+                settings['max_temp_directory_size'] = {
+                    'value': _format_bytes(free_disk * self.TEMP_DISK_FRACTION), 'source': 'detected'
+                }
+        return settings
+
+    def report(self, temp_directory: Path, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Detected resources plus the chosen DuckDB settings, for logs and run reports"""
+        return {
+            'detected': self.detect(),
+            'duckdb': self.duckdb_settings(temp_directory, overrides)
+        }
+
+    def _host_cores(self) -> Optional[int]:
+        if hasattr(os, 'sched_getaffinity'):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count()
+
+    def _host_memory(self) -> Optional[int]:
+        try:
+            return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (AttributeError, ValueError, OSError):
+            pass
+
+        # Windows
+        try:
+            import ctypes
+
+            class MemoryStatus(ctypes.Structure):
+                _fields_ = [('dwLength', ctypes.c_ulong), ('dwMemoryLoad', ctypes.c_ulong),
+                            ('ullTotalPhys', ctypes.c_ulonglong), ('ullAvailPhys', ctypes.c_ulonglong),
+                            ('ullTotalPageFile', ctypes.c_ulonglong), ('ullAvailPageFile', ctypes.c_ulonglong),
+                            ('ullTotalVirtual', ctypes.c_ulonglong), ('ullAvailVirtual', ctypes.c_ulonglong),
+                            ('ullAvailExtendedVirtual', ctypes.c_ulonglong)]
+
+            status = MemoryStatus()
+            status.dwLength = ctypes.sizeof(MemoryStatus)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return int(status.ullTotalPhys)
+        except Exception:
+            pass
+        return None
+
+    def _cgroup_paths(self, controller: str) -> list:
+        """Candidate cgroup directories for a v1 controller or the v2 unified hierarchy"""
+        paths = []
+        for line in (_read_text(Path('/proc/self/cgroup')) or '').splitlines():
+            parts = line.split(':', 2)
+            if len(parts) != 3:
+                continue
+            hierarchy, controllers, group = parts
+            group = group.lstrip('/')
+            if controller in controllers.split(','):
+                paths.append(self.CGROUP_ROOT / controller / group)
+                paths.append(self.CGROUP_ROOT / controller)
+            elif hierarchy == '0' and controllers == '':
+                paths.append(self.CGROUP_ROOT / group)
+                paths.append(self.CGROUP_ROOT)
+        return paths
+
+    def _cgroup_memory_limit(self) -> Optional[int]:
+        limits = []
+        for path in self._cgroup_paths('memory'):
+            for name in ('memory.max', 'memory.limit_in_bytes'):
+                value = _read_text(path / name)
+                if value and value.isdigit() and int(value) < _CGROUP_UNLIMITED:
+                    limits.append(int(value))
+        return min(limits) if limits else None
+
+    def _cgroup_cpu_limit(self) -> Optional[int]:
+        limits = []
+        for path in self._cgroup_paths('cpu'):
+            quota_period = _read_text(path / 'cpu.max')
+            if quota_period:
+                quota, _, period = quota_period.partition(' ')
+            else:
+                quota = _read_text(path / 'cpu.cfs_quota_us')
+                period = _read_text(path / 'cpu.cfs_period_us')
+            if quota and period and quota.lstrip('-').isdigit() and period.isdigit() and int(quota) > 0:
+                limits.append(max(math.ceil(int(quota) / int(period)), 1))
+        return min(limits) if limits else None
+
+    def _free_disk(self, path: Path) -> Optional[int]:
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            return shutil.disk_usage(path).free
+        except OSError:
+            return None
+
+# Global detector instance
+resource_detector = ResourceDetector()
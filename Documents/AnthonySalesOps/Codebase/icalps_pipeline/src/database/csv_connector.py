@@ -8,11 +8,15 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, List
 from config.database_config import config
+from business_logic.profiling_sketches import DataProfiler
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Legacy_companies.csv has no header row
+COMPANIES_COLUMNS = ['Comp_CompanyId', 'Comp_Name', 'Comp_Website', 'Comp_Website2', 'Oppo_OpportunityId', 'Oppo_Description']
+
 class CSVConnector:
     """Handles CSV file connections and data reading"""
 
@@ -78,10 +82,8 @@ class CSVConnector:
             df = pd.read_csv(file_path, encoding='utf-8-sig', header=None)
             
             # Assign proper column names based on the 6 columns structure
-            expected_columns = ['Comp_CompanyId', 'Comp_Name', 'Comp_Website', 'Comp_Website2', 'Oppo_OpportunityId', 'Oppo_Description']
-            
             if len(df.columns) == 6:
-                df.columns = expected_columns
+                df.columns = COMPANIES_COLUMNS
             else:
                 logger.warning(f"Unexpected number of columns in companies CSV: {len(df.columns)}")
                 # Fallback column assignment
@@ -161,8 +163,18 @@ class CSVConnector:
         logger.info(f"Successfully loaded {len(data)} datasets")
         return data
 
-    def get_data_summary(self) -> Dict[str, Dict[str, int]]:
-        """Get summary statistics for all datasets"""
+    def get_data_summary(self, approximate: bool = False, chunksize: int = 100000) -> Dict[str, Dict[str, int]]:
+        """
+        Get summary statistics for all datasets
+
+        Args:
+            approximate: Stream each file in chunks through mergeable sketches
+                         (constant memory) instead of loading every dataset
+            chunksize: Rows per chunk in approximate mode
+        """
+        if approximate:
+            return self.get_approximate_data_summary(chunksize)
+
         data = self.get_all_data()
         summary = {}
 
@@ -175,5 +187,37 @@ class CSVConnector:
 
         return summary
 
+    def get_approximate_data_summary(self, chunksize: int = 100000) -> Dict[str, Dict]:
+        """Profile every CSV file chunk by chunk with approximate sketches"""
+        summary = {}
+
+        for file_key, file_path in self.config.csv_files.items():
+            if not Path(file_path).exists():
+                continue
+            try:
+                read_kwargs = {'encoding': 'utf-8-sig', 'chunksize': chunksize}
+                if file_key == 'companies':
+                    read_kwargs.update(header=None, names=COMPANIES_COLUMNS)
+
+                profiler = DataProfiler(
+                    quantile_columns=['Oppo_Forecast', 'Oppo_Certainty'],
+                    heavy_hitter_columns=['Oppo_Stage', 'Oppo_Status', 'Oppo_Type']
+                )
+                for chunk in pd.read_csv(file_path, **read_kwargs):
+                    chunk.columns = chunk.columns.astype(str).str.strip().str.replace('\ufeff', '')
+                    profiler.update(chunk)
+
+                profile = profiler.summary()
+                summary[file_key] = {
+                    'rows': profile['row_count'],
+                    'columns': len(profile['columns']),
+                    'null_values': sum(c['null_count'] for c in profile['columns'].values()),
+                    'column_profiles': profile['columns']
+                }
+            except Exception as e:
+                logger.error(f"Error profiling {file_key}: {str(e)}")
+
+        return summary
+
 # Global connector instance
 csv_connector = CSVConnector()
\ No newline at end of file
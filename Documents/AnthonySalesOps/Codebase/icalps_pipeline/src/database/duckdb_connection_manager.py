@@ -0,0 +1,184 @@
+"""
+DuckDB Connection Manager for IC'ALPS Pipeline
+Hands out per-thread cursors over one DuckDB database and serializes writers
+"""
+
+import duckdb
+import pandas as pd
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from config.database_config import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def _set_statement(name: str, value: Any) -> str:
+    """SET statement with the setting name quoted as an identifier and the value as a literal"""
+    quoted_name = '"' + str(name).replace('"', '""') + '"'
+    quoted_value = "'" + str(value).replace("'", "''") + "'"
+    return f"SET {quoted_name}={quoted_value}"
+
+class DuckDBConnectionManager:
+    """
+    Thread-safe access to a single DuckDB database
+
+    A DuckDB connection must not be shared between threads, but cursors created
+    from it are independent connections to the same database instance, so they
+    see the same catalog for both file-backed and ':memory:' databases. Each
+    thread gets its own cursor; read queries run concurrently, while statements
+    that change the catalog or data take a writer lock so they never conflict.
+
+    DataFrames registered through the manager are replayed on every cursor,
+    because DuckDB keeps registered frames (and views over them) per connection.
+    """
+
+    def __init__(self, database_path: Optional[str] = None, settings: Optional[Dict[str, Any]] = None):
+        db_config = config.duckdb_config
+        self.database_path = database_path or db_config['database_path']
+        self.settings = settings if settings is not None else {
+            key: value for key, value in db_config.items() if key != 'database_path'
+        }
+        self.connection = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._cursors: Dict[threading.Thread, duckdb.DuckDBPyConnection] = {}
+        self._registrations: Dict[str, pd.DataFrame] = {}
+        self._generation = 0
+
+    def connect(self) -> duckdb.DuckDBPyConnection:
+        """Open the database (once) and apply the configured settings"""
+        with self._lock:
+            if self.connection is None:
+                self.connection = duckdb.connect(self.database_path)
+                for name, value in self.settings.items():
+                    self.connection.execute(_set_statement(name, value))
+                applied = ', '.join(f"{name}={value}" for name, value in self.settings.items())
+                logger.info(f"DuckDB database opened: {self.database_path} ({applied})")
+            return self.connection
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """Cursor owned by the calling thread, with all registered DataFrames visible"""
+        root = self.connect()
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = root.cursor()
+            self._local.cursor = cursor
+            self._local.generation = -1
+            self._local.registered = set()
+            with self._lock:
+                self._release_finished_threads()
+                self._cursors[threading.current_thread()] = cursor
+
+        # Each thread syncs only its own cursor, so no cursor is touched by two threads
+        if self._local.generation != self._generation:
+            with self._lock:
+                registrations = dict(self._registrations)
+                generation = self._generation
+            for name in self._local.registered - registrations.keys():
+                cursor.unregister(name)
+            for name, df in registrations.items():
+                cursor.register(name, df)
+            self._local.registered = set(registrations)
+            self._local.generation = generation
+        return cursor
+
+    def register(self, name: str, df: pd.DataFrame):
+        """Register a DataFrame on the root connection and (lazily) on every cursor"""
+        root = self.connect()
+        with self._write_lock:
+            root.register(name, df)
+            with self._lock:
+                self._registrations[name] = df
+                self._generation += 1
+
+    def unregister(self, name: str):
+        """Drop a registered DataFrame from the root connection and (lazily) from every cursor"""
+        with self._write_lock:
+            if self.connection is not None:
+                self.connection.unregister(name)
+            with self._lock:
+                self._registrations.pop(name, None)
+                self._generation += 1
+
+    def _release_finished_threads(self):
+        """Close cursors whose threads have exited (e.g. finished pool workers)"""
+        for thread in [t for t in self._cursors if not t.is_alive()]:
+            try:
+                self._cursors.pop(thread).close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def reader(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Cursor for read-only work; any number of threads may read at once"""
+        yield self.cursor()
+
+    @contextmanager
+    def writer(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Cursor for statements that modify the database; one writer at a time"""
+        with self._write_lock:
+            yield self.cursor()
+
+    def read(self, query: str) -> pd.DataFrame:
+        """Run a read query on the calling thread's cursor"""
+        with self.reader() as cursor:
+            return cursor.execute(query).df()
+
+    def write(self, query: str):
+        """Run a modifying statement under the writer lock"""
+        with self.writer() as cursor:
+            cursor.execute(query)
+
+    def read_many(self, queries: Dict[str, str], max_workers: Optional[int] = None,
+                  read: Optional[Callable[[str], pd.DataFrame]] = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Run independent read queries concurrently, one cursor per worker thread
+
+        Args:
+            queries: SQL queries keyed by result name
+            max_workers: Reader threads (defaults to one per query, at most 8)
+            read: Query runner used in each worker (defaults to self.read)
+
+        Returns:
+            Result DataFrames keyed like queries (None for queries that failed)
+        """
+        if not queries:
+            return {}
+        read = read or self.read
+
+        def run(item):
+            name, query = item
+            try:
+                return name, read(query)
+            except Exception as e:
+                logger.error(f"Error executing query for {name}: {str(e)}")
+                return name, None
+
+        max_workers = max_workers or min(len(queries), 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(executor.map(run, queries.items()))
+
+        with self._lock:
+            self._release_finished_threads()
+        return results
+
+    def close(self):
+        """Close every cursor and the database"""
+        with self._write_lock, self._lock:
+            for cursor in self._cursors.values():
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            self._cursors = {}
+            self._registrations = {}
+            self._generation += 1
+            self._local = threading.local()
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+                logger.info("DuckDB database closed")
@@ -0,0 +1,193 @@
+"""
+Output Store for IC'ALPS Pipeline
+Writes and reads pipeline output files as CSV, Parquet or Arrow IPC
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import os
+import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from config.database_config import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class OutputStore:
+    """
+    Format-aware reader/writer for success and enhanced output files
+
+    Parquet and Arrow IPC keep column types between stages: categoricals stay
+    dictionary-encoded, and IDs declared by an output schema stay nullable
+    integers instead of turning into floats on a CSV round trip.
+    """
+
+    FORMATS = {
+        'csv': '.csv',
+        'parquet': '.parquet',
+        'arrow': '.arrow'
+    }
+
+    # Typed formats first so downstream stages skip CSV parsing when they can
+    READ_PREFERENCE = ('parquet', 'arrow', 'csv')
+
+    def __init__(self, output_path: Optional[Path] = None):
+        self.config = config
+        self._output_path = output_path
+
+    @property
+    def output_path(self) -> Path:
+        return self._output_path or self.config.output_path
+
+    def path_for(self, base_name: str, output_format: Optional[str] = None) -> Path:
+        """Path of an output file (base_name has no extension)"""
+        output_format = output_format or self.config.output_format
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        return self.output_path / f"{base_name}{self.FORMATS[output_format]}"
+
+    def write(self, df: pd.DataFrame, base_name: str, output_format: Optional[str] = None,
+              schema=None) -> Path:
+        """
+        Write a DataFrame in the configured (or given) format
+
+        Args:
+            df: Data to write
+            base_name: File name without extension
+            output_format: 'csv', 'parquet' or 'arrow' (defaults to config.output_format)
+            schema: Optional OutputSchema whose typed columns are applied for Parquet/Arrow
+        """
+        output_format = output_format or self.config.output_format
+        file_path = self.path_for(base_name, output_format)
+        self.output_path.mkdir(exist_ok=True)
+
+        # Write next to the target and rename, so readers never see a partial file
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self._write_file(df, temp_path, output_format, schema)
+            os.replace(temp_path, file_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        self.remove_other_formats(file_path)
+        return file_path
+
+    def remove_other_formats(self, file_path: Path):
+        """
+        Delete same-stem outputs in the other formats next to file_path, so find()
+        never prefers a stale Parquet/Arrow file from an earlier run over a fresh one
+        """
+        file_path = Path(file_path)
+        for suffix in self.FORMATS.values():
+            sibling = file_path.with_suffix(suffix)
+            if sibling != file_path and sibling.exists():
+                sibling.unlink()
+                logger.info(f"Removed stale output {sibling}")
+
+    def write_many(self, jobs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Write independent outputs concurrently
+
+        Args:
+            jobs: Dicts with 'df' and 'base_name', optionally 'schema' and 'output_format'
+            max_workers: Writer threads (defaults to one per job, at most 8)
+
+        Returns:
+            One stats dict per job, in job order: path, rows, bytes, seconds,
+            rows_per_sec, bytes_per_sec, or 'error' if that file failed
+        """
+        if not jobs:
+            return []
+
+        max_workers = max_workers or min(len(jobs), 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._timed_write, jobs))
+
+    def _timed_write(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        stats = {'base_name': job['base_name'], 'rows': len(job['df'])}
+        start = time.perf_counter()
+        try:
+            file_path = self.write(job['df'], job['base_name'], job.get('output_format'), job.get('schema'))
+        except Exception as e:
+            logger.error(f"Error writing {job['base_name']}: {str(e)}")
+            stats['error'] = str(e)
+            return stats
+
+        seconds = max(time.perf_counter() - start, 1e-9)
+        size = file_path.stat().st_size
+        stats.update({
+            'path': file_path,
+            'bytes': size,
+            'seconds': seconds,
+            'rows_per_sec': stats['rows'] / seconds,
+            'bytes_per_sec': size / seconds
+        })
+        return stats
+
+    def _write_file(self, df: pd.DataFrame, file_path: Path, output_format: str, schema=None):
+        if output_format == 'csv':
+            df.to_csv(file_path, index=False)
+            return
+
+        if schema is not None:
+            df = schema.prepare_for_export(df)
+        table = pa.Table.from_pandas(self._arrow_compatible(df), preserve_index=False)
+
+        if output_format == 'parquet':
+            pq.write_table(table, file_path)
+        else:
+            feather.write_feather(table, file_path, compression='uncompressed')
+
+    def find(self, base_name: str, formats: Optional[Iterable[str]] = None) -> Optional[Path]:
+        """
+        First existing output file for base_name in order of format preference
+
+        By default the configured format is tried first, then Parquet, Arrow and CSV.
+        """
+        if formats is None:
+            formats = dict.fromkeys((self.config.output_format,) + self.READ_PREFERENCE)
+        for output_format in formats:
+            file_path = self.path_for(base_name, output_format)
+            if file_path.exists():
+                return file_path
+        return None
+
+    def exists(self, base_name: str, formats: Optional[Iterable[str]] = None) -> bool:
+        return self.find(base_name, formats) is not None
+
+    def read(self, base_name: str, formats: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+        """Read an output file, preferring typed formats over CSV"""
+        file_path = self.find(base_name, formats)
+        if file_path is None:
+            return None
+
+        if file_path.suffix == self.FORMATS['parquet']:
+            return pd.read_parquet(file_path)
+        if file_path.suffix == self.FORMATS['arrow']:
+            return feather.read_feather(file_path)
+        return pd.read_csv(file_path)
+
+    def _arrow_compatible(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast object columns mixing strings and numbers (e.g. IDs filled with '') to strings"""
+        mixed = [
+            column for column in df.columns
+            if df[column].dtype == object
+            and pd.api.types.infer_dtype(df[column], skipna=True) in ('mixed', 'mixed-integer')
+        ]
+        if not mixed:
+            return df
+
+        df = df.copy()
+        for column in mixed:
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+        return df
+
+# Global output store instance
+output_store = OutputStore()
@@ -0,0 +1,163 @@
+"""
+Table Catalog for IC'ALPS Pipeline
+Records build metadata of Bronze/Processed tables inside the DuckDB database file
+"""
+
+import hashlib
+import json
+import pandas as pd
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from config.database_config import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class TableCatalog:
+    """
+    Persistent catalog of pipeline tables (one row per table or view)
+
+    Each entry holds the source fingerprint the table was built from, its row
+    count, per-column stats (DuckDB SUMMARIZE), the key column and how it is
+    indexed, and when and how fast it was built. Because the catalog lives in
+    the same database file, a later run can tell that a Bronze table is already
+    up to date and skip rebuilding it.
+    """
+
+    CATALOG_TABLE = 'pipeline_catalog'
+
+    # Entity key columns; persisted tables get a primary key (or ART index) on these
+    KEY_COLUMNS = {
+        'companies': 'Comp_CompanyId',
+        'persons': 'Pers_PersonId',
+        'opportunities': 'Oppo_OpportunityId',
+        'communications': 'Comm_CommunicationId'
+    }
+
+    # Modules whose code shapes the Bronze frames (parsing, cleaning, derived columns);
+    # editing any of them invalidates the persisted tables built with the old code
+    TRANSFORMATION_MODULES = (
+        'extractors/bronze_extractor.py',
+        'database/csv_connector.py',
+        'business_logic/text_classifiers.py',
+        'business_logic/url_normalizer.py'
+    )
+
+    # Bump to force a rebuild after transformation changes outside those modules
+    FINGERPRINT_VERSION = 2
+
+    def __init__(self):
+        self.config = config
+        self._code_fingerprint = None
+
+    def code_fingerprint(self) -> str:
+        """Hash of FINGERPRINT_VERSION and the transformation modules' source, computed once per run"""
+        if self._code_fingerprint is None:
+            src_path = Path(__file__).resolve().parent.parent
+            digest = hashlib.sha256(str(self.FINGERPRINT_VERSION).encode('utf-8'))
+            for module in self.TRANSFORMATION_MODULES:
+                module_path = src_path / module
+                digest.update(module.encode('utf-8'))
+                digest.update(module_path.read_bytes() if module_path.exists() else b'')
+            self._code_fingerprint = digest.hexdigest()
+        return self._code_fingerprint
+
+    def ensure(self, cursor):
+        """Create the catalog table if the database does not have it yet"""
+        cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {self.CATALOG_TABLE} (
+            table_name VARCHAR PRIMARY KEY,
+            layer VARCHAR,
+            source VARCHAR,
+            source_fingerprint VARCHAR,
+            row_count BIGINT,
+            column_stats JSON,
+            key_column VARCHAR,
+            key_index VARCHAR,
+            built_at TIMESTAMP,
+            build_seconds DOUBLE
+        )
+        """)
+
+    def source_fingerprint(self, entity_type: str, df: pd.DataFrame) -> str:
+        """
+        Fingerprint of a Bronze table's input
+
+        Uses the CSV file's size and modification time (cheap, no re-read), the
+        frame's columns and length, and the code fingerprint of the
+        transformation modules; falls back to hashing the frame contents when
+        the source file is unknown. Bronze metadata columns are left out
+        because bronze_extracted_at changes on every run.
+        """
+        columns = [column for column in df.columns if not column.startswith('bronze_')]
+        parts = [entity_type, ','.join(columns), str(len(df)), self.code_fingerprint()]
+
+        file_path = self.config.csv_files.get(entity_type)
+        if file_path and Path(file_path).exists():
+            stat = Path(file_path).stat()
+            parts += [Path(file_path).name, str(stat.st_size), str(stat.st_mtime_ns)]
+        else:
+            parts.append(str(pd.util.hash_pandas_object(df[columns], index=False).sum()))
+
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def column_stats(self, cursor, table_name: str) -> Dict[str, Dict[str, Any]]:
+        """Per-column type, min/max, approximate distinct count and null share"""
+        summary = cursor.execute(f"SUMMARIZE {table_name}").df()
+        return {
+            row['column_name']: {
+                'type': row['column_type'],
+                'min': row['min'],
+                'max': row['max'],
+                'approx_unique': None if pd.isna(row['approx_unique']) else int(row['approx_unique']),
+                'null_percentage': None if pd.isna(row['null_percentage']) else float(row['null_percentage'])
+            }
+            for _, row in summary.iterrows()
+        }
+
+    def record(self, cursor, table_name: str, layer: str, source: str, fingerprint: str,
+               key_column: Optional[str] = None, key_index: Optional[str] = None,
+               build_seconds: Optional[float] = None):
+        """Upsert the catalog entry of a freshly built table or view"""
+        row_count = cursor.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        stats = self.column_stats(cursor, table_name)
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {self.CATALOG_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [table_name, layer, source, fingerprint, row_count, json.dumps(stats, default=str),
+             key_column, key_index, datetime.now(), build_seconds]
+        )
+
+    def lookup(self, cursor, table_name: str) -> Optional[Dict[str, Any]]:
+        """Catalog entry of a table, or None if it was never built"""
+        result = cursor.execute(
+            f"SELECT * FROM {self.CATALOG_TABLE} WHERE table_name = ?", [table_name]
+        ).df()
+        if len(result) == 0:
+            return None
+        entry = result.iloc[0].to_dict()
+        entry['column_stats'] = json.loads(entry['column_stats']) if entry['column_stats'] else {}
+        return entry
+
+    def is_current(self, cursor, table_name: str, fingerprint: str) -> bool:
+        """True when the table exists and was built from the same source fingerprint"""
+        exists = cursor.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ? AND schema_name = 'main'",
+            [table_name]
+        ).fetchone()[0]
+        if not exists:
+            return False
+        entry = self.lookup(cursor, table_name)
+        return entry is not None and entry['source_fingerprint'] == fingerprint
+
+    def entries(self, cursor) -> pd.DataFrame:
+        """All catalog entries without the column stats, for reports"""
+        return cursor.execute(f"""
+        SELECT table_name, layer, source, row_count, key_column, key_index, built_at, build_seconds
+        FROM {self.CATALOG_TABLE}
+        ORDER BY layer, table_name
+        """).df()
+
+# Global catalog instance
+table_catalog = TableCatalog()
@@ -8,6 +8,8 @@ import logging
 from typing import Dict, Optional
 from database.csv_connector import csv_connector
 from config.database_config import config
+from business_logic.text_classifiers import comm_type_classifier, network_type_classifier
+from business_logic.url_normalizer import url_normalizer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,7 +38,7 @@ class BronzeExtractor:
 
             # Clean website URLs
             mask = (df['Comp_Website'] != '') & (df['Comp_Website'] != 'NULL')
-            df.loc[mask, 'Comp_Website'] = df.loc[mask, 'Comp_Website'].apply(self._clean_website_url)
+            df.loc[mask, 'Comp_Website'] = url_normalizer.clean_urls(df.loc[mask, 'Comp_Website'])
 
             logger.info(f"Bronze companies extracted: {len(df)} records")
             return df
@@ -125,7 +127,7 @@ class BronzeExtractor:
                 df['Comm_DateTime'] = pd.to_datetime(df['Comm_DateTime'], errors='coerce')
 
             # Determine communication type based on subject
-            df['comm_type'] = df['Comm_Subject'].apply(self._determine_comm_type)
+            df['comm_type'] = comm_type_classifier.classify_series(df['Comm_Subject'])
 
             logger.info(f"Bronze communications extracted: {len(df)} records")
             return df
@@ -152,7 +154,7 @@ class BronzeExtractor:
             df = df[df['sone_networklink'] != '#AUTO#']
 
             # Determine social network type
-            df['network_type'] = df['sone_networklink'].apply(self._determine_network_type)
+            df['network_type'] = network_type_classifier.classify_series(df['sone_networklink'])
 
             logger.info(f"Bronze social networks extracted: {len(df)} records")
             return df
@@ -210,17 +212,6 @@ class BronzeExtractor:
         logger.info(f"Bronze extraction completed: {len(bronze_data)} datasets extracted")
         return bronze_data
 
-    def _clean_website_url(self, url: str) -> str:
-        """Clean and validate website URLs"""
-        if not url or url == 'NULL':
-            return ''
-
-        url = url.strip()
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-
-        return url
-
     def _validate_email(self, email) -> bool:
         """Basic email validation"""
         # Handle NaN/None values
@@ -243,39 +234,5 @@ class BronzeExtractor:
 
         return True
 
-    def _determine_comm_type(self, subject: str) -> str:
-        """Determine communication type from subject"""
-        if not subject:
-            return 'UNKNOWN'
-
-        subject_lower = subject.lower()
-        if 'suivi' in subject_lower:
-            return 'NOTE'
-        elif 'call' in subject_lower or 'appel' in subject_lower:
-            return 'CALL'
-        elif 'email' in subject_lower or 'mail' in subject_lower:
-            return 'EMAIL'
-        elif 'meeting' in subject_lower or 'réunion' in subject_lower:
-            return 'MEETING'
-        else:
-            return 'NOTE'
-
-    def _determine_network_type(self, link: str) -> str:
-        """Determine social network type from URL"""
-        if not link:
-            return 'UNKNOWN'
-
-        link_lower = link.lower()
-        if 'linkedin.com' in link_lower or 'in/' in link_lower:
-            return 'LINKEDIN'
-        elif 'company/' in link_lower:
-            return 'COMPANY_PAGE'
-        elif 'twitter.com' in link_lower:
-            return 'TWITTER'
-        elif 'facebook.com' in link_lower:
-            return 'FACEBOOK'
-        else:
-            return 'WEBSITE'
-
 # Global extractor instance
 bronze_extractor = BronzeExtractor()
\ No newline at end of file
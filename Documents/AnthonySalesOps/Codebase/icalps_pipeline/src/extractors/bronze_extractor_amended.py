@@ -7,6 +7,11 @@ import pandas as pd
 import logging
 from typing import Dict, Optional
 from database.csv_connector_amended import csv_connector_amended
+from business_logic.text_classifiers import (
+    comm_type_classifier, network_type_classifier, seniority_classifier,
+    deal_complexity_classifier, company_size_classifier, categorize_deal_values
+)
+from business_logic.url_normalizer import url_normalizer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,7 +39,7 @@ class BronzeExtractorAmended:
             
             # Clean website URLs
             mask = (df['Comp_Website'] != '') & (df['Comp_Website'] != 'NULL')
-            df.loc[mask, 'Comp_Website'] = df.loc[mask, 'Comp_Website'].apply(self._clean_website_url)
+            df.loc[mask, 'Comp_Website'] = url_normalizer.clean_urls(df.loc[mask, 'Comp_Website'])
             
             # Enhanced fields processing
             df['Comp_EmailAddress'] = df['Comp_EmailAddress'].str.strip().str.lower()
@@ -45,7 +50,7 @@ class BronzeExtractorAmended:
             df['phone_valid'] = df['Comp_PhoneNumber'].apply(self._validate_phone)
             
             # Company size categorization
-            df['company_size_category'] = df['Comp_Employees'].apply(self._categorize_company_size)
+            df['company_size_category'] = company_size_classifier.classify_series(df['Comp_Employees'])
             
             # Revenue categorization
             df['revenue_category'] = df['Comp_Revenue'].apply(self._categorize_revenue)
@@ -79,7 +84,7 @@ class BronzeExtractorAmended:
             # Enhanced contact fields processing
             df['Pers_Title'] = df['Pers_Title'].fillna('').str.strip()
             df['Pers_Department'] = df['Pers_Department'].fillna('').str.strip()
-            df['contact_seniority'] = df['Pers_Title'].apply(self._determine_seniority)
+            df['contact_seniority'] = seniority_classifier.classify_series(df['Pers_Title'])
             
             # Phone processing
             df['primary_phone'] = df['Pers_PhoneNumber'].fillna('')
@@ -123,8 +128,8 @@ class BronzeExtractorAmended:
                     df[field] = pd.to_datetime(df[field], errors='coerce')
 
             # Enhanced deal classification
-            df['deal_complexity'] = df['Oppo_Description'].apply(self._assess_deal_complexity)
-            df['deal_value_category'] = df['Oppo_Forecast'].apply(self._categorize_deal_value)
+            df['deal_complexity'] = deal_complexity_classifier.classify_series(df['Oppo_Description'])
+            df['deal_value_category'] = categorize_deal_values(df['Oppo_Forecast'])
 
             logger.info(f"Bronze amended opportunities extracted: {len(df)} records")
             return df
@@ -186,7 +191,7 @@ class BronzeExtractorAmended:
                 df['Comm_DateTime'] = pd.to_datetime(df['Comm_DateTime'], errors='coerce')
             
             # Determine communication type
-            df['comm_type'] = df['Comm_Subject'].apply(self._determine_comm_type)
+            df['comm_type'] = comm_type_classifier.classify_series(df['Comm_Subject'])
             
             return df
         except Exception as e:
@@ -211,7 +216,7 @@ class BronzeExtractorAmended:
             df = df[df['sone_networklink'] != '#AUTO#']
             
             # Determine social network type
-            df['network_type'] = df['sone_networklink'].apply(self._determine_network_type)
+            df['network_type'] = network_type_classifier.classify_series(df['sone_networklink'])
             
             return df
         except Exception as e:
@@ -219,15 +224,6 @@ class BronzeExtractorAmended:
             return None
 
     # Utility methods
-    def _clean_website_url(self, url: str) -> str:
-        """Clean and validate website URLs"""
-        if not url or url == 'NULL':
-            return ''
-        url = url.strip()
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        return url
-
     def _validate_email(self, email) -> bool:
         """Enhanced email validation"""
         if pd.isna(email) or not email:
@@ -248,38 +244,12 @@ class BronzeExtractorAmended:
         phone_str = str(phone).strip()
         return len(phone_str) >= 10 and any(char.isdigit() for char in phone_str)
 
-    def _categorize_company_size(self, employees: str) -> str:
-        """Categorize company size"""
-        if pd.isna(employees) or not employees:
-            return 'Unknown'
-        emp_str = str(employees).lower()
-        if 'upto20' in emp_str or '1-20' in emp_str:
-            return 'Small'
-        elif '20-100' in emp_str or '21-100' in emp_str:
-            return 'Medium'
-        elif '100+' in emp_str or '>100' in emp_str:
-            return 'Large'
-        return 'Unknown'
-
     def _categorize_revenue(self, revenue: str) -> str:
         """Categorize company revenue"""
         if pd.isna(revenue) or not revenue:
             return 'Unknown'
         return str(revenue).strip()
 
-    def _determine_seniority(self, title: str) -> str:
-        """Determine contact seniority from title"""
-        if pd.isna(title) or not title:
-            return 'Unknown'
-        title_lower = str(title).lower()
-        if any(word in title_lower for word in ['ceo', 'president', 'director', 'vp', 'vice president']):
-            return 'Executive'
-        elif any(word in title_lower for word in ['manager', 'lead', 'head', 'senior']):
-            return 'Management'
-        elif any(word in title_lower for word in ['engineer', 'developer', 'analyst', 'specialist']):
-            return 'Technical'
-        return 'Staff'
-
     def _calculate_contact_quality(self, df: pd.DataFrame) -> pd.Series:
         """Calculate contact quality score based on available information"""
         score = pd.Series(0, index=df.index)
@@ -310,77 +280,5 @@ class BronzeExtractorAmended:
             product_parts.append(str(row['Product_Name']))
         return ' | '.join(product_parts) if product_parts else ''
 
-    def _assess_deal_complexity(self, description: str) -> str:
-        """Assess deal complexity based on description"""
-        if pd.isna(description) or not description:
-            return 'Unknown'
-        
-        desc_lower = str(description).lower()
-        complexity_indicators = {
-            'High': ['asic', 'development', 'design', 'custom', 'complex'],
-            'Medium': ['evaluation', 'study', 'analysis', 'consulting'],
-            'Low': ['support', 'maintenance', 'standard']
-        }
-        
-        for level, indicators in complexity_indicators.items():
-            if any(indicator in desc_lower for indicator in indicators):
-                return level
-        
-        return 'Medium'  # Default
-
-    def _categorize_deal_value(self, forecast) -> str:
-        """Categorize deal value"""
-        if pd.isna(forecast):
-            return 'Unknown'
-        
-        try:
-            value = float(forecast)
-            if value == 0:
-                return 'No Value'
-            elif value < 50000:
-                return 'Small (<50K)'
-            elif value < 200000:
-                return 'Medium (50K-200K)'
-            elif value < 500000:
-                return 'Large (200K-500K)'
-            else:
-                return 'Enterprise (>500K)'
-        except:
-            return 'Unknown'
-
-    def _determine_comm_type(self, subject: str) -> str:
-        """Determine communication type from subject"""
-        if not subject:
-            return 'UNKNOWN'
-
-        subject_lower = subject.lower()
-        if 'suivi' in subject_lower:
-            return 'NOTE'
-        elif 'call' in subject_lower or 'appel' in subject_lower:
-            return 'CALL'
-        elif 'email' in subject_lower or 'mail' in subject_lower:
-            return 'EMAIL'
-        elif 'meeting' in subject_lower or 'réunion' in subject_lower:
-            return 'MEETING'
-        else:
-            return 'NOTE'
-
-    def _determine_network_type(self, link: str) -> str:
-        """Determine social network type from URL"""
-        if not link:
-            return 'UNKNOWN'
-
-        link_lower = link.lower()
-        if 'linkedin.com' in link_lower or 'in/' in link_lower:
-            return 'LINKEDIN'
-        elif 'company/' in link_lower:
-            return 'COMPANY_PAGE'
-        elif 'twitter.com' in link_lower:
-            return 'TWITTER'
-        elif 'facebook.com' in link_lower:
-            return 'FACEBOOK'
-        else:
-            return 'WEBSITE'
-
 # Global amended extractor instance
 bronze_extractor_amended = BronzeExtractorAmended()
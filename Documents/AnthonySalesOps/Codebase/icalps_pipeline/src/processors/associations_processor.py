@@ -5,8 +5,10 @@ Handles communications and social networks associations with companies and conta
 
 import pandas as pd
 import logging
+import numpy as np
 from typing import Dict, Optional, Tuple
-import re
+from business_logic.text_classifiers import social_link_classifier
+from processors.output_schemas import social_networks_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -158,14 +160,14 @@ class AssociationsProcessor:
             result['hubspot_contact_id'] = 'TBD'
             
             # Determine HubSpot property mapping
-            result['hubspot_property_target'] = sn_df.apply(self._determine_hubspot_property, axis=1)
+            result['hubspot_property_target'] = self._determine_hubspot_properties(sn_df)
             
             # Metadata
             result['processed_date'] = pd.Timestamp.now().strftime('%m/%d/%Y %H:%M')
             result['source_file'] = 'legacy_socialnetworks.csv'
             
             logger.info(f"Processed {len(result)} social network associations")
-            return result
+            return social_networks_schema.apply(result)
             
         except Exception as e:
             logger.error(f"Error processing social networks associations: {str(e)}")
@@ -195,38 +197,28 @@ class AssociationsProcessor:
         else:
             return 'UNKNOWN_ENTITY_TYPE'
 
-    def _determine_hubspot_property(self, row):
-        """Determine which HubSpot property should store this social network link"""
-        link = str(row['sone_networklink']).lower()
-        table_id = row['Related_TableID']
-        
-        # LinkedIn URL mapping
-        if 'in/' in link or 'linkedin.com' in link:
-            if table_id == 13:  # Person
-                return 'linkedin_bio'
-            elif table_id == 5:  # Company  
-                return 'linkedin_company_page'
-        
-        # Company website mapping
-        elif 'company/' in link or any(domain in link for domain in ['.com', '.org', '.net', '.fr']):
-            return 'website'
-            
-        # Twitter/X mapping
-        elif 'twitter.com' in link or 'x.com' in link:
-            if table_id == 13:  # Person
-                return 'twitterhandle'
-            else:
-                return 'twitterhandle'  # Company twitter
-                
-        # Facebook mapping
-        elif 'facebook.com' in link:
-            if table_id == 5:  # Company
-                return 'facebook_company_page'
-            else:
-                return 'hs_facebookid'
-                
-        else:
-            return 'website'  # Default fallback
+    def _determine_hubspot_properties(self, sn_df: pd.DataFrame) -> pd.Series:
+        """Determine which HubSpot property should store each social network link"""
+        link_family = social_link_classifier.classify_series(sn_df['sone_networklink'].astype(str))
+        table_id = sn_df['Related_TableID']
+
+        conditions = [
+            # LinkedIn URL mapping (links on other entity types have no target)
+            (link_family == 'linkedin') & (table_id == 13),
+            (link_family == 'linkedin') & (table_id == 5),
+            link_family == 'linkedin',
+            # Twitter/X mapping (same property for persons and companies)
+            link_family == 'twitter',
+            # Facebook mapping
+            (link_family == 'facebook') & (table_id == 5),
+            link_family == 'facebook'
+        ]
+        choices = ['linkedin_bio', 'linkedin_company_page', None, 'twitterhandle',
+                   'facebook_company_page', 'hs_facebookid']
+
+        # Company websites and anything unrecognised fall back to 'website'
+        targets = np.select([c.to_numpy() for c in conditions], choices, default='website')
+        return pd.Series(targets, index=sn_df.index)
 
 # Global processor instance
 associations_processor = AssociationsProcessor()
@@ -4,14 +4,68 @@ Applies business process rules to transform deals before site aggregation
 Based on deals_transformed_tohubspot.csv logic
 """
 
+import duckdb
 import pandas as pd
+import pyarrow.parquet as pq
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from datetime import datetime
+from processors.output_schemas import deals_schema, communications_schema
+from business_logic.url_normalizer import url_normalizer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Active-stage keyword mapping per pipeline; the first keyword contained in the
+# lowercased legacy stage wins. Shared by the pandas and DuckDB SQL paths.
+STUDIES_STAGE_MAPPING = {
+    'identification': ('01-Identification', 'In Progress', 'Mapped to Studies Pipeline'),
+    'qualified': ('02-Qualifiée', 'In Progress', 'Mapped to Studies Pipeline'),
+    'evaluation technique': ('03-Evaluation technique', 'In Progress', 'Mapped to Studies Pipeline'),
+    'construction propositions': ('04-Construction propositions', 'In Progress', 'Mapped to Studies Pipeline'),
+    'construction offre': ('04-Construction propositions', 'In Progress', 'Mapped to Studies Pipeline'),
+    'negotiating': ('05-Négociation', 'In Progress', 'Mapped to Studies Pipeline'),
+    'negociation': ('05-Négociation', 'In Progress', 'Mapped to Studies Pipeline')
+}
+
+SALES_STAGE_MAPPING = {
+    'identification': ('Identified', 'In Progress', 'Mapped to Sales Pipeline'),
+    'qualified': ('Qualified', 'In Progress', 'Mapped to Sales Pipeline'),
+    'evaluation technique': ('Design In', 'In Progress', 'Mapped to Sales Pipeline'),
+    'construction propositions': ('Negotiate', 'In Progress', 'Mapped to Sales Pipeline'),
+    'construction offre': ('Negotiate', 'In Progress', 'Mapped to Sales Pipeline'),
+    'negotiating': ('Design Win', 'In Progress', 'Mapped to Sales Pipeline'),
+    'negociation': ('Design Win', 'In Progress', 'Mapped to Sales Pipeline')
+}
+
+STUDIES_DEFAULT_STAGE = ('01-Identification', 'In Progress', 'Default Studies Pipeline stage')
+SALES_DEFAULT_STAGE = ('Identified', 'In Progress', 'Default Sales Pipeline stage')
+
+# Positional column the SQL association join orders and deduplicates by, so it
+# keeps the pandas semantics (source row order, last duplicate key wins)
+SOURCE_ORDER_COLUMN = 'source_row'
+
+def _sql_literal(value) -> str:
+    """Quote a Python value as a SQL string literal"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _sql_text(column: str) -> str:
+    """Column as VARCHAR stripped like Python str.strip() (tabs, newlines, ... included)"""
+    return url_normalizer.strip_sql(f"CAST({column} AS VARCHAR)")
+
+# Numeric source columns of the deal transformation with their fill value
+DEAL_NUMBER_DEFAULTS = {'Oppo_Forecast': 0, 'Oppo_Certainty': 0, 'Oppo_AssignedUserId': 27}
+
+DUCKDB_INTEGER_TYPES = ('TINYINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'HUGEINT',
+                        'UTINYINT', 'USMALLINT', 'UINTEGER', 'UBIGINT', 'UHUGEINT')
+
+def _sql_number(column: str, default, sql_type: str = 'DOUBLE') -> str:
+    """Column as a number, with unparsable text, NULL and NaN replaced by default (pd.to_numeric + fillna)"""
+    value = f"TRY_CAST({column} AS {sql_type})"
+    if sql_type == 'DOUBLE':
+        value = f"NULLIF({value}, 'NaN'::DOUBLE)"
+    return f"COALESCE({value}, {default})"
+
 class BusinessTransformationProcessor:
     """Applies IC'ALPS business process rules to transform deals according to business logic"""
 
@@ -48,10 +102,11 @@ class BusinessTransformationProcessor:
             transformed_df['deal_status'] = deal_stages.apply(lambda x: x[1])
             transformed_df['transformation_notes'] = deal_stages.apply(lambda x: x[2])
             
-            # Financial fields with business logic
-            transformed_df['deal_amount'] = deals_df['Oppo_Forecast'].fillna(0)
-            transformed_df['deal_forecast'] = deals_df['Oppo_Forecast'].fillna(0)
-            transformed_df['deal_certainty'] = deals_df['Oppo_Certainty'].fillna(0)
+            # Financial fields with business logic (CSV input may hold them as text)
+            forecast = pd.to_numeric(deals_df['Oppo_Forecast'], errors='coerce').fillna(0)
+            transformed_df['deal_amount'] = forecast
+            transformed_df['deal_forecast'] = forecast
+            transformed_df['deal_certainty'] = pd.to_numeric(deals_df['Oppo_Certainty'], errors='coerce').fillna(0)
             
             # Deal classification
             transformed_df['deal_type'] = deals_df['Oppo_Type'].fillna('')
@@ -71,7 +126,9 @@ class BusinessTransformationProcessor:
             # Association fields
             transformed_df['deal_company_id'] = deals_df['Oppo_PrimaryCompanyId']
             transformed_df['deal_contact_id'] = deals_df['Oppo_PrimaryPersonId']
-            transformed_df['deal_owner'] = deals_df['Oppo_AssignedUserId'].fillna(27)  # Default owner
+            transformed_df['deal_owner'] = pd.to_numeric(
+                deals_df['Oppo_AssignedUserId'], errors='coerce'
+            ).fillna(27)  # Default owner
             
             # Original tracking fields
             transformed_df['original_stage'] = deals_df['Oppo_Stage'].fillna('')
@@ -81,7 +138,7 @@ class BusinessTransformationProcessor:
             transformed_df['processing_date'] = datetime.now().strftime('%d/%m/%Y')
             
             logger.info(f"Business transformation completed: {len(transformed_df)} deals transformed")
-            return transformed_df
+            return deals_schema.apply(transformed_df)
             
         except Exception as e:
             logger.error(f"Error in business transformation: {str(e)}")
@@ -146,26 +203,8 @@ class BusinessTransformationProcessor:
         
         stage_clean = oppo_stage.lower().strip()
         
-        if oppo_type == 'Preetude':  # Studies Pipeline
-            stage_mapping = {
-                'identification': ('01-Identification', 'In Progress', 'Mapped to Studies Pipeline'),
-                'qualified': ('02-Qualifiée', 'In Progress', 'Mapped to Studies Pipeline'),
-                'evaluation technique': ('03-Evaluation technique', 'In Progress', 'Mapped to Studies Pipeline'),
-                'construction propositions': ('04-Construction propositions', 'In Progress', 'Mapped to Studies Pipeline'),
-                'construction offre': ('04-Construction propositions', 'In Progress', 'Mapped to Studies Pipeline'),
-                'negotiating': ('05-Négociation', 'In Progress', 'Mapped to Studies Pipeline'),
-                'negociation': ('05-Négociation', 'In Progress', 'Mapped to Studies Pipeline')
-            }
-        else:  # Sales Pipeline
-            stage_mapping = {
-                'identification': ('Identified', 'In Progress', 'Mapped to Sales Pipeline'),
-                'qualified': ('Qualified', 'In Progress', 'Mapped to Sales Pipeline'),
-                'evaluation technique': ('Design In', 'In Progress', 'Mapped to Sales Pipeline'),
-                'construction propositions': ('Negotiate', 'In Progress', 'Mapped to Sales Pipeline'),
-                'construction offre': ('Negotiate', 'In Progress', 'Mapped to Sales Pipeline'),
-                'negotiating': ('Design Win', 'In Progress', 'Mapped to Sales Pipeline'),
-                'negociation': ('Design Win', 'In Progress', 'Mapped to Sales Pipeline')
-            }
+        # Studies Pipeline for Preetude, Sales Pipeline otherwise
+        stage_mapping = STUDIES_STAGE_MAPPING if oppo_type == 'Preetude' else SALES_STAGE_MAPPING
         
         # Find matching stage
         for key, (stage, status, note) in stage_mapping.items():
@@ -173,10 +212,165 @@ class BusinessTransformationProcessor:
                 return stage, status, note
         
         # Default for unknown stages
-        if oppo_type == 'Preetude':
-            return '01-Identification', 'In Progress', 'Default Studies Pipeline stage'
+        return STUDIES_DEFAULT_STAGE if oppo_type == 'Preetude' else SALES_DEFAULT_STAGE
+
+    def _stage_case_sql(self, part: int) -> str:
+        """
+        CASE expression for one element (0=stage, 1=status, 2=notes) of the
+        _transform_deal_stage result, generated from the same rule tables
+        """
+        status = _sql_text("Oppo_Status")
+        stage = f"lower({_sql_text('Oppo_Stage')})"
+        is_studies = f"{_sql_text('Oppo_Type')} = 'Preetude'"
+        certainty = "COALESCE(TRY_CAST(Oppo_Certainty AS DOUBLE), 0)"
+
+        def pick(result):
+            return _sql_literal(result[part])
+
+        def active_case(mapping, default):
+            branches = ' '.join(
+                f"WHEN contains({stage}, {_sql_literal(key)}) THEN {pick(result)}"
+                for key, result in mapping.items()
+            )
+            return f"CASE {branches} ELSE {pick(default)} END"
+
+        return f"""CASE
+            WHEN {status} IN ('Abandonne', 'Abandonnee') AND {certainty} <= 10
+                THEN {pick(('Closed Dead', 'Lost', 'Moved to Closed Dead (abandoned + low certainty)'))}
+            WHEN {status} = 'Won' THEN {pick(('Closed Won', 'Won', 'Deal successfully closed'))}
+            WHEN {status} IN ('Lost', 'NoGo') THEN {pick(('Closed Lost', 'Lost', 'Deal closed as lost'))}
+            WHEN {status} = 'Sleap' AND {is_studies}
+                THEN {pick(('05-Négociation', 'In Progress', 'Deal on hold (Sleap)'))}
+            WHEN {status} = 'Sleap' THEN {pick(('Design Win', 'In Progress', 'Deal on hold (Sleap)'))}
+            WHEN {status} IN ('In Progress', '') AND {is_studies}
+                THEN {active_case(STUDIES_STAGE_MAPPING, STUDIES_DEFAULT_STAGE)}
+            WHEN {status} IN ('In Progress', '')
+                THEN {active_case(SALES_STAGE_MAPPING, SALES_DEFAULT_STAGE)}
+            ELSE {pick(('Identified', 'In Progress', 'Default mapping applied'))}
+        END"""
+
+    def integer_number_columns(self, connection, source: str) -> set:
+        """
+        DEAL_NUMBER_DEFAULTS columns that pd.to_numeric(...).fillna() turns into
+        int64 rather than float64: integer columns without NULLs (a NULL makes the
+        pandas column float) and text columns holding only whole numbers
+        """
+        column_types = {row[0]: row[1] for row in connection.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()}
+        checks = {}
+        for column in DEAL_NUMBER_DEFAULTS:
+            column_type = column_types.get(column)
+            if column_type in DUCKDB_INTEGER_TYPES:
+                checks[column] = f"count(*) = count({column})"
+            elif column_type == 'VARCHAR':
+                checks[column] = (f"count(*) = count({column}) AND "
+                                  f"bool_and(regexp_full_match({_sql_text(column)}, '[+-]?[0-9]+'))")
+        if not checks:
+            return set()
+
+        row = connection.execute(
+            "SELECT " + ", ".join(f"COALESCE({check}, false)" for check in checks.values()) + f" FROM {source}"
+        ).fetchone()
+        return {column for column, is_integer in zip(checks, row) if is_integer}
+
+    def build_deal_transformation_query(self, source: str = 'Processed_Opportunities',
+                                        integer_columns: Iterable[str] = ()) -> str:
+        """
+        SQL equivalent of transform_deals_to_hubspot_format over a DuckDB table or view
+
+        Args:
+            source: Opportunities table/view
+            integer_columns: DEAL_NUMBER_DEFAULTS columns to return as BIGINT instead
+                             of DOUBLE, so dtypes match the pandas path (see integer_number_columns)
+        """
+        processing_date = datetime.now().strftime('%d/%m/%Y')
+        integer_columns = set(integer_columns)
+
+        def number(column: str) -> str:
+            sql_type = 'BIGINT' if column in integer_columns else 'DOUBLE'
+            return _sql_number(column, DEAL_NUMBER_DEFAULTS[column], sql_type)
+
+        return f"""
+        SELECT
+            Oppo_OpportunityId AS record_id,
+            COALESCE(CAST(Oppo_Description AS VARCHAR), '') AS deal_name,
+            CASE WHEN {_sql_text('Oppo_Type')} = 'Preetude'
+                 THEN 'Studies Pipeline' ELSE 'Sales Pipeline' END AS pipeline,
+            {self._stage_case_sql(0)} AS deal_stage,
+            {self._stage_case_sql(1)} AS deal_status,
+            {self._stage_case_sql(2)} AS transformation_notes,
+            {number('Oppo_Forecast')} AS deal_amount,
+            {number('Oppo_Forecast')} AS deal_forecast,
+            {number('Oppo_Certainty')} AS deal_certainty,
+            COALESCE(CAST(Oppo_Type AS VARCHAR), '') AS deal_type,
+            COALESCE(CAST(Oppo_Source AS VARCHAR), '') AS deal_source,
+            'ICALPS' AS deal_brand,
+            COALESCE(CAST(Oppo_Note AS VARCHAR), '') AS deal_notes,
+            CASE WHEN CAST(Oppo_Type AS VARCHAR) = 'Preetude' THEN 'Study' ELSE 'Opportunity' END AS deal_category,
+            Oppo_CreatedDate AS deal_created_date,
+            Oppo_TargetClose AS deal_close_date,
+            Oppo_PrimaryCompanyId AS deal_company_id,
+            Oppo_PrimaryPersonId AS deal_contact_id,
+            {number('Oppo_AssignedUserId')} AS deal_owner,
+            COALESCE(CAST(Oppo_Stage AS VARCHAR), '') AS original_stage,
+            COALESCE(CAST(Oppo_Status AS VARCHAR), '') AS original_status,
+            {_sql_literal(processing_date)} AS processing_date
+        FROM {source}
+        """
+
+    def transform_deals_sql(self, connection, source: str = 'Processed_Opportunities') -> pd.DataFrame:
+        """
+        Transform deals inside DuckDB (vectorized, multi-threaded)
+
+        Args:
+            connection: DuckDB connection holding the source table or view
+            source: Opportunities table/view with the Processed_Opportunities columns
+        """
+        try:
+            logger.info(f"Starting business transformation in DuckDB from {source}...")
+            query = self.build_deal_transformation_query(source, self.integer_number_columns(connection, source))
+            transformed_df = connection.execute(query).df()
+            logger.info(f"Business transformation completed: {len(transformed_df)} deals transformed")
+            return deals_schema.apply(transformed_df)
+
+        except Exception as e:
+            logger.error(f"Error in DuckDB business transformation: {str(e)}")
+            return pd.DataFrame()
+
+    def verify_sql_parity(self, opportunities_df: pd.DataFrame) -> Dict:
+        """
+        Run the pandas and DuckDB transformations on the same deals and compare them
+
+        Returns:
+            Dict with 'matches', the number of rows compared and, per column, the
+            number of differing rows (nulls equal) or the differing dtypes
+        """
+        pandas_df = self.transform_deals_to_hubspot_format(opportunities_df, pd.DataFrame(), pd.DataFrame())
+
+        connection = duckdb.connect()
+        try:
+            connection.register('parity_opportunities', opportunities_df)
+            sql_df = self.transform_deals_sql(connection, 'parity_opportunities')
+        finally:
+            connection.close()
+
+        mismatches = {}
+        if list(pandas_df.columns) != list(sql_df.columns) or len(pandas_df) != len(sql_df):
+            mismatches['shape'] = f"pandas {pandas_df.shape} vs sql {sql_df.shape}"
         else:
-            return 'Identified', 'In Progress', 'Default Sales Pipeline stage'
+            for column in pandas_df.columns:
+                if column == 'processing_date':
+                    continue
+                if pandas_df[column].dtype != sql_df[column].dtype:
+                    mismatches[column] = f"dtype {pandas_df[column].dtype} vs {sql_df[column].dtype}"
+                    continue
+                left = pandas_df[column].astype(object).reset_index(drop=True)
+                right = sql_df[column].astype(object).reset_index(drop=True)
+                same = (left == right) | (left.isna() & right.isna())
+                differing = int((~same).sum())
+                if differing:
+                    mismatches[column] = differing
+
+        return {'matches': not mismatches, 'rows_compared': len(pandas_df), 'mismatches': mismatches}
 
     def create_communication_associations(self, communications_df: pd.DataFrame,
                                         transformed_deals_df: pd.DataFrame,
@@ -257,12 +451,124 @@ class BusinessTransformationProcessor:
             comm_associations['source_file'] = 'Legacy_comm.csv'
             
             logger.info(f"Communication associations created: {len(comm_associations)} records")
-            return comm_associations
+            return communications_schema.apply(comm_associations)
             
         except Exception as e:
             logger.error(f"Error creating communication associations: {str(e)}")
             return pd.DataFrame()
 
+    def with_source_order(self, df: pd.DataFrame) -> pd.DataFrame:
+        """df plus the SOURCE_ORDER_COLUMN position column expected by the association query"""
+        return df.assign(**{SOURCE_ORDER_COLUMN: range(len(df))})
+
+    def build_communication_associations_query(self, communications_source: str, deals_source: str,
+                                               companies_source: str, contacts_source: str) -> str:
+        """
+        SQL equivalent of create_communication_associations
+
+        Every source must carry SOURCE_ORDER_COLUMN (see with_source_order).
+        Each lookup side is reduced to its last row per key (like the dict
+        lookups), and rows keep the order of the communications source.
+        """
+        processing_date = datetime.now().strftime('%d/%m/%Y')
+        order = SOURCE_ORDER_COLUMN
+        return f"""
+        WITH deals AS (
+            SELECT record_id, deal_name, CAST(pipeline AS VARCHAR) AS pipeline,
+                   CAST(deal_stage AS VARCHAR) AS deal_stage
+            FROM {deals_source}
+            WHERE record_id IS NOT NULL
+            QUALIFY row_number() OVER (PARTITION BY record_id ORDER BY {order} DESC) = 1
+        ),
+        companies AS (
+            SELECT Comp_CompanyId, Comp_Name
+            FROM {companies_source}
+            WHERE Comp_CompanyId IS NOT NULL
+            QUALIFY row_number() OVER (PARTITION BY Comp_CompanyId ORDER BY {order} DESC) = 1
+        ),
+        contacts AS (
+            SELECT Pers_PersonId, Pers_FirstName, Pers_LastName, Pers_EmailAddress
+            FROM {contacts_source}
+            WHERE Pers_PersonId IS NOT NULL
+            QUALIFY row_number() OVER (PARTITION BY Pers_PersonId ORDER BY {order} DESC) = 1
+        )
+        SELECT
+            cm.Comm_CommunicationId AS communication_id,
+            COALESCE(cm.Comm_Subject, '') AS communication_subject,
+            COALESCE(cm.Comm_From, '') AS communication_from,
+            COALESCE(cm.Comm_TO, '') AS communication_to,
+            cm.Comm_DateTime AS communication_datetime,
+            cm.comm_type AS communication_type,
+            COALESCE(CAST(cm.Oppo_OpportunityId AS VARCHAR), '') AS legacy_opportunity_id,
+            COALESCE(CAST(cm.Pers_PersonId AS VARCHAR), '') AS legacy_person_id,
+            COALESCE(CAST(cm.Comp_CompanyId AS VARCHAR), '') AS legacy_company_id,
+            COALESCE(d.deal_name, '') AS transformed_deal_name,
+            COALESCE(d.pipeline, '') AS transformed_deal_pipeline,
+            COALESCE(d.deal_stage, '') AS transformed_deal_stage,
+            COALESCE(c.Comp_Name, 'Unknown Company') AS company_name,
+            CASE WHEN p.Pers_PersonId IS NULL THEN '' ELSE p.Pers_FirstName END AS contact_first_name,
+            CASE WHEN p.Pers_PersonId IS NULL THEN '' ELSE p.Pers_LastName END AS contact_last_name,
+            CASE WHEN p.Pers_PersonId IS NULL THEN '' ELSE p.Pers_EmailAddress END AS contact_email,
+            CASE WHEN d.record_id IS NULL THEN 'NO_DEAL_FOUND' ELSE 'SUCCESS' END AS deal_association_status,
+            CASE WHEN c.Comp_CompanyId IS NULL THEN 'NO_COMPANY_FOUND' ELSE 'SUCCESS' END AS company_association_status,
+            CASE WHEN p.Pers_PersonId IS NULL THEN 'NO_CONTACT_FOUND' ELSE 'SUCCESS' END AS contact_association_status,
+            'TBD' AS hubspot_company_id,
+            'TBD' AS hubspot_contact_id,
+            'TBD' AS hubspot_deal_id,
+            'TBD' AS hubspot_engagement_id,
+            {_sql_literal(processing_date)} AS processing_date,
+            'Legacy_comm.csv' AS source_file
+        FROM {communications_source} cm
+        LEFT JOIN deals d ON cm.Oppo_OpportunityId = d.record_id
+        LEFT JOIN companies c ON cm.Comp_CompanyId = c.Comp_CompanyId
+        LEFT JOIN contacts p ON cm.Pers_PersonId = p.Pers_PersonId
+        ORDER BY cm.{order}
+        """
+
+    def stream_communication_associations(self, connection, communications_source: str = 'Assoc_Communications',
+                                          deals_source: str = 'Assoc_Deals',
+                                          companies_source: str = 'Assoc_Companies',
+                                          contacts_source: str = 'Assoc_Persons',
+                                          batch_size: int = 100000):
+        """
+        Run the communication-association join in DuckDB and return a
+        pyarrow RecordBatchReader, so results can be consumed batch by batch
+        """
+        query = self.build_communication_associations_query(
+            communications_source, deals_source, companies_source, contacts_source
+        )
+        return connection.execute(query).fetch_record_batch(batch_size)
+
+    def write_communication_associations_parquet(self, connection, output_path: str,
+                                                 batch_size: int = 100000, **sources) -> int:
+        """
+        Stream communication associations straight into a Parquet file
+
+        Returns:
+            Number of rows written
+        """
+        reader = self.stream_communication_associations(connection, batch_size=batch_size, **sources)
+        rows_written = 0
+        with pq.ParquetWriter(output_path, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows_written += batch.num_rows
+
+        logger.info(f"Streamed {rows_written} communication associations to {output_path}")
+        return rows_written
+
+    def create_communication_associations_sql(self, connection, **sources) -> pd.DataFrame:
+        """create_communication_associations computed in DuckDB (for frames that fit in memory)"""
+        try:
+            logger.info("Creating communication associations in DuckDB...")
+            comm_associations = self.stream_communication_associations(connection, **sources).read_pandas()
+            logger.info(f"Communication associations created: {len(comm_associations)} records")
+            return communications_schema.apply(comm_associations)
+
+        except Exception as e:
+            logger.error(f"Error creating communication associations in DuckDB: {str(e)}")
+            return pd.DataFrame()
+
     def generate_transformation_report(self, transformed_deals_df: pd.DataFrame) -> Dict:
         """Generate a report of the business transformation results"""
         
@@ -4,33 +4,56 @@ Handles data transformations, joins, and aggregations
 """
 
 import duckdb
+import hashlib
+import shutil
+import time
 import pandas as pd
+import pyarrow.feather as feather
 import logging
+from contextlib import nullcontext
 from typing import Dict, Optional, Any, List
 from pathlib import Path
 from config.database_config import config
+from business_logic.profiling_sketches import DataProfiler
+from database.duckdb_connection_manager import DuckDBConnectionManager
+from database.output_store import output_store
+from database.table_catalog import table_catalog
+from processors.query_profiler import query_profiler
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _sql_literal(value) -> str:
+    """Quote a Python value as a SQL string literal"""
+    return "'" + str(value).replace("'", "''") + "'"
+
 class DuckDBProcessor:
-    """DuckDB processing engine for data transformations"""
+    """
+    DuckDB processing engine for data transformations
+
+    `connection` is the main-thread connection used by existing stages; other
+    threads go through `cursor()` / `read_queries`, which hand out one cursor
+    per thread from the same database via the connection manager.
+    """
 
     def __init__(self):
         self.config = config
         self.connection = None
+        self.connection_manager = None
+        self.query_profiler = query_profiler
+        self.table_catalog = table_catalog
         self.registered_tables = {}
 
     def connect(self) -> bool:
         """Establish DuckDB connection"""
         try:
-            db_config = self.config.duckdb_config
-            self.connection = duckdb.connect(db_config['database_path'])
+            # Reconnecting must not leak the previous database handle and its cursors
+            if self.connection_manager is not None:
+                self.close_connection()
 
-            # Configure DuckDB settings
-            self.connection.execute(f"SET memory_limit='{db_config['memory_limit']}'")
-            self.connection.execute(f"SET threads={db_config['threads']}")
-            self.connection.execute(f"SET temp_directory='{db_config['temp_directory']}'")
+            db_config = self.config.duckdb_config
+            self.connection_manager = DuckDBConnectionManager(db_config['database_path'])
+            self.connection = self.connection_manager.connect()
 
             logger.info("DuckDB connection established successfully")
             return True
@@ -39,14 +62,21 @@ class DuckDBProcessor:
             logger.error(f"Error connecting to DuckDB: {str(e)}")
             return False
 
+    def cursor(self) -> Optional[duckdb.DuckDBPyConnection]:
+        """DuckDB cursor owned by the calling thread (safe to use from worker threads)"""
+        if self.connection is None:
+            if not self.connect():
+                return None
+        return self.connection_manager.cursor()
+
     def register_dataframe(self, table_name: str, df: pd.DataFrame) -> bool:
-        """Register DataFrame as DuckDB table"""
+        """Register DataFrame as DuckDB table (visible to every thread's cursor)"""
         try:
             if self.connection is None:
                 if not self.connect():
                     return False
 
-            self.connection.register(table_name, df)
+            self.connection_manager.register(table_name, df)
             self.registered_tables[table_name] = len(df)
             logger.info(f"Registered table '{table_name}' with {len(df)} records")
             return True
@@ -63,11 +93,12 @@ class DuckDBProcessor:
                     return None
 
             if return_df:
-                result = self.connection.execute(query).df()
+                result = self._read(query)
                 logger.info(f"Query executed successfully, returned {len(result)} rows")
                 return result
             else:
-                self.connection.execute(query)
+                with self.connection_manager.writer() as cursor, self._profiled(cursor, query):
+                    cursor.execute(query)
                 logger.info("Query executed successfully")
                 return None
 
@@ -76,8 +107,46 @@ class DuckDBProcessor:
             logger.error(f"Query: {query}")
             return None
 
+    def _read(self, query: str) -> pd.DataFrame:
+        with self.connection_manager.reader() as cursor, self._profiled(cursor, query):
+            return cursor.execute(query).df()
+
+    def _profiled(self, cursor, query: str):
+        """Profiling context for one statement (no-op unless config.profile_queries is set)"""
+        if self.query_profiler.enabled:
+            return self.query_profiler.profile(cursor, query)
+        return nullcontext()
+
+    def profile_summary(self, top_n: int = 10) -> Dict[str, Any]:
+        """Slowest profiled queries and operators of this run (see QueryProfiler.summarize)"""
+        return self.query_profiler.summarize(top_n)
+
+    def read_queries(self, queries: Dict[str, str], max_workers: Optional[int] = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Run independent read queries concurrently, each on its own cursor
+
+        Args:
+            queries: SQL queries keyed by result name
+            max_workers: Reader threads (defaults to one per query, at most 8)
+
+        Returns:
+            Result DataFrames keyed like queries (None for queries that failed)
+        """
+        if self.connection is None:
+            if not self.connect():
+                return {name: None for name in queries}
+
+        results = self.connection_manager.read_many(queries, max_workers, read=self._read)
+        for name, result in results.items():
+            if result is not None:
+                logger.info(f"Query '{name}' executed successfully, returned {len(result)} rows")
+        return results
+
     def register_bronze_tables(self, bronze_data: Dict[str, pd.DataFrame]) -> bool:
-        """Register all Bronze layer tables"""
+        """Register all Bronze layer tables (persisted when config.persist_tables is set)"""
+        if self.config.persist_tables:
+            return self.persist_bronze_tables(bronze_data)
+
         try:
             for entity_type, df in bronze_data.items():
                 table_name = self.config.get_bronze_table_name(entity_type)
@@ -91,6 +160,136 @@ class DuckDBProcessor:
             logger.error(f"Error registering Bronze tables: {str(e)}")
             return False
 
+    def persist_bronze_tables(self, bronze_data: Dict[str, pd.DataFrame]) -> bool:
+        """
+        Store Bronze layer tables in the DuckDB file and record them in the catalog
+
+        Tables whose source fingerprint matches the catalog are kept as they are;
+        the others are rebuilt and keyed on their entity ID column, so point
+        lookups and incremental refreshes use the ART index instead of a scan.
+        """
+        try:
+            if self.connection is None:
+                if not self.connect():
+                    return False
+
+            with self.connection_manager.writer() as cursor:
+                self.table_catalog.ensure(cursor)
+
+                for entity_type, df in bronze_data.items():
+                    table_name = self.config.get_bronze_table_name(entity_type)
+                    fingerprint = self.table_catalog.source_fingerprint(entity_type, df)
+
+                    # A DataFrame registered under the same name would shadow the table
+                    self.connection_manager.unregister(table_name)
+                    cursor.unregister(table_name)
+
+                    if self.table_catalog.is_current(cursor, table_name, fingerprint):
+                        if 'bronze_extracted_at' in df.columns and len(df):
+                            # Same content, but the extraction time belongs to this run
+                            cursor.execute(f"UPDATE {table_name} SET bronze_extracted_at = ?",
+                                           [df['bronze_extracted_at'].iloc[0].to_pydatetime()])
+                        logger.info(f"Bronze table '{table_name}' is up to date, skipping rebuild")
+                    else:
+                        start = time.perf_counter()
+                        stage_name = f"_stage_{table_name}"
+                        cursor.register(stage_name, df)
+                        try:
+                            cursor.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM {stage_name}")
+                        finally:
+                            cursor.unregister(stage_name)
+
+                        key_column = self.table_catalog.KEY_COLUMNS.get(entity_type)
+                        key_index = self._index_key_column(cursor, table_name, key_column) if key_column in df.columns else None
+                        self.table_catalog.record(
+                            cursor, table_name, 'bronze', self.config.csv_files.get(entity_type, ''), fingerprint,
+                            key_column=key_column if key_index else None, key_index=key_index,
+                            build_seconds=time.perf_counter() - start
+                        )
+                        logger.info(f"Persisted Bronze table '{table_name}' with {len(df)} records")
+
+                    self.registered_tables[table_name] = len(df)
+
+            logger.info(f"Successfully persisted {len(bronze_data)} Bronze tables")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error persisting Bronze tables: {str(e)}")
+            return False
+
+    def _index_key_column(self, cursor, table_name: str, key_column: str) -> str:
+        """
+        Primary key on key_column when it is unique and non-null, otherwise an
+        ART index (duplicates are resolved later by the Processed views)
+
+        Returns:
+            'primary_key' or 'art_index'
+        """
+        total, distinct, nulls = cursor.execute(
+            f"SELECT COUNT(*), COUNT(DISTINCT {key_column}), COUNT(*) - COUNT({key_column}) FROM {table_name}"
+        ).fetchone()
+
+        if nulls == 0 and distinct == total:
+            cursor.execute(f"ALTER TABLE {table_name} ADD PRIMARY KEY ({key_column})")
+            return 'primary_key'
+
+        logger.warning(f"{table_name}.{key_column} has {total - distinct} duplicate/{nulls} null keys; "
+                       f"using a non-unique index")
+        cursor.execute(f"CREATE INDEX idx_{table_name}_{key_column} ON {table_name} ({key_column})")
+        return 'art_index'
+
+    def catalog_processed_views(self) -> bool:
+        """
+        Record row counts and column stats of the Processed views in the catalog
+
+        A view's fingerprint combines its definition with the fingerprints of the
+        Bronze tables it was built over, so it changes whenever either does.
+        """
+        try:
+            if self.connection is None:
+                if not self.connect():
+                    return False
+
+            with self.connection_manager.writer() as cursor:
+                self.table_catalog.ensure(cursor)
+                bronze = cursor.execute(f"""
+                SELECT string_agg(source_fingerprint, ',' ORDER BY table_name)
+                FROM {self.table_catalog.CATALOG_TABLE}
+                WHERE layer = 'bronze'
+                """).fetchone()[0] or ''
+                views = cursor.execute("""
+                SELECT view_name, sql FROM duckdb_views()
+                WHERE schema_name = 'main' AND view_name LIKE 'Processed_%'
+                """).fetchall()
+
+                for view_name, view_sql in views:
+                    entity_type = view_name[len('Processed_'):].lower()
+                    try:
+                        self.table_catalog.record(
+                            cursor, view_name, 'processed', 'view',
+                            hashlib.sha256(f"{view_sql}|{bronze}".encode('utf-8')).hexdigest(),
+                            key_column=self.table_catalog.KEY_COLUMNS.get(entity_type)
+                        )
+                    except Exception as e:
+                        # e.g. a view over a Bronze table that was not extracted this run
+                        logger.warning(f"Skipping catalog entry for {view_name}: {str(e)}")
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error cataloging Processed views: {str(e)}")
+            return False
+
+    def get_catalog(self) -> pd.DataFrame:
+        """Catalog entries of the persisted tables and views"""
+        try:
+            with self.connection_manager.writer() as cursor:
+                self.table_catalog.ensure(cursor)
+                return self.table_catalog.entries(cursor)
+        except Exception as e:
+            logger.error(f"Error reading table catalog: {str(e)}")
+            return pd.DataFrame()
+
     def create_companies_view(self) -> bool:
         """Create processed companies view with deduplication"""
         query = """
@@ -245,8 +444,18 @@ class DuckDBProcessor:
         logger.info(f"Created {success_count}/{len(views)} views successfully")
         return success_count == len(views)
 
-    def get_table_summary(self, table_name: str) -> Optional[Dict[str, Any]]:
-        """Get summary statistics for a table"""
+    def get_table_summary(self, table_name: str, approximate: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get summary statistics for a table
+
+        Args:
+            table_name: Table or view to summarize
+            approximate: Stream the table in chunks through mergeable sketches
+                         (per-column distinct counts, quantiles, top values)
+        """
+        if approximate:
+            return self.get_approximate_table_summary(table_name)
+
         query = f"""
         SELECT
             COUNT(*) as total_rows,
@@ -258,6 +467,32 @@ class DuckDBProcessor:
             return result.iloc[0].to_dict()
         return None
 
+    def get_approximate_table_summary(self, table_name: str, chunk_size: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        Profile a table chunk by chunk without materializing it in pandas
+
+        Args:
+            table_name: Table or view to profile
+            chunk_size: Number of DuckDB vectors (2048 rows each) per fetched chunk
+        """
+        try:
+            result = self.cursor().execute(f"SELECT * FROM {table_name}")
+            profiler = DataProfiler.for_columns(column[0] for column in result.description)
+            while True:
+                chunk = result.fetch_df_chunk(chunk_size)
+                if len(chunk) == 0:
+                    break
+                profiler.update(chunk)
+
+            profile = profiler.summary()
+            return {
+                'total_rows': profile['row_count'],
+                'column_profiles': profile['columns']
+            }
+        except Exception as e:
+            logger.error(f"Error profiling {table_name}: {str(e)}")
+            return None
+
     def get_all_table_summaries(self) -> Dict[str, Dict[str, Any]]:
         """Get summaries for all registered tables"""
         summaries = {}
@@ -269,23 +504,110 @@ class DuckDBProcessor:
 
     def export_to_csv(self, table_name: str, output_path: str) -> bool:
         """Export table to CSV file"""
+        return self.export_table(table_name, output_path, output_format='csv')
+
+    def export_table(self, table_name: str, output_path: str, output_format: Optional[str] = None) -> bool:
+        """
+        Export table to CSV, Parquet or Arrow IPC (Parquet/Arrow skip the pandas round trip);
+        same-stem files left in the other formats are removed
+
+        Args:
+            table_name: Table or view to export
+            output_path: Destination file
+            output_format: 'csv', 'parquet' or 'arrow' (defaults to config.output_format)
+        """
+        output_format = output_format or self.config.output_format
         try:
-            query = f"SELECT * FROM {table_name}"
-            df = self.execute_query(query)
-            if df is not None:
-                df.to_csv(output_path, index=False)
-                logger.info(f"Exported {table_name} to {output_path}")
-                return True
-            return False
+            if output_format == 'csv':
+                self.execute_query(f"SELECT * FROM {table_name}").to_csv(output_path, index=False)
+            elif output_format == 'parquet':
+                self.cursor().execute(f"COPY (SELECT * FROM {table_name}) TO {_sql_literal(output_path)} (FORMAT PARQUET)")
+            elif output_format == 'arrow':
+                table = self.cursor().execute(f"SELECT * FROM {table_name}").fetch_arrow_table()
+                feather.write_feather(table, output_path, compression='uncompressed')
+            else:
+                logger.error(f"Unsupported export format: {output_format}")
+                return False
+
+            output_store.remove_other_formats(Path(output_path))
+            logger.info(f"Exported {table_name} to {output_path}")
+            return True
         except Exception as e:
             logger.error(f"Error exporting {table_name}: {str(e)}")
             return False
 
+    def export_partitioned_parquet(self, source: str, output_dir: str, partition_by: List[str],
+                                   derived_columns: Optional[Dict[str, str]] = None,
+                                   compression: str = 'zstd', row_group_size: int = 122880) -> bool:
+        """
+        Export a table, view or SELECT query as a hive-partitioned Parquet dataset
+
+        Args:
+            source: Table/view name or a SELECT/WITH query
+            output_dir: Dataset root, replaced on every export; files land in
+                        output_dir/col=value/.../*.parquet
+            partition_by: Partition columns (source or derived columns)
+            derived_columns: Extra partition columns as {name: SQL expression},
+                             e.g. {'close_year': 'year(Oppo_TargetClose)'}
+            compression: Parquet codec (zstd, snappy, gzip, uncompressed)
+            row_group_size: Rows per Parquet row group
+        """
+        try:
+            if self.connection is None:
+                if not self.connect():
+                    return False
+
+            is_query = source.lstrip().upper().startswith(('SELECT', 'WITH'))
+            source_sql = f"({source})" if is_query else source
+
+            derived_sql = ''.join(
+                f", {expression} AS {name}" for name, expression in (derived_columns or {}).items()
+            )
+
+            # COPY only replaces the partitions it writes, so write a fresh dataset next to
+            # the target and swap it in; no stale partitions from earlier runs survive
+            dataset_dir = Path(output_dir)
+            staging_dir = dataset_dir.with_name(f".{dataset_dir.name}.tmp")
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+
+            query = f"""
+            COPY (SELECT *{derived_sql} FROM {source_sql} AS src)
+            TO {_sql_literal(staging_dir)} (
+                FORMAT PARQUET,
+                PARTITION_BY ({', '.join(partition_by)}),
+                COMPRESSION '{compression}',
+                ROW_GROUP_SIZE {row_group_size}
+            )
+            """
+            self.cursor().execute(query)
+            if dataset_dir.exists():
+                shutil.rmtree(dataset_dir)
+            staging_dir.rename(dataset_dir)
+            logger.info(f"Exported partitioned Parquet dataset to {output_dir} (partitioned by {', '.join(partition_by)})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error exporting partitioned dataset to {output_dir}: {str(e)}")
+            return False
+
+    def query_partitioned_parquet(self, dataset_dir: str, where: Optional[str] = None,
+                                  columns: str = '*') -> Optional[pd.DataFrame]:
+        """
+        Read a hive-partitioned Parquet dataset; filters on partition columns
+        in `where` only scan the matching directories
+        """
+        query = f"SELECT {columns} FROM read_parquet({_sql_literal(f'{dataset_dir}/**/*.parquet')}, hive_partitioning = true)"
+        if where:
+            query += f" WHERE {where}"
+        return self.execute_query(query)
+
     def close_connection(self):
         """Close DuckDB connection"""
-        if self.connection:
-            self.connection.close()
+        if self.connection_manager is not None:
+            self.connection_manager.close()
             self.connection = None
+            self.connection_manager = None
             self.registered_tables = {}
             logger.info("DuckDB connection closed")
 
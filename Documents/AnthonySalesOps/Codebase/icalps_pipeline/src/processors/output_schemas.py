@@ -0,0 +1,136 @@
+"""
+Output Schemas for IC'ALPS Pipeline
+Declares dictionary-encoded (categorical) and constant columns of each processor output
+"""
+
+import pandas as pd
+import logging
+from typing import Dict, List, Optional, Any
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class OutputSchema:
+    """
+    Column dtype declarations for one processor output
+
+    Low-cardinality label columns (pipelines, stages, statuses, types) and
+    constant columns ('TBD' placeholders, processing dates, source file names)
+    are stored as pandas categoricals: one small integer code per row plus a
+    single copy of each distinct string. Parquet export writes them as
+    dictionary-encoded columns and reads them back as categoricals.
+    """
+
+    def __init__(self, name: str, categorical_columns: List[str],
+                 constant_columns: Optional[List[str]] = None,
+                 id_columns: Optional[List[str]] = None):
+        self.name = name
+        self.categorical_columns = categorical_columns
+        self.constant_columns = constant_columns or []
+        self.id_columns = id_columns or []
+
+    @property
+    def encoded_columns(self) -> List[str]:
+        return self.categorical_columns + self.constant_columns
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast declared columns to categorical dtype (columns not present are skipped)"""
+        columns = [c for c in self.encoded_columns if c in df.columns]
+        if len(df) == 0 or not columns:
+            return df
+
+        for column in self.constant_columns:
+            if column in df.columns and df[column].nunique(dropna=False) > 1:
+                logger.warning(f"{self.name}: constant column {column} has more than one value")
+
+        return df.astype({column: 'category' for column in columns})
+
+    def prepare_for_export(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Typed frame for Parquet/Arrow: categoricals plus nullable integer IDs ('' becomes null)"""
+        df = self.apply(df)
+        id_columns = [c for c in self.id_columns if c in df.columns]
+        if not id_columns:
+            return df
+
+        df = df.copy()
+        for column in id_columns:
+            original = df[column]
+            blank = original.isna() | original.astype(str).str.strip().eq('')
+            numeric = pd.to_numeric(original.where(~blank), errors='coerce')
+            # Every non-blank ID must parse ('ABC-7' would otherwise become <NA>) and be whole
+            bad = (numeric.isna() & ~blank) | (numeric.notna() & (numeric != numeric.round()))
+            if not bad.any():
+                df[column] = numeric.astype('Int64')
+            else:
+                logger.warning(f"{self.name}: {column} has non-integer IDs, keeping original values")
+        return df
+
+    def memory_report(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Measure deep memory of a schema-typed frame against its object-dtype equivalent"""
+        columns = [c for c in self.encoded_columns if c in df.columns]
+        typed = self.apply(df)
+        untyped = typed.astype({c: object for c in columns}) if columns else typed
+
+        object_bytes = int(untyped.memory_usage(deep=True).sum())
+        typed_bytes = int(typed.memory_usage(deep=True).sum())
+
+        return {
+            'rows': len(df),
+            'encoded_columns': len(columns),
+            'object_bytes': object_bytes,
+            'typed_bytes': typed_bytes,
+            'reduction_pct': (1 - typed_bytes / object_bytes) * 100 if object_bytes > 0 else 0.0
+        }
+
+deals_schema = OutputSchema(
+    name='deals_transformed',
+    categorical_columns=['pipeline', 'deal_stage', 'deal_status', 'transformation_notes',
+                         'deal_type', 'deal_source', 'deal_category',
+                         'original_stage', 'original_status'],
+    constant_columns=['deal_brand', 'processing_date'],
+    id_columns=['record_id', 'deal_company_id', 'deal_contact_id', 'deal_owner']
+)
+
+communications_schema = OutputSchema(
+    name='communications_associations',
+    categorical_columns=['communication_type', 'transformed_deal_pipeline', 'transformed_deal_stage',
+                         'deal_association_status', 'company_association_status',
+                         'contact_association_status'],
+    constant_columns=['hubspot_company_id', 'hubspot_contact_id', 'hubspot_deal_id',
+                      'hubspot_engagement_id', 'processing_date', 'source_file'],
+    id_columns=['communication_id', 'legacy_opportunity_id', 'legacy_person_id', 'legacy_company_id']
+)
+
+social_networks_schema = OutputSchema(
+    name='social_networks_associations',
+    categorical_columns=['network_type', 'entity_type', 'association_status', 'hubspot_property_target'],
+    constant_columns=['hubspot_company_id', 'hubspot_contact_id', 'processed_date', 'source_file'],
+    id_columns=['related_record_id', 'legacy_company_id', 'legacy_contact_id']
+)
+
+site_aggregation_schema = OutputSchema(
+    name='companies_site_aggregation',
+    categorical_columns=['record_type', 'location_extracted', 'source_type'],
+    constant_columns=['processed_date'],
+    id_columns=['company_id', 'parent_company_id']
+)
+
+OUTPUT_SCHEMAS = {
+    schema.name: schema for schema in
+    [deals_schema, communications_schema, social_networks_schema, site_aggregation_schema]
+}
+
+def schema_memory_benchmark(frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+    """
+    Report the memory saved by each output schema
+
+    Args:
+        frames: Processor outputs keyed by schema name (see OUTPUT_SCHEMAS)
+    """
+    report = {}
+    for name, df in frames.items():
+        schema = OUTPUT_SCHEMAS.get(name)
+        if schema is None or df is None or len(df) == 0:
+            continue
+        report[name] = schema.memory_report(df)
+    return report
@@ -0,0 +1,144 @@
+"""
+Query Profiler for IC'ALPS Pipeline
+Captures DuckDB JSON profiles per query and summarizes the slowest operators of a run
+"""
+
+import json
+import re
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from config.database_config import config
+from database.duckdb_connection_manager import _set_statement
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def query_label(query: str) -> str:
+    """Short file-name friendly label, e.g. create_processed_companies or select_processed_persons"""
+    verb = (query.split() or ['query'])[0].lower()
+    match = re.search(r'\b(?:VIEW|TABLE)\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w."]+)', query, re.IGNORECASE)
+    if match is None:
+        match = re.search(r'\bFROM\s+([\w."]+)', query, re.IGNORECASE)
+    label = f"{verb}_{match.group(1)}" if match else verb
+    return re.sub(r'\W+', '_', label).strip('_').lower()[:60]
+
+class QueryProfiler:
+    """
+    Opt-in per-query profiling for DuckDB
+
+    While enabled (config.profile_queries), each profiled statement writes
+    temp/profiles/<run_id>/<seq>_<label>.json holding the query text, its wall
+    time and DuckDB's JSON profile (operator timings and cardinalities).
+    Statements without a physical plan (e.g. CREATE VIEW) only get wall time.
+    """
+
+    def __init__(self, profile_dir: Optional[Path] = None):
+        self.config = config
+        self._profile_dir = profile_dir
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.profile_queries
+
+    @property
+    def run_dir(self) -> Path:
+        return (self._profile_dir or self.config.profiles_path) / self.run_id
+
+    @contextmanager
+    def profile(self, cursor, query: str) -> Iterator[None]:
+        """Profile the statements run on cursor inside the block (cursor must belong to this thread)"""
+        with self._lock:
+            self._sequence += 1
+            label = f"{self._sequence:04d}_{query_label(query)}"
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        raw_path = self.run_dir / f".{label}.raw.json"
+
+        cursor.execute("PRAGMA enable_profiling='json'")
+        cursor.execute(_set_statement('profiling_output', raw_path))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            cursor.execute("PRAGMA disable_profiling")
+            self._save(label, query, elapsed, raw_path)
+
+    def _save(self, label: str, query: str, elapsed: float, raw_path: Path):
+        profile = None
+        try:
+            if raw_path.exists():
+                profile = json.loads(raw_path.read_text())
+                raw_path.unlink()
+        except Exception as e:
+            logger.error(f"Error reading profile for {label}: {str(e)}")
+
+        file_path = self.run_dir / f"{label}.json"
+        file_path.write_text(json.dumps({
+            'label': label,
+            'query': query.strip(),
+            'elapsed_seconds': elapsed,
+            'profile': profile
+        }, indent=2, default=str))
+
+        record = {
+            'label': label,
+            'file': str(file_path),
+            'elapsed_seconds': elapsed,
+            'operators': self._flatten_operators(profile) if profile else []
+        }
+        with self._lock:
+            self.records.append(record)
+
+    def _flatten_operators(self, node: Dict[str, Any]) -> List[Dict[str, Any]]:
+        operators = []
+        for child in node.get('children', []):
+            operators.append({
+                'operator_type': child.get('operator_type') or child.get('operator_name'),
+                'operator_timing': child.get('operator_timing', 0.0),
+                'operator_cardinality': child.get('operator_cardinality', 0),
+                'extra_info': child.get('extra_info', {})
+            })
+            operators.extend(self._flatten_operators(child))
+        return operators
+
+    def summarize(self, top_n: int = 10) -> Dict[str, Any]:
+        """
+        Rank the slowest queries and operators profiled in this run and
+        write the summary to <run_dir>/summary.json
+        """
+        with self._lock:
+            records = list(self.records)
+
+        operators = [
+            {'query': record['label'], **{k: v for k, v in operator.items() if k != 'extra_info'},
+             'detail': str(operator['extra_info'])[:200]}
+            for record in records for operator in record['operators']
+        ]
+
+        summary = {
+            'run_id': self.run_id,
+            'profile_dir': str(self.run_dir),
+            'queries_profiled': len(records),
+            'total_query_seconds': sum(record['elapsed_seconds'] for record in records),
+            'slowest_queries': [
+                {'query': record['label'], 'elapsed_seconds': record['elapsed_seconds'], 'file': record['file']}
+                for record in sorted(records, key=lambda r: r['elapsed_seconds'], reverse=True)[:top_n]
+            ],
+            'slowest_operators': sorted(operators, key=lambda o: o['operator_timing'], reverse=True)[:top_n]
+        }
+
+        if records:
+            (self.run_dir / 'summary.json').write_text(json.dumps(summary, indent=2, default=str))
+        return summary
+
+# Global profiler instance
+query_profiler = QueryProfiler()
@@ -3,14 +3,22 @@ Site Aggregation Processor for IC'ALPS Pipeline
 Implements child-to-parent company logic based on domain grouping and name analysis
 """
 
+import duckdb
 import pandas as pd
 import logging
-import re
 from typing import Dict, Optional, Tuple, List
+from business_logic.url_normalizer import url_normalizer
+from processors.output_schemas import site_aggregation_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Last-word markers: BASE_NAME_INDICATORS drop the word from the base name,
+# LOCATION_INDICATORS make it the extracted location (substring match, lowercase)
+LOCATION_INDICATORS = ['grenoble', 'paris', 'lyon', 'toulouse', 'hq', 'headquarters',
+                       'usa', 'france', 'germany', 'uk', 'switzerland', 'italy']
+BASE_NAME_INDICATORS = LOCATION_INDICATORS + ['north', 'south', 'east', 'west', 'corp', 'inc', 'ltd', 'sa']
+
 class SiteAggregationProcessor:
     """Implements site aggregation logic to group related company sites under parent companies"""
 
@@ -41,7 +49,7 @@ class SiteAggregationProcessor:
             aggregation_result = self._create_company_aggregation(companies_analysis, domain_groups, contacts_df)
             
             logger.info(f"Site aggregation completed: {len(aggregation_result)} records created")
-            return aggregation_result
+            return site_aggregation_schema.apply(aggregation_result)
             
         except Exception as e:
             logger.error(f"Error in site aggregation processing: {str(e)}")
@@ -59,7 +67,10 @@ class SiteAggregationProcessor:
         analysis_df['location_extracted'] = analysis_df['Comp_Name'].apply(self._extract_location)
         
         # Clean domain from website
-        analysis_df['domain_clean'] = analysis_df.get('Comp_Website', '').apply(self._clean_domain)
+        if 'Comp_Website' in analysis_df.columns:
+            analysis_df['domain_clean'] = url_normalizer.clean_domains(analysis_df['Comp_Website'])
+        else:
+            analysis_df['domain_clean'] = url_normalizer.NO_DOMAIN
         
         logger.info(f"Analyzed {len(analysis_df)} companies for site aggregation")
         return analysis_df
@@ -76,11 +87,8 @@ class SiteAggregationProcessor:
         if len(words) > 1:
             # Check if last word looks like a location (contains common location indicators)
             last_word = words[-1].lower()
-            location_indicators = ['grenoble', 'paris', 'lyon', 'toulouse', 'hq', 'headquarters', 
-                                 'usa', 'france', 'germany', 'uk', 'switzerland', 'italy',
-                                 'north', 'south', 'east', 'west', 'corp', 'inc', 'ltd', 'sa']
             
-            if any(indicator in last_word for indicator in location_indicators):
+            if any(indicator in last_word for indicator in BASE_NAME_INDICATORS):
                 return ' '.join(words[:-1])
             else:
                 # If last word doesn't look like location, keep full name
@@ -99,37 +107,13 @@ class SiteAggregationProcessor:
         if len(words) > 1:
             last_word = words[-1]
             # Check if it looks like a location
-            location_indicators = ['grenoble', 'paris', 'lyon', 'toulouse', 'hq', 'headquarters',
-                                 'usa', 'france', 'germany', 'uk', 'switzerland', 'italy']
-            
-            if any(indicator in last_word.lower() for indicator in location_indicators):
+            if any(indicator in last_word.lower() for indicator in LOCATION_INDICATORS):
                 return last_word
             else:
                 return "HQ"
         else:
             return "HQ"
 
-    def _clean_domain(self, website: str) -> str:
-        """Clean website URL to extract domain for grouping"""
-        if not website or pd.isna(website) or website in ['', 'NULL', 'NaN']:
-            return 'no-domain'
-            
-        domain = str(website).strip().lower()
-        
-        # Remove protocol
-        domain = re.sub(r'^https?://', '', domain)
-        
-        # Remove www
-        domain = re.sub(r'^www\.', '', domain)
-        
-        # Remove trailing slash and path
-        domain = domain.split('/')[0]
-        
-        # Remove port numbers
-        domain = domain.split(':')[0]
-        
-        return domain if domain else 'no-domain'
-
     def _identify_domain_groups(self, companies_analysis: pd.DataFrame) -> pd.DataFrame:
         """Identify companies that should be grouped under parent entities"""
         
@@ -363,6 +347,253 @@ class SiteAggregationProcessor:
         
         return multi_site_groups
 
+    def build_site_aggregation_query(self, companies_source: str = 'Processed_Companies',
+                                     contacts_source: str = 'Processed_Persons') -> str:
+        """
+        SQL equivalent of process_site_aggregation over DuckDB tables or views
+
+        Site records keep the order of the companies source and are followed by
+        one parent per multi-site group, in (base_company_name, domain_clean)
+        order. Null contact first/last names count as '' (the pandas path cannot
+        join them and returns no result).
+        """
+        processed_date = pd.Timestamp.now().strftime('%m/%d/%Y %H:%M')
+        strip = url_normalizer.strip_sql
+        space = url_normalizer.SQL_WHITESPACE
+        word = '[^' + space[1:] + '+'
+        base_indicators = '|'.join(BASE_NAME_INDICATORS)
+        location_indicators = '|'.join(LOCATION_INDICATORS)
+
+        def names(column):
+            return f"COALESCE(CAST({column} AS VARCHAR), '')"
+
+        def first_item(column):
+            return strip(f"split_part({column}, ',', 1)")
+
+        # Contact name expressions mirroring the Python string handling
+        child_name = strip(f"{strip('first_list[pos]')} || ' ' || {strip('last_list[pos]')}")
+        site_names = strip("replace(first_names || ' ' || last_names, '  ', ' ')")
+        site_primary_name = strip(f"{first_item('first_names')} || ' ' || {first_item('last_names')}")
+
+        return f"""
+        WITH companies AS (
+            SELECT *, row_number() OVER () AS company_order FROM {companies_source}
+        ),
+        company_words AS (
+            SELECT company_order, Comp_CompanyId, Comp_Name, Comp_Website, name_clean,
+                   regexp_matches(name_clean, '{space}') AS multi_word,
+                   regexp_extract(name_clean, '{word}$') AS last_word
+            FROM (SELECT *, {strip('CAST(Comp_Name AS VARCHAR)')} AS name_clean FROM companies)
+        ),
+        analysis AS MATERIALIZED (
+            SELECT company_order, Comp_CompanyId, Comp_Name, Comp_Website,
+                   COALESCE(CASE WHEN multi_word AND regexp_matches(lower(last_word), '{base_indicators}')
+                                 THEN regexp_replace(regexp_replace(name_clean, '{space}+{word}$', ''), '{space}+', ' ', 'g')
+                                 ELSE name_clean END, '') AS base_company_name,
+                   CASE WHEN multi_word AND regexp_matches(lower(last_word), '{location_indicators}')
+                        THEN last_word ELSE 'HQ' END AS location_extracted,
+                   {url_normalizer.domain_sql('Comp_Website')} AS domain_clean
+            FROM company_words
+        ),
+        domain_groups AS MATERIALIZED (
+            SELECT base_company_name, domain_clean,
+                   arg_min(Comp_Website, company_order) FILTER (WHERE Comp_Website IS NOT NULL) AS parent_website,
+                   (SELECT max(Comp_CompanyId) FROM analysis)
+                       + row_number() OVER (ORDER BY base_company_name, domain_clean) AS new_parent_id
+            FROM analysis
+            GROUP BY base_company_name, domain_clean
+            HAVING count(Comp_CompanyId) > 1
+        ),
+        contact_lookup AS (
+            -- Sorting one list per company is much cheaper than ORDER BY inside string_agg
+            SELECT Comp_CompanyId, contact_count,
+                   array_to_string(list_transform(contacts, c -> c.first_name), ', ') AS first_names,
+                   array_to_string(list_transform(contacts, c -> c.last_name), ', ') AS last_names,
+                   array_to_string(list_filter(list_transform(contacts, c -> c.email), e -> e IS NOT NULL), ', ') AS emails
+            FROM (
+                SELECT Comp_CompanyId,
+                       count(Pers_PersonId) AS contact_count,
+                       list_sort(list({{'contact_order': contact_order,
+                                        'first_name': {names('Pers_FirstName')},
+                                        'last_name': {names('Pers_LastName')},
+                                        'email': CAST(Pers_EmailAddress AS VARCHAR)}})) AS contacts
+                FROM (SELECT *, row_number() OVER () AS contact_order FROM {contacts_source})
+                WHERE Comp_CompanyId IS NOT NULL
+                GROUP BY Comp_CompanyId
+            )
+        ),
+        sites AS MATERIALIZED (
+            SELECT a.*, g.new_parent_id,
+                   CAST(COALESCE(c.contact_count, 0) AS DOUBLE) AS contact_count,
+                   COALESCE(c.first_names, '') AS first_names,
+                   COALESCE(c.last_names, '') AS last_names,
+                   COALESCE(c.emails, '') AS emails
+            FROM analysis a
+            LEFT JOIN domain_groups g
+                ON a.base_company_name = g.base_company_name AND a.domain_clean = g.domain_clean
+            LEFT JOIN contact_lookup c ON a.Comp_CompanyId = c.Comp_CompanyId
+        ),
+        child_names AS (
+            SELECT new_parent_id, company_order, pos,
+                   {child_name} AS contact_name
+            FROM (
+                SELECT *, unnest(generate_series(1, least(len(first_list), len(last_list)))) AS pos
+                FROM (SELECT new_parent_id, company_order,
+                             string_split(first_names, ',') AS first_list,
+                             string_split(last_names, ',') AS last_list
+                      FROM sites WHERE new_parent_id IS NOT NULL AND first_names <> '')
+            )
+        ),
+        child_emails AS (
+            SELECT * FROM (
+                SELECT new_parent_id, company_order, pos, {strip('email_list[pos]')} AS contact_email
+                FROM (
+                    SELECT *, unnest(generate_series(1, len(email_list))) AS pos
+                    FROM (SELECT new_parent_id, company_order, string_split(emails, ',') AS email_list
+                          FROM sites WHERE new_parent_id IS NOT NULL AND emails <> '')
+                )
+            ) WHERE contact_email <> ''
+        ),
+        parent_names AS (
+            -- Distinct names in first-seen order
+            SELECT new_parent_id,
+                   array_to_string(list_transform(unique_names, u -> u.contact_name), ', ') AS all_contact_names,
+                   unique_names[1].contact_name AS primary_contact_name
+            FROM (
+                SELECT new_parent_id, list_sort(list({{'first_seen': first_seen, 'contact_name': contact_name}})) AS unique_names
+                FROM (SELECT new_parent_id, contact_name, min(entry_order) AS first_seen
+                      FROM (SELECT *, row_number() OVER (PARTITION BY new_parent_id ORDER BY company_order, pos) AS entry_order
+                            FROM child_names)
+                      GROUP BY new_parent_id, contact_name)
+                GROUP BY new_parent_id
+            )
+        ),
+        parent_emails AS (
+            SELECT new_parent_id,
+                   array_to_string(list_transform(unique_emails, u -> u.contact_email), ', ') AS all_contact_emails,
+                   unique_emails[1].contact_email AS primary_contact_email
+            FROM (
+                SELECT new_parent_id, list_sort(list({{'first_seen': first_seen, 'contact_email': contact_email}})) AS unique_emails
+                FROM (SELECT new_parent_id, contact_email, min(entry_order) AS first_seen
+                      FROM (SELECT *, row_number() OVER (PARTITION BY new_parent_id ORDER BY company_order, pos) AS entry_order
+                            FROM child_emails)
+                      GROUP BY new_parent_id, contact_email)
+                GROUP BY new_parent_id
+            )
+        ),
+        parent_contacts AS (
+            SELECT new_parent_id, sum(contact_count) AS contact_count
+            FROM sites WHERE new_parent_id IS NOT NULL
+            GROUP BY new_parent_id
+        )
+        SELECT * EXCLUDE (record_part, record_order) FROM (
+            SELECT
+                0 AS record_part,
+                company_order AS record_order,
+                Comp_CompanyId AS company_id,
+                COALESCE(new_parent_id, Comp_CompanyId) AS parent_company_id,
+                Comp_Name AS company_name,
+                base_company_name,
+                location_extracted,
+                domain_clean,
+                Comp_Website AS company_website,
+                CASE WHEN new_parent_id IS NOT NULL THEN 'Site' ELSE 'Standalone' END AS record_type,
+                new_parent_id IS NOT NULL AS has_multiple_sites,
+                row_number() OVER (PARTITION BY base_company_name, domain_clean ORDER BY company_order) AS site_order,
+                contact_count,
+                CASE WHEN first_names <> '' OR last_names <> ''
+                     THEN {site_names} ELSE '' END AS all_contact_names,
+                emails AS all_contact_emails,
+                CASE WHEN first_names <> '' AND last_names <> ''
+                     THEN {site_primary_name} ELSE '' END AS primary_contact_name,
+                CASE WHEN emails <> '' THEN {first_item('emails')} ELSE '' END AS primary_contact_email,
+                'Original' AS source_type,
+                '{processed_date}' AS processed_date
+            FROM sites
+            UNION ALL
+            SELECT
+                1 AS record_part,
+                g.new_parent_id AS record_order,
+                g.new_parent_id AS company_id,
+                NULL AS parent_company_id,
+                g.base_company_name AS company_name,
+                g.base_company_name,
+                'HQ' AS location_extracted,
+                g.domain_clean,
+                g.parent_website AS company_website,
+                'Parent_Aggregator' AS record_type,
+                true AS has_multiple_sites,
+                0 AS site_order,
+                pc.contact_count,
+                COALESCE(n.all_contact_names, '') AS all_contact_names,
+                COALESCE(e.all_contact_emails, '') AS all_contact_emails,
+                COALESCE(n.primary_contact_name, '') AS primary_contact_name,
+                COALESCE(e.primary_contact_email, '') AS primary_contact_email,
+                'Generated' AS source_type,
+                '{processed_date}' AS processed_date
+            FROM domain_groups g
+            LEFT JOIN parent_contacts pc ON g.new_parent_id = pc.new_parent_id
+            LEFT JOIN parent_names n ON g.new_parent_id = n.new_parent_id
+            LEFT JOIN parent_emails e ON g.new_parent_id = e.new_parent_id
+        )
+        ORDER BY record_part, record_order
+        """
+
+    def process_site_aggregation_sql(self, connection, companies_source: str = 'Processed_Companies',
+                                     contacts_source: str = 'Processed_Persons') -> pd.DataFrame:
+        """
+        Site aggregation computed inside DuckDB (vectorized, multi-threaded)
+
+        Args:
+            connection: DuckDB connection holding the source tables or views
+            companies_source: Companies with Comp_CompanyId, Comp_Name and Comp_Website
+            contacts_source: Contacts with Pers_* columns and Comp_CompanyId
+        """
+        try:
+            logger.info(f"Starting site aggregation in DuckDB from {companies_source}...")
+            query = self.build_site_aggregation_query(companies_source, contacts_source)
+            aggregation_result = connection.execute(query).df()
+            logger.info(f"Site aggregation completed: {len(aggregation_result)} records created")
+            return site_aggregation_schema.apply(aggregation_result)
+
+        except Exception as e:
+            logger.error(f"Error in DuckDB site aggregation: {str(e)}")
+            return pd.DataFrame()
+
+    def verify_sql_parity(self, companies_df: pd.DataFrame, contacts_df: pd.DataFrame) -> Dict:
+        """
+        Run the pandas and DuckDB site aggregations on the same data and compare them
+
+        Returns:
+            Dict with 'matches', the number of rows compared and, per column, the
+            number of differing rows (values compared regardless of dtype, nulls equal)
+        """
+        pandas_df = self.process_site_aggregation(companies_df, contacts_df)
+
+        connection = duckdb.connect()
+        try:
+            connection.register('parity_companies', companies_df)
+            connection.register('parity_contacts', contacts_df)
+            sql_df = self.process_site_aggregation_sql(connection, 'parity_companies', 'parity_contacts')
+        finally:
+            connection.close()
+
+        mismatches = {}
+        if list(pandas_df.columns) != list(sql_df.columns) or len(pandas_df) != len(sql_df):
+            mismatches['shape'] = f"pandas {pandas_df.shape} vs sql {sql_df.shape}"
+        else:
+            for column in pandas_df.columns:
+                if column == 'processed_date':
+                    continue
+                left = pandas_df[column].astype(object).reset_index(drop=True)
+                right = sql_df[column].astype(object).reset_index(drop=True)
+                same = (left == right) | (left.isna() & right.isna())
+                differing = int((~same).sum())
+                if differing:
+                    mismatches[column] = differing
+
+        return {'matches': not mismatches, 'rows_compared': len(pandas_df), 'mismatches': mismatches}
+
     def create_site_aggregation_report(self, aggregation_df: pd.DataFrame) -> Dict:
         """Create a comprehensive report of the site aggregation results"""
         
@@ -11,6 +11,7 @@ import seaborn as sns
 import logging
 from typing import Dict, Optional, List
 import numpy as np
+from business_logic.profiling_sketches import DataProfiler
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,6 +32,10 @@ COLORS = ['#1E4E5C', '#28A745', '#FD7E14', '#6F42C1', '#DC3545', '#17A2B8']
 class DashboardProcessor:
     """Handles dashboard data processing with DuckDB-like operations using pandas"""
 
+    # Columns get_kpi_metrics_from_profile reads, and how they must be profiled
+    KPI_NUMERIC_COLUMNS = ['Oppo_Forecast', 'weighted_forecast', 'Oppo_Certainty']
+    KPI_STAGE_COLUMN = 'hubspot_stage'
+
     def __init__(self, df: pd.DataFrame):
         self.df = df
 
@@ -93,6 +98,64 @@ class DashboardProcessor:
 
         return metrics
 
+    @classmethod
+    def kpi_profiler(cls) -> DataProfiler:
+        """
+        DataProfiler for get_kpi_metrics_from_profile: the KPI amounts are coerced
+        to numbers (like get_kpi_metrics) even when a batch reads them as text
+        """
+        return DataProfiler(quantile_columns=cls.KPI_NUMERIC_COLUMNS,
+                            heavy_hitter_columns=[cls.KPI_STAGE_COLUMN])
+
+    @classmethod
+    def get_kpi_metrics_from_profile(cls, profiler: DataProfiler) -> Dict[str, float]:
+        """
+        Calculate KPIs from a DataProfiler (see kpi_profiler) instead of the full deal frame
+
+        Totals and means are exact. Win rate uses the hubspot_stage heavy-hitter
+        counters directly; they are exact while the sketch's max_error is 0 (never
+        more distinct stages than its capacity) and lower bounds otherwise.
+
+        Raises:
+            ValueError: if a KPI amount column was not profiled as numeric
+        """
+        metrics = {}
+        total_deals = profiler.row_count
+        columns = profiler.columns
+
+        metrics['total_deals'] = total_deals
+
+        def column_sum(name: str) -> float:
+            if columns[name].kind != 'numeric':
+                raise ValueError(f"{name} was profiled as {columns[name].kind}, not numeric; "
+                                 f"build the profile with DashboardProcessor.kpi_profiler()")
+            return columns[name].sum
+
+        # Missing values count as 0, as in get_kpi_metrics
+        if 'Oppo_Forecast' in columns:
+            forecast_sum = column_sum('Oppo_Forecast')
+            metrics['total_pipeline_value'] = forecast_sum
+            metrics['average_deal_size'] = forecast_sum / total_deals if total_deals > 0 else 0
+
+        if 'weighted_forecast' in columns:
+            metrics['weighted_pipeline_value'] = column_sum('weighted_forecast')
+
+        stage_hitters = columns[cls.KPI_STAGE_COLUMN].heavy_hitters if cls.KPI_STAGE_COLUMN in columns else None
+        if stage_hitters is not None:
+            if stage_hitters.max_error > 0:
+                logger.warning(f"{cls.KPI_STAGE_COLUMN} exceeded the heavy-hitter capacity; "
+                               f"win rate counts may be low by up to {stage_hitters.max_error}")
+            won_deals = stage_hitters.count('closedwon')
+            lost_deals = stage_hitters.count('closedlost')
+            total_closed = won_deals + lost_deals
+            metrics['win_rate'] = (won_deals / total_closed * 100) if total_closed > 0 else 0
+
+        if 'Oppo_Certainty' in columns:
+            certainty_sum = column_sum('Oppo_Certainty')
+            metrics['average_certainty'] = certainty_sum / total_deals if total_deals > 0 else 0
+
+        return metrics
+
 class ChartGenerator:
     """Generates charts for dashboard"""
 
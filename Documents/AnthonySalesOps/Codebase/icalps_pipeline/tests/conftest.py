@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Pipeline modules import each other relative to src/ (see main_pipeline.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
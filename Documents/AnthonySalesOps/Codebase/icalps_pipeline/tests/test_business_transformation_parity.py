@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processors.business_transformation_processor import BusinessTransformationProcessor
+
+
+def make_opportunities(certainty):
+    return pd.DataFrame({
+        'Oppo_OpportunityId': [1, 2, 3, 4, 5, 6],
+        'Oppo_Description': ['Deal A', None, 'Deal C', 'Deal D', 'Deal E', 'Deal F'],
+        'Oppo_Type': ['Preetude', ' Preetude ', None, 'Unknown', 'Gestion', '\tPreetude'],
+        'Oppo_Stage': ['Negotiating ', 'lead', None, ' Prospect', 'Closed', 'Qualified'],
+        'Oppo_Status': ['In Progress', ' Won', 'Lost\t', None, 'Other', 'In Progress'],
+        'Oppo_Certainty': certainty,
+        'Oppo_Forecast': [1000.0, None, 250.5, 0.0, 75.0, None],
+        'Oppo_Source': ['Web', None, 'Fair', '', 'Partner', 'Web'],
+        'Oppo_Note': [None, 'note', '', 'x', None, 'y'],
+        'Oppo_CreatedDate': ['2024-01-01', None, '2024-03-01', '2024-04-01', '2024-05-01', '2024-06-01'],
+        'Oppo_TargetClose': [None, '2024-02-15', None, '2024-04-30', None, '2024-07-01'],
+        'Oppo_PrimaryCompanyId': [10, 11, 12, 13, 14, 15],
+        'Oppo_PrimaryPersonId': [20, 21, 22, 23, 24, 25],
+        'Oppo_AssignedUserId': [5, None, 7, 8, None, 9],
+    })
+
+
+@pytest.fixture
+def processor():
+    return BusinessTransformationProcessor()
+
+
+@pytest.mark.parametrize('certainty, expected_dtype', [
+    (pd.Series([10, 25, 50, 75, 100, 0], dtype='int64'), 'int64'),
+    ([10.0, np.nan, 50.5, 75.0, 100.0, 0.0], 'float64'),
+    ([' 10 ', None, '50', 'abc', '100', '0'], 'float64'),
+    (['10', '25', ' 50', '75', '100', '0'], 'int64'),
+])
+def test_sql_transformation_matches_pandas(processor, certainty, expected_dtype):
+    opportunities = make_opportunities(certainty)
+
+    result = processor.verify_sql_parity(opportunities)
+
+    assert result['matches'], result['mismatches']
+    assert result['rows_compared'] == len(opportunities)
+    pandas_df = processor.transform_deals_to_hubspot_format(opportunities, pd.DataFrame(), pd.DataFrame())
+    assert str(pandas_df['deal_certainty'].dtype) == expected_dtype
+
+
+def test_parity_reports_dtype_drift(processor, monkeypatch):
+    opportunities = make_opportunities(pd.Series([10, 25, 50, 75, 100, 0], dtype='int64'))
+    monkeypatch.setattr(processor, 'integer_number_columns', lambda connection, source: set())
+
+    result = processor.verify_sql_parity(opportunities)
+
+    assert not result['matches']
+    assert result['mismatches']['deal_certainty'] == 'dtype int64 vs float64'
+
+
+def test_complete_owner_column_stays_integer(processor):
+    opportunities = make_opportunities([10, 25, 50, 75, 100, 0])
+    opportunities['Oppo_AssignedUserId'] = [5, 6, 7, 8, 9, 10]
+
+    result = processor.verify_sql_parity(opportunities)
+
+    assert result['matches'], result['mismatches']
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from processors.output_schemas import deals_schema
+
+
+def test_numeric_ids_become_nullable_integers():
+    df = pd.DataFrame({'record_id': ['1', '2', '', None], 'deal_owner': [5.0, 27.0, None, 8.0]})
+
+    prepared = deals_schema.prepare_for_export(df)
+
+    assert str(prepared['record_id'].dtype) == 'Int64'
+    assert prepared['record_id'].tolist()[:2] == [1, 2]
+    assert prepared['record_id'].isna().tolist() == [False, False, True, True]
+    assert str(prepared['deal_owner'].dtype) == 'Int64'
+
+
+def test_non_numeric_ids_keep_original_values():
+    df = pd.DataFrame({'record_id': ['12', 'ABC-7', ''], 'deal_owner': [5.0, 5.5, None]})
+
+    prepared = deals_schema.prepare_for_export(df)
+
+    assert prepared['record_id'].tolist() == ['12', 'ABC-7', '']
+    assert prepared['deal_owner'].tolist()[:2] == [5.0, 5.5]
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from business_logic.profiling_sketches import DataProfiler, HeavyHitters
+
+
+def test_heavy_hitters_ignore_unused_categories():
+    values = pd.Series(pd.Categorical(['Won', 'Won', 'Lost'], categories=['Won', 'Lost', 'Open', 'Closed']))
+
+    hitters = HeavyHitters(capacity=8)
+    hitters.update(values)
+
+    assert hitters.counters == {'Won': 2, 'Lost': 1}
+    assert hitters.max_error == 0
+
+
+def test_for_columns_selects_sketches_by_name():
+    profiler = DataProfiler.for_columns(['Oppo_Forecast', 'deal_amount', 'Oppo_Stage', 'deal_status', 'Oppo_Note'])
+
+    assert profiler.quantile_columns == {'Oppo_Forecast', 'deal_amount'}
+    assert profiler.heavy_hitter_columns == {'Oppo_Stage', 'deal_status'}
+
+
+def test_text_forecast_is_profiled_as_numeric():
+    df = pd.DataFrame({'Oppo_Forecast': ['100', '250.5', None], 'Oppo_Stage': ['Lead', 'Lead', 'Won']})
+
+    profiler = DataProfiler.for_columns(df.columns).update_from_frame(df)
+
+    assert profiler.columns['Oppo_Forecast'].kind == 'numeric'
+    assert profiler.columns['Oppo_Stage'].kind == 'categorical'